@@ -1,8 +1,10 @@
 # Standard library imports
 import os
 import sys
+import json
 import logging
-from typing import Tuple, Optional
+import mimetypes
+from typing import Iterator, Tuple, Optional
 
 # Third-party imports
 import gradio as gr
@@ -13,7 +15,7 @@ from wordcloud import WordCloud, STOPWORDS
 from requests_toolbelt import MultipartEncoder
 
 # Local imports
-from configs.config import API_CONFIG, INTERFACE_CONFIG
+from configs.config import API_CONFIG, APP_CONFIG, INTERFACE_CONFIG
 from utils.constants import ERROR_MESSAGES, CUSTOM_STOPWORDS, MODEL_CHOICES
 from utils.logging_config import configure_logging
 from src.services.parser.exceptions import ResumeParsingError
@@ -59,8 +61,8 @@ class ResumeParser:
 
             with gr.Row():
                 file_upload = gr.File(
-                    file_types=[".pdf"],
-                    label="Upload PDF",
+                    file_types=APP_CONFIG["SUPPORTED_EXTENSIONS"],
+                    label="Upload Resume",
                     elem_id="upload_box",
                     file_count="multiple",
                     scale=1, 
@@ -105,6 +107,8 @@ class ResumeParser:
                 )
             with gr.Row():
                 parse_output_area = gr.HTML(label="Parsing Output")
+            # id of the last parse, used to look up its text and sections
+            parse_id_state = gr.State("")
             with gr.Row():
                 issue_output_area = gr.HTML(label="Analysis Output")
 
@@ -123,6 +127,7 @@ class ResumeParser:
                 parse_output_area,
                 alert_output,
                 issue_output_area,
+                parse_id_state,
             )
 
         return demo
@@ -186,92 +191,106 @@ class ResumeParser:
             logger.error(f"Error in parsing html {e}")
             return None, None
 
-    def process_resume(self, file: gr.File) -> Tuple[Optional[str], ...]:
-        """Processes the uploaded resume file."""
+    def process_resume(self, file: gr.File) -> Iterator[Tuple[Optional[str], ...]]:
+        """
+        Processes the uploaded resume file.
+
+        Reads the streaming parse endpoint and shows the summary table as it
+        grows with every extracted section, then the final result.
+        """
         try:
             self.loading_indicator.visible = True  # Show loading before processing
             if file is None:
-                return self._create_error_response(
+                yield self._create_error_response(
                     ERROR_MESSAGES["FILE_UPLOAD_REQUIRED"]
                 )
+                return
 
             # validate if multiple files are being uploaded, alert with an output
             if len(file) > 1:
-                return self._create_error_response(ERROR_MESSAGES["MULTIPLE_FILES"])
+                yield self._create_error_response(ERROR_MESSAGES["MULTIPLE_FILES"])
+                return
 
             if not self.model_choosen:
-                return self._create_error_response(
+                yield self._create_error_response(
                     ERROR_MESSAGES["MODEL_SELECTION_ERROR"]
                 )
+                return
 
             # Create MultipartEncoder for proper multipart/form-data formatting
             try:
                 m = MultipartEncoder(
                     fields={
                         "file": (
-                            "resume.pdf",
+                            os.path.basename(file[0].name),
                             open(file[0].name, "rb"),
-                            "application/pdf",
+                            mimetypes.guess_type(file[0].name)[0]
+                            or "application/octet-stream",
                         ),
                         "model": str(self.model_choosen),
                     }
                 )
             except Exception as e:
                 logger.error(f"File encoding error: {e}")
-                return self._create_error_response(
+                yield self._create_error_response(
                     ERROR_MESSAGES["MULTIPART_ENCODING_ERROR"]
                 )
-
-            try:
-                response = requests.post(
-                    API_CONFIG["PARSE_URL"],
-                    data=m,
-                    headers={"Content-Type": m.content_type},
-                    timeout=660,
-                )
-                response.raise_for_status()
+                return
+
+            # the timeout bounds the wait for each event, not the whole parse
+            with requests.post(
+                API_CONFIG["PARSE_STREAM_URL"],
+                data=m,
+                headers={"Content-Type": m.content_type},
+                stream=True,
+                timeout=660,
+            ) as response:
                 if not response.ok:
-                    error_data = response.json()
-                    error_detail = error_data.get("detail", "")
-                    if "Only PDF files are supported" in error_detail:
-                        return self._create_error_response(ERROR_MESSAGES["PDF_ONLY"])
-                    elif "Failed to process resume file" in error_detail:
-                        return self._create_error_response(
-                            ERROR_MESSAGES["FILE_READ_ERROR"]
+                    # upload and extraction errors come before the stream starts
+                    self.loading_indicator.visible = False
+                    error_detail = response.json().get("detail", response.reason)
+                    yield self._create_error_response(self._error_message(error_detail))
+                    return
+                result_table, issue_table = None, None
+                for line in response.iter_lines():
+                    if not line:
+                        continue
+                    event = json.loads(line)
+
+                    if event["event"] == "section" and event.get("result_table"):
+                        result_table = event["result_table"]
+                        yield self._create_partial_response(result_table, issue_table)
+                    elif event["event"] == "issues":
+                        issue_table = event["issue_table"]
+                        yield self._create_partial_response(result_table, issue_table)
+                    elif event["event"] == "error":
+                        self.loading_indicator.visible = False
+                        yield self._create_error_response(
+                            self._error_message(event.get("detail", ""))
                         )
-                    elif "Empty text extracted" in error_detail:
-                        return self._create_error_response(ERROR_MESSAGES["EMPTY_TEXT"])
-                    elif "Failed to parse resume content" in error_detail:
-                        return self._create_error_response(
-                            ERROR_MESSAGES["PARSE_ERROR"]
-                        )
-                    else:
-                        return self._create_error_response(
-                            f"{ERROR_MESSAGES['API_ERROR']}: {error_detail}"
-                        )
-            except requests.Timeout:
-                return self._create_error_response(
-                    ERROR_MESSAGES["API_TIMEOUT_ERROR"].format(str(5))
-                )
-            except requests.RequestException as e:
-                error_detail = response.json().get("detail", str(e))
-                return self._create_error_response(
-                    f"{ERROR_MESSAGES['API_ERROR']}: {error_detail}"
-                )
+                        return
+                    elif event["event"] == "done":
+                        result = event
+                        break
+                else:
+                    # the stream ended without a result
+                    self.loading_indicator.visible = False
+                    yield self._create_error_response(ERROR_MESSAGES["EMPTY_TEXT"])
+                    return
 
-            result = response.json()
             if not result.get("result_table"):
-                return self._create_error_response(ERROR_MESSAGES["EMPTY_TEXT"])
+                yield self._create_error_response(ERROR_MESSAGES["EMPTY_TEXT"])
+                return
 
             logger.info(f'\n HTML RESULT SUMMARY - {result.get("result_table")}')
             logger.info(f'\n HTML RESULT ISSUES - {result.get("issue_table")}')
 
             self.loading_indicator.visible = False  # Hide loading after processing
-            return self._create_success_response(result)
+            yield self._create_success_response(result)
 
         except requests.Timeout:
             self.loading_indicator.visible = False
-            return self._create_error_response(
+            yield self._create_error_response(
                 ERROR_MESSAGES["API_TIMEOUT_ERROR"].format(str(5))
             )
 
@@ -279,36 +298,47 @@ class ResumeParser:
             self.loading_indicator.visible = False
             if isinstance(e.response, requests.Response):
                 error_detail = e.response.json().get("detail", str(e))
-                return self._create_error_response(
-                    f"{ERROR_MESSAGES['API_ERROR']}: {error_detail}"
-                )
-            return self._create_error_response(ERROR_MESSAGES["API_ERROR"])
+                yield self._create_error_response(self._error_message(error_detail))
+                return
+            yield self._create_error_response(ERROR_MESSAGES["API_ERROR"])
 
         except ResumeParsingError as rpe:
             self.loading_indicator.visible = False
             logger.error(f"Resume parsing error: {rpe.message}")
-            return self._create_error_response(
+            yield self._create_error_response(
                 f"{ERROR_MESSAGES['PARSE_ERROR']}: {rpe.message}"
             )
         except Exception as e:
             self.loading_indicator.visible = False
             logger.error(f"Unexpected error: {e}")
-            return self._create_error_response(ERROR_MESSAGES["UNEXPECTED_ERROR"])
+            yield self._create_error_response(ERROR_MESSAGES["UNEXPECTED_ERROR"])
+
+    @staticmethod
+    def _error_message(error_detail: str) -> str:
+        """Maps the error detail of the parse endpoint to the message shown."""
+        if "Unsupported file type" in error_detail:
+            return error_detail
+        elif "Failed to process resume file" in error_detail:
+            return ERROR_MESSAGES["FILE_READ_ERROR"]
+        elif "Empty text extracted" in error_detail:
+            return ERROR_MESSAGES["EMPTY_TEXT"]
+        elif "Failed to parse resume content" in error_detail:
+            return ERROR_MESSAGES["PARSE_ERROR"]
+        return f"{ERROR_MESSAGES['API_ERROR']}: {error_detail}"
 
     def generate_wordcloud(
-        self,
-        num_words: int,
-        temp_folder: str = "temp_uploads",
-        filename: str = "raw_text.txt",
+        self, num_words: int, parse_id: str
     ) -> Tuple[Optional[plt.Figure], str]:
         """Generates wordcloud and keyword summary."""
         try:
-            file_path = os.path.join(temp_folder, filename)
-            if not os.path.exists(file_path):
-                raise FileNotFoundError(f"Text file not found: {file_path}")
+            if not parse_id:
+                raise ValueError("No parsed resume available for wordcloud")
 
-            with open(file_path, "r", encoding="utf-8") as file:
-                text = file.read()
+            response = requests.get(
+                API_CONFIG["WORKSPACE_URL"].format(parse_id), timeout=30
+            )
+            response.raise_for_status()
+            text = response.json().get("text", "")
 
             stopwords = set(STOPWORDS)
             stopwords.update(CUSTOM_STOPWORDS)
@@ -346,7 +376,7 @@ class ResumeParser:
             return None, ERROR_MESSAGES["WORDCLOUD_ERROR"]
 
     def generate_questions(
-        self, parse_output_area: str, skill: str, num_questions: int
+        self, parse_output_area: str, skill: str, num_questions: int, parse_id: str
     ) -> str:
         """
         Generates interview questions based on parsed resume data.
@@ -354,6 +384,7 @@ class ResumeParser:
         Args:
             parse_html_table (str): HTML table containing parsed resume data
             num_questions (int): Number of questions to generate
+            parse_id (str): ID of the parse whose sections hold the skills
 
         Returns:
             str: Generated interview questions or error message
@@ -372,6 +403,7 @@ class ResumeParser:
                 "adhoc_skill": skill,
                 "num_questions": num_questions,
                 "yoe": yoe,
+                "parse_id": parse_id or None,
             }
 
             # Send request to API
@@ -397,6 +429,20 @@ class ResumeParser:
             gr.update(value=error_message, visible=True),
             gr.update(interactive=False),
             gr.update(interactive=False),
+            "",
+        )
+
+    def _create_partial_response(
+        self, result_table: Optional[str], issue_table: Optional[str]
+    ) -> Tuple:
+        # buttons stay disabled until the parse is stored and has a parse_id
+        return (
+            result_table,
+            issue_table,
+            gr.update(visible=False, value=""),
+            gr.update(interactive=False),
+            gr.update(interactive=False),
+            "",
         )
 
     def _create_success_response(self, result: dict) -> Tuple:
@@ -406,6 +452,7 @@ class ResumeParser:
             gr.update(visible=False, value=""),
             gr.update(interactive=True),
             gr.update(interactive=True),
+            result.get("parse_id", ""),
         )
 
     def _setup_event_handlers(
@@ -414,6 +461,7 @@ class ResumeParser:
         parse_output_area,
         alert_output,
         issue_output_area,
+        parse_id_state,
     ):
         """Sets up all event handlers for the Gradio interface components."""
 
@@ -429,6 +477,7 @@ class ResumeParser:
                 alert_output,
                 self.questions_button,
                 self.wc_button,
+                parse_id_state,
             ],
             show_progress='minimal'
         ).then(
@@ -438,12 +487,17 @@ class ResumeParser:
 
         self.wc_button.click(
             fn=self.generate_wordcloud,
-            inputs=self.num_words,
+            inputs=[self.num_words, parse_id_state],
             outputs=[self.wordcloud_output, self.wordcloud_summary],
         )
 
         self.questions_button.click(
             fn=self.generate_questions,
-            inputs=[parse_output_area, self.skill_name, self.num_questions],
+            inputs=[
+                parse_output_area,
+                self.skill_name,
+                self.num_questions,
+                parse_id_state,
+            ],
             outputs=self.questions_output,
         )
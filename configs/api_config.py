@@ -1,4 +1,6 @@
 API_CONFIG = {
     "PARSE_URL": "http://127.0.0.1:8000/api/v1/parse",
+    "PARSE_STREAM_URL": "http://127.0.0.1:8000/api/v1/parse/stream",
     "QUESTIONS_URL": "http://127.0.0.1:8000/api/v1/questions",
+    "WORKSPACE_URL": "http://127.0.0.1:8000/api/v1/workspace/{}",
 }
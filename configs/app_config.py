@@ -1,3 +1,5 @@
+import os
+
 import gradio as gr
 
 INTERFACE_CONFIG = {
@@ -11,7 +13,51 @@ INTERFACE_CONFIG = {
 # Application settings
 APP_CONFIG = {
     "TEMP_DIR": "temp_uploads",
+    # persistent caches, kept outside TEMP_DIR so the janitor leaves them alone
+    "CACHE_DIR": "cache",
     "OUTPUT_TYPE": "html",
     "HOST": "127.0.0.1",
     "PORT": 8000,
+    "MAX_UPLOAD_BYTES": 10 * 1024 * 1024,  # 10MB
+    "UPLOAD_CHUNK_SIZE": 1024 * 1024,  # 1MB
+    # accepted upload extensions, the reader sniffs the actual format
+    "SUPPORTED_EXTENSIONS": [".pdf", ".docx", ".html", ".htm", ".txt"],
+    # uncompressed size cap of a DOCX document part, guards against zip bombs
+    "DOCX_MAX_XML_BYTES": 50 * 1024 * 1024,  # 50MB
+    # parse uploads from memory, no files are written (read-only filesystems)
+    "IN_MEMORY_PARSING": False,
+    # born-digital PDFs skip Docling and use the PyMuPDF markdown fast path
+    "READER_FAST_PATH": True,
+    "FAST_PATH_MIN_CHARS_PER_PAGE": 200,
+    "DOCLING_SEC_PER_PAGE_ESTIMATE": 2.0,
+    # Docling pipeline profiles (PdfPipelineOptions fields), selectable per request
+    "CONVERTER_PROFILES": {
+        "fast": {"do_ocr": False, "do_table_structure": False},
+        "accurate": {"do_ocr": True, "do_table_structure": True},
+    },
+    # Docling only sees PDFs the fast path rejected, often scans that need OCR
+    "DEFAULT_CONVERTER_PROFILE": "accurate",
+    "CONVERTER_POOL_SIZE": 1,
+    # PDFs with at least this many pages are converted in parallel page
+    # ranges by worker processes (0 disables), the Docling workers when isolated
+    "PAGE_PARALLEL_THRESHOLD": 6,
+    "PAGE_PARALLEL_CHUNK_PAGES": 2,
+    "PAGE_PARALLEL_WORKERS": max((os.cpu_count() or 2) // 2, 1),
+    # Docling runs in supervised worker processes, killed and replaced when a
+    # conversion exceeds the timeout or memory limit (False converts in-process)
+    "DOCLING_ISOLATION": True,
+    "DOCLING_WORKERS": max((os.cpu_count() or 2) // 2, 1),
+    "DOCLING_JOB_TIMEOUT_SECONDS": 120,
+    "DOCLING_WORKER_MAX_RSS_BYTES": 4 * 1024 * 1024 * 1024,  # 4GB
+    "DOCLING_WORKER_MAX_JOBS": 50,
+    # SQLite cache of extracted text keyed by PDF digest and reader profile
+    "TEXT_CACHE_ENABLED": True,
+    "TEXT_CACHE_MAX_BYTES": 256 * 1024 * 1024,  # 256MB
+    # parse workspaces kept in memory for word cloud and questions
+    "WORKSPACE_MAX_ENTRIES": 256,
+    "WORKSPACE_TTL_SECONDS": 3600,
+    # temp storage janitor, evicts by age and then by total size (LRU)
+    "TEMP_TTL_SECONDS": 24 * 3600,
+    "TEMP_MAX_BYTES": 1024 * 1024 * 1024,  # 1GB
+    "JANITOR_INTERVAL_SECONDS": 300,
 }
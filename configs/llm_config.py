@@ -13,4 +13,100 @@ LLM_CONFIG = {
     "BASE_URL": "http://localhost:1234/v1",
     "API_KEY": "lm-studio",
     "TEMPERATURE": 0.15,
+    # shared HTTP connection pool and timeouts of the async LLM client
+    "MAX_CONNECTIONS": 16,
+    "MAX_KEEPALIVE_CONNECTIONS": 8,
+    "CONNECT_TIMEOUT_SECONDS": 5,
+    "REQUEST_TIMEOUT_SECONDS": 300,
+    # per-call timeouts by task, local models answer spell checks faster
+    "TASK_TIMEOUTS": {"sections": 300, "spell_check": 180, "questions": 180},
+    # completions cached in memory and in APP_CONFIG["CACHE_DIR"], keyed by
+    # all request inputs and the prompt version
+    "RESPONSE_CACHE_ENABLED": True,
+    "RESPONSE_CACHE_MEMORY_ENTRIES": 512,
+    "RESPONSE_CACHE_MAX_BYTES": 64 * 1024 * 1024,  # 64MB
+    "RESPONSE_CACHE_TTL_SECONDS": 7 * 24 * 3600,
+    # resume text sent to the LLM is compacted to this many estimated tokens,
+    # leaving room for the prompts and the JSON answer in the context window
+    "COMPACTION_ENABLED": True,
+    "RESUME_TOKEN_BUDGET": 6000,
+    "RESUME_TOKEN_BUDGETS": {
+        "hermes-3-llama-3.2-3b": 3000,
+        "llama-3.2-3b-instruct": 3000,
+    },
+    # section and spell-check calls request output constrained to a JSON
+    # schema, turn off for backends without response_format json_schema
+    "STRUCTURED_OUTPUT": True,
+    # max_tokens per task: the tokens of the answer's JSON skeleton, plus a
+    # share of the input tokens and an allowance per requested item, kept
+    # between min and max
+    "OUTPUT_TOKEN_BUDGETS": {
+        "sections": {"min": 512, "per_input_token": 1.0, "max": 6144},
+        "spell_check": {"min": 128, "per_input_token": 0.25, "max": 1024},
+        "questions": {"min": 64, "per_item": 80, "max": 1024},
+    },
+    # model tiers from cheapest to most capable, tasks are routed to the
+    # first model of their tier that fits the input and meets the latency
+    # SLO, then to larger tiers and finally to the model the user selected.
+    # Tasks mapped to None always use the selected model.
+    "MODEL_ROUTING_ENABLED": True,
+    "MODEL_TIERS": {
+        "small": ["hermes-3-llama-3.2-3b", "llama-3.2-3b-instruct"],
+        "medium": [
+            "hermes-3-llama-3.1-8b",
+            "granite-3.1-8b-instruct",
+            "mistral-nemo-instruct-2407",
+        ],
+        "large": ["qwen2.5-14b-instruct"],
+    },
+    "TASK_TIERS": {"sections": None, "spell_check": "small", "questions": "small"},
+    # p95 latency per task above which a model is skipped for a cooldown,
+    # judged over the last LATENCY_WINDOW requests once MIN_SAMPLES are seen
+    "TASK_LATENCY_SLO_SECONDS": {"sections": 120, "spell_check": 30, "questions": 30},
+    "LATENCY_WINDOW": 50,
+    "LATENCY_MIN_SAMPLES": 5,
+    "SLO_BREACH_COOLDOWN_SECONDS": 300,
+    # in-flight requests per backend and model adapt between min and max:
+    # +1/limit per fast answer, *SLOW_BACKOFF when an answer takes over
+    # LATENCY_TOLERANCE times the task's usual latency, *ERROR_BACKOFF on
+    # timeouts, connection and server errors
+    "CONCURRENCY_INITIAL_LIMIT": 4,
+    "CONCURRENCY_MIN_LIMIT": 1,
+    "CONCURRENCY_MAX_LIMIT": 16,
+    "LATENCY_TOLERANCE": 2.0,
+    "SLOW_BACKOFF": 0.9,
+    "ERROR_BACKOFF": 0.5,
+    # a backend failing this many calls in a row is not called for
+    # BREAKER_RESET_SECONDS, then a single probe call decides
+    "BREAKER_FAILURE_THRESHOLD": 5,
+    "BREAKER_RESET_SECONDS": 30,
+    # retries stop once less than the longest wait plus MIN_ATTEMPT_SECONDS
+    # remain before the task's timeout
+    "RETRY_ATTEMPTS": 3,
+    "RETRY_MAX_WAIT_SECONDS": 8,
+    "MIN_ATTEMPT_SECONDS": 10,
+    # OpenAI-compatible endpoints to spread calls over, each a dict with
+    # "base_url", "api_key" and optionally "models" it is limited to, e.g.
+    # {"base_url": "http://gpu-2:1234/v1", "api_key": "lm-studio",
+    #  "models": ["qwen2.5-14b-instruct"]}. Empty uses BASE_URL and API_KEY.
+    "BACKENDS": [],
+    # endpoints are health-checked on /v1/models, a model stays on its
+    # endpoint unless that has STICKY_SLACK more requests than the least
+    # loaded one
+    "HEALTH_CHECK_INTERVAL_SECONDS": 15,
+    "HEALTH_CHECK_TIMEOUT_SECONDS": 5,
+    "STICKY_SLACK": 2,
+    # a routed call still running after its model's p95 latency for the task
+    # is duplicated on another endpoint, the first answer wins and the other
+    # call is cancelled; hedges are capped to this share of calls
+    "HEDGING_ENABLED": False,
+    "HEDGE_BUDGET_PERCENT": 5,
+    # models kept loaded on their endpoint: preloaded at startup and pinged
+    # with one-token completions every KEEPALIVE_INTERVAL_SECONDS so the
+    # server's idle unloading does not evict them; by default the model
+    # used when none is selected and the small tier serving light tasks
+    "RESIDENCY_ENABLED": True,
+    "WARM_MODELS": ["hermes-3-llama-3.1-8b", "hermes-3-llama-3.2-3b"],
+    "KEEPALIVE_INTERVAL_SECONDS": 240,
+    "MODEL_LOAD_TIMEOUT_SECONDS": 300,
 }
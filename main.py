@@ -1,23 +1,56 @@
 # Standard library imports
+import asyncio
+import contextlib
 import uvicorn
 import gradio as gr
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
 # Local imports
-from src.api.endpoints.parser import router as resume_router
+from src.api.endpoints.parser import router as resume_router, parser_service
+from src.api.endpoints.metrics import router as metrics_router
+from src.api.middleware import UploadLimitMiddleware
+from src.services.storage_janitor import TempStorageJanitor
+from models.base_config import (
+    close_http_client,
+    get_backend_pool,
+    get_model_residency,
+)
 from configs.config import APP_CONFIG
+from utils.metrics import register_metrics
 from app import ResumeParser
 
 # get constants
 HOST = APP_CONFIG["HOST"]
 PORT = APP_CONFIG["PORT"]
 
+# background cleanup of the temp upload directory
+janitor = TempStorageJanitor.from_config()
+register_metrics("temp_storage", janitor.metrics)
+
+
+@contextlib.asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Starts background tasks with the app and stops them on shutdown."""
+    parser_service.resume_reader.start()
+    janitor_task = asyncio.create_task(janitor.run())
+    health_check_task = asyncio.create_task(get_backend_pool().run())
+    residency_task = asyncio.create_task(get_model_residency().run())
+    yield
+    for task in (janitor_task, health_check_task, residency_task):
+        task.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await task
+    parser_service.resume_reader.shutdown()
+    await close_http_client()
+
+
 # create the fastapi app
 app = FastAPI(
     title="Resume Parser",
     description="Advanced Resume Parsing API with LLM capabilities",
     version="1.0.0",
+    lifespan=lifespan,
 )
 
 # CORS Configuration
@@ -28,9 +61,12 @@ app.add_middleware(
     allow_methods=["*"],
     allow_headers=["*"],
 )
+# reject oversized uploads before FastAPI reads the multipart form
+app.add_middleware(UploadLimitMiddleware)
 
 # Include routers
 app.include_router(resume_router, prefix="/api/v1")
+app.include_router(metrics_router, prefix="/api/v1")
 
 # Create and mount Gradio interface
 parser = ResumeParser()
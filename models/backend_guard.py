@@ -0,0 +1,331 @@
+# standard library imports
+import time
+import asyncio
+import logging
+import threading
+from collections import deque
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Deque, Dict, Optional, Tuple
+
+# third party imports
+import httpx
+import openai
+
+# local imports
+from utils.logging_config import configure_logging
+from utils.metrics import register_metrics
+from configs.config import LLM_CONFIG
+
+configure_logging()
+logger = logging.getLogger(__name__)
+
+# errors that mean the backend is down or overloaded, not that the request
+# was wrong, these shrink the concurrency limit, trip the breaker and are
+# retried
+BACKEND_ERRORS = (
+    openai.APIConnectionError,
+    openai.InternalServerError,
+    openai.RateLimitError,
+    httpx.TransportError,
+    asyncio.TimeoutError,
+)
+
+# limiters by (backend, model) and breakers by backend, shared process-wide
+_limiters: Dict[Tuple[str, str], "AdaptiveLimiter"] = {}
+_breakers: Dict[str, "CircuitBreaker"] = {}
+_LOCK = threading.Lock()
+
+
+class LLMBackendUnavailable(Exception):
+    """Raised without calling the backend when it is down or saturated."""
+
+
+def is_backend_error(error: BaseException) -> bool:
+    """Tells whether an error points at the backend rather than the request."""
+    return isinstance(error, BACKEND_ERRORS)
+
+
+class AdaptiveLimiter:
+    """
+    Limits in-flight requests with an AIMD limit driven by latency.
+
+    Each answer within ``tolerance`` times the moving average latency of its
+    task raises the limit by 1/limit, about one per limit's worth of answers.
+    Slower answers shrink it by ``slow_backoff`` and backend errors by
+    ``error_backoff``, so an overloaded server sees fewer concurrent calls.
+    """
+
+    def __init__(
+        self,
+        initial_limit: int,
+        min_limit: int,
+        max_limit: int,
+        tolerance: float = 2.0,
+        slow_backoff: float = 0.9,
+        error_backoff: float = 0.5,
+    ):
+        self.limit = float(initial_limit)
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.tolerance = tolerance
+        self.slow_backoff = slow_backoff
+        self.error_backoff = error_backoff
+        self.in_flight = 0
+        self._waiters: Deque[asyncio.Future] = deque()
+        self._latencies: Dict[str, float] = {}
+        self._counters = {"rejected": 0, "slow": 0, "errors": 0}
+
+    @classmethod
+    def from_config(cls) -> "AdaptiveLimiter":
+        """Create limiter from LLM settings"""
+        return cls(
+            initial_limit=LLM_CONFIG["CONCURRENCY_INITIAL_LIMIT"],
+            min_limit=LLM_CONFIG["CONCURRENCY_MIN_LIMIT"],
+            max_limit=LLM_CONFIG["CONCURRENCY_MAX_LIMIT"],
+            tolerance=LLM_CONFIG["LATENCY_TOLERANCE"],
+            slow_backoff=LLM_CONFIG["SLOW_BACKOFF"],
+            error_backoff=LLM_CONFIG["ERROR_BACKOFF"],
+        )
+
+    async def acquire(self, timeout: float) -> None:
+        """
+        Waits for a free slot.
+
+        Args:
+            timeout (float): Seconds to wait at most
+
+        Raises:
+            LLMBackendUnavailable: If no slot frees up in time
+        """
+        if not self._waiters and self.in_flight < int(self.limit):
+            self.in_flight += 1
+            return
+
+        waiter = asyncio.get_running_loop().create_future()
+        self._waiters.append(waiter)
+        try:
+            await asyncio.wait_for(waiter, max(timeout, 0.0))
+        except BaseException as e:
+            if waiter.done() and not waiter.cancelled():
+                # the slot was granted as the wait ended, pass it on
+                self.in_flight -= 1
+                self._wake()
+            elif waiter in self._waiters:
+                self._waiters.remove(waiter)
+            if isinstance(e, asyncio.TimeoutError):
+                self._counters["rejected"] += 1
+                raise LLMBackendUnavailable(
+                    f"No LLM request slot freed up within {timeout:.0f}s"
+                ) from None
+            raise
+
+    def release(
+        self, task: str, seconds: Optional[float] = None, failed: bool = False
+    ) -> None:
+        """
+        Frees a slot and adapts the limit.
+
+        Args:
+            task (str): Task of the finished call, latencies are compared per task
+            seconds (Optional[float]): Latency of a successful call
+            failed (bool): Whether the call failed with a backend error
+        """
+        self.in_flight -= 1
+        if failed:
+            self._counters["errors"] += 1
+            self.limit = max(self.min_limit, self.limit * self.error_backoff)
+        elif seconds is not None:
+            average = self._latencies.get(task)
+            if average is not None and seconds > average * self.tolerance:
+                self._counters["slow"] += 1
+                self.limit = max(self.min_limit, self.limit * self.slow_backoff)
+            else:
+                self.limit = min(self.max_limit, self.limit + 1 / self.limit)
+            self._latencies[task] = (
+                seconds if average is None else 0.9 * average + 0.1 * seconds
+            )
+        self._wake()
+
+    def _wake(self) -> None:
+        """Hands free slots to waiting callers in arrival order."""
+        while self._waiters and self.in_flight < int(self.limit):
+            waiter = self._waiters.popleft()
+            if not waiter.done():
+                self.in_flight += 1
+                waiter.set_result(None)
+
+    def metrics(self) -> Dict[str, Any]:
+        """Returns the current limit, occupancy and adjustment counters."""
+        return {
+            "limit": round(self.limit, 2),
+            "in_flight": self.in_flight,
+            "waiting": len(self._waiters),
+            "average_latency_seconds": {
+                task: round(seconds, 3) for task, seconds in self._latencies.items()
+            },
+            **self._counters,
+        }
+
+
+class CircuitBreaker:
+    """
+    Stops calls to a backend after consecutive failures.
+
+    After ``failure_threshold`` backend errors in a row the breaker opens
+    and calls fail fast. Once ``reset_seconds`` have passed a single probe
+    call is let through, closing the breaker again if it succeeds.
+    """
+
+    def __init__(self, failure_threshold: int, reset_seconds: float):
+        self.failure_threshold = failure_threshold
+        self.reset_seconds = reset_seconds
+        self.state = "closed"
+        self.failures = 0
+        self._opened_at = 0.0
+        self._probing = False
+        self._counters = {"opened": 0, "rejected": 0}
+
+    @classmethod
+    def from_config(cls) -> "CircuitBreaker":
+        """Create breaker from LLM settings"""
+        return cls(
+            failure_threshold=LLM_CONFIG["BREAKER_FAILURE_THRESHOLD"],
+            reset_seconds=LLM_CONFIG["BREAKER_RESET_SECONDS"],
+        )
+
+    def check(self, backend: str) -> None:
+        """
+        Lets a call through or fails it fast.
+
+        Args:
+            backend (str): Backend name used in the error message
+
+        Raises:
+            LLMBackendUnavailable: If the breaker is open or a probe is running
+        """
+        if self.state == "open":
+            if time.monotonic() - self._opened_at < self.reset_seconds:
+                self._counters["rejected"] += 1
+                raise LLMBackendUnavailable(f"LLM backend {backend} is unavailable")
+            self.state = "half_open"
+
+        if self.state == "half_open":
+            if self._probing:
+                self._counters["rejected"] += 1
+                raise LLMBackendUnavailable(f"LLM backend {backend} is recovering")
+            self._probing = True
+
+    def is_available(self) -> bool:
+        """Tells whether ``check`` would let a call through right now."""
+        if self.state == "open":
+            return time.monotonic() - self._opened_at >= self.reset_seconds
+        return not (self.state == "half_open" and self._probing)
+
+    def record_success(self) -> None:
+        """Closes the breaker after a call reached the backend."""
+        if self.state != "closed":
+            logger.info("LLM backend recovered, closing circuit breaker")
+        self.state = "closed"
+        self.failures = 0
+        self._probing = False
+
+    def record_failure(self) -> None:
+        """Counts a backend error, opening the breaker at the threshold."""
+        self.failures += 1
+        if self.state == "half_open" or self.failures >= self.failure_threshold:
+            if self.state != "open":
+                logger.warning(
+                    f"Opening circuit breaker after {self.failures} backend errors"
+                )
+                self._counters["opened"] += 1
+            self.state = "open"
+            self._opened_at = time.monotonic()
+        self._probing = False
+
+    def abandon(self) -> None:
+        """Forgets a call that was cancelled before it had an outcome."""
+        self._probing = False
+
+    def metrics(self) -> Dict[str, Any]:
+        """Returns the breaker state and counters."""
+        return {"state": self.state, "failures": self.failures, **self._counters}
+
+
+def get_limiter(backend: str, model: str) -> AdaptiveLimiter:
+    """Returns the process-wide limiter of a backend and model."""
+    with _LOCK:
+        if (backend, model) not in _limiters:
+            _limiters[(backend, model)] = AdaptiveLimiter.from_config()
+        return _limiters[(backend, model)]
+
+
+def get_breaker(backend: str) -> CircuitBreaker:
+    """Returns the process-wide circuit breaker of a backend."""
+    with _LOCK:
+        if backend not in _breakers:
+            _breakers[backend] = CircuitBreaker.from_config()
+        return _breakers[backend]
+
+
+@asynccontextmanager
+async def guarded_call(
+    backend: str, model: str, task: Optional[str], timeout: float
+) -> AsyncIterator[None]:
+    """
+    Wraps one LLM call in the backend's breaker and the model's limiter.
+
+    Args:
+        backend (str): Base URL of the backend
+        model (str): Model the call uses
+        task (Optional[str]): Task of the call, for latency tracking
+        timeout (float): Seconds to wait at most for a free slot
+
+    Raises:
+        LLMBackendUnavailable: If the breaker is open or no slot frees up
+    """
+    breaker = get_breaker(backend)
+    breaker.check(backend)
+    limiter = get_limiter(backend, model)
+    try:
+        await limiter.acquire(timeout)
+    except BaseException:
+        breaker.abandon()
+        raise
+
+    task = task or "default"
+    started = time.monotonic()
+    try:
+        yield
+    except Exception as e:
+        failed = is_backend_error(e)
+        limiter.release(task, failed=failed)
+        if failed:
+            breaker.record_failure()
+        else:
+            breaker.record_success()
+        raise
+    except BaseException:
+        limiter.release(task)
+        breaker.abandon()
+        raise
+    else:
+        limiter.release(task, time.monotonic() - started)
+        breaker.record_success()
+
+
+def backend_metrics() -> Dict[str, Any]:
+    """Returns breaker states by backend and limiter states by model."""
+    with _LOCK:
+        limiters = dict(_limiters)
+        breakers = dict(_breakers)
+
+    snapshot: Dict[str, Any] = {}
+    for backend, breaker in breakers.items():
+        snapshot[backend] = {"breaker": breaker.metrics(), "models": {}}
+    for (backend, model), limiter in limiters.items():
+        entry = snapshot.setdefault(backend, {"models": {}})
+        entry["models"][model] = limiter.metrics()
+    return snapshot
+
+
+register_metrics("llm_backends", backend_metrics)
@@ -0,0 +1,240 @@
+# standard library imports
+import time
+import asyncio
+import logging
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Dict, List, Optional, Set
+
+# third party imports
+import httpx
+from openai import AsyncOpenAI
+
+# local imports
+from utils.logging_config import configure_logging
+from models.backend_guard import LLMBackendUnavailable, get_breaker, is_backend_error
+from configs.config import LLM_CONFIG
+
+configure_logging()
+logger = logging.getLogger(__name__)
+
+
+class Backend:
+    """One OpenAI-compatible inference endpoint and the models it serves."""
+
+    def __init__(
+        self,
+        base_url: str,
+        api_key: str,
+        http_client: httpx.AsyncClient,
+        models: Optional[List[str]] = None,
+    ):
+        self.base_url = base_url.rstrip("/")
+        self.api_key = api_key
+        # models the endpoint is configured for, None for any model
+        self.models: Optional[Set[str]] = set(models) if models else None
+        # models reported by the last health check, None until one succeeds
+        self.available_models: Optional[Set[str]] = None
+        self.healthy = True
+        self.outstanding = 0
+        self.last_check = 0.0
+        self.last_error: Optional[str] = None
+        self.http_client = http_client
+        self.client = AsyncOpenAI(
+            base_url=self.base_url,
+            api_key=api_key,
+            http_client=http_client,
+            # retries are deadline-aware and handled by the LLM client
+            max_retries=0,
+        )
+
+    def serves(self, model: str) -> bool:
+        """Tells whether the endpoint is configured for and reports a model."""
+        if self.models is not None and model not in self.models:
+            return False
+        return self.available_models is None or model in self.available_models
+
+    async def check(self, timeout: float) -> None:
+        """Refreshes health and available models from ``/v1/models``."""
+        try:
+            response = await self.http_client.get(
+                f"{self.base_url}/models",
+                headers={"Authorization": f"Bearer {self.api_key}"},
+                timeout=timeout,
+            )
+            response.raise_for_status()
+            self.available_models = {
+                entry["id"] for entry in response.json().get("data", [])
+            }
+            if not self.healthy:
+                logger.info(f"LLM backend {self.base_url} is healthy again")
+            self.healthy = True
+            self.last_error = None
+        except Exception as e:
+            if self.healthy:
+                logger.warning(f"LLM backend {self.base_url} failed health check: {e}")
+            self.healthy = False
+            self.last_error = str(e)
+        self.last_check = time.time()
+
+
+class BackendPool:
+    """
+    Spreads LLM calls over several inference endpoints.
+
+    Calls for a model go to the healthy endpoint serving it with the fewest
+    outstanding requests. A model sticks to the endpoint it last used, which
+    keeps it loaded there, as long as that endpoint has at most
+    ``sticky_slack`` more outstanding requests than the least loaded one.
+    """
+
+    def __init__(
+        self,
+        backends: List[Backend],
+        check_interval: float = 15.0,
+        check_timeout: float = 5.0,
+        sticky_slack: int = 2,
+    ):
+        if not backends:
+            raise ValueError("At least one LLM backend must be configured")
+        self.backends = backends
+        self.check_interval = check_interval
+        self.check_timeout = check_timeout
+        self.sticky_slack = sticky_slack
+        self._sticky: Dict[str, Backend] = {}
+        self._counters = {"sticky_hits": 0, "rebalanced": 0, "failovers": 0}
+
+    @classmethod
+    def from_config(
+        cls, backends: List[Dict[str, Any]], http_client: httpx.AsyncClient
+    ) -> "BackendPool":
+        """
+        Create pool from LLM settings.
+
+        Args:
+            backends (List[Dict[str, Any]]): Endpoints with ``base_url``,
+                ``api_key`` and optionally the ``models`` they serve
+            http_client (httpx.AsyncClient): Shared connection pool
+
+        Returns:
+            BackendPool: Pool over the endpoints
+        """
+        return cls(
+            backends=[Backend(http_client=http_client, **entry) for entry in backends],
+            check_interval=LLM_CONFIG["HEALTH_CHECK_INTERVAL_SECONDS"],
+            check_timeout=LLM_CONFIG["HEALTH_CHECK_TIMEOUT_SECONDS"],
+            sticky_slack=LLM_CONFIG["STICKY_SLACK"],
+        )
+
+    async def run(self) -> None:
+        """Health-checks every endpoint every ``check_interval`` until cancelled."""
+        logger.info(f"Health checks started for {len(self.backends)} LLM backends")
+        while True:
+            await self.check_all()
+            await asyncio.sleep(self.check_interval)
+
+    async def check_all(self) -> None:
+        """Health-checks all endpoints concurrently."""
+        await asyncio.gather(
+            *(backend.check(self.check_timeout) for backend in self.backends)
+        )
+
+    def serves(self, model: str, exclude: Optional[Set[str]] = None) -> bool:
+        """Tells whether any usable endpoint outside ``exclude`` serves a model."""
+        return bool(self._candidates(model, exclude))
+
+    def select(self, model: str, avoid: Optional[Set[str]] = None) -> Backend:
+        """
+        Picks the endpoint for a call.
+
+        Args:
+            model (str): Model the call uses
+            avoid (Optional[Set[str]]): Base URLs of endpoints to use only
+                when no other endpoint serves the model
+
+        Returns:
+            Backend: Sticky endpoint of the model, or the least loaded one
+
+        Raises:
+            LLMBackendUnavailable: If no healthy endpoint serves the model
+        """
+        candidates = self._candidates(model)
+        if not candidates:
+            raise LLMBackendUnavailable(f"No healthy LLM backend serves {model}")
+        candidates = self._candidates(model, avoid) or candidates
+
+        least = min(candidates, key=lambda backend: backend.outstanding)
+        sticky = self._sticky.get(model)
+        if (
+            sticky in candidates
+            and sticky.outstanding <= least.outstanding + self.sticky_slack
+        ):
+            self._counters["sticky_hits"] += 1
+            return sticky
+
+        if sticky is not None:
+            self._counters["rebalanced"] += 1
+        self._sticky[model] = least
+        return least
+
+    @asynccontextmanager
+    async def lease(
+        self, model: str, tried: Optional[Set[str]] = None
+    ) -> AsyncIterator[Backend]:
+        """
+        Holds an endpoint for the duration of one call.
+
+        A backend error unpins the model, so a retry can move elsewhere.
+
+        Args:
+            model (str): Model the call uses
+            tried (Optional[Set[str]]): Base URLs already used by related
+                calls, avoided when possible; the selected one is added
+
+        Yields:
+            Backend: Selected endpoint
+        """
+        backend = self.select(model, tried)
+        if tried is not None:
+            tried.add(backend.base_url)
+        backend.outstanding += 1
+        try:
+            yield backend
+        except Exception as e:
+            if is_backend_error(e) and self._sticky.get(model) is backend:
+                del self._sticky[model]
+                self._counters["failovers"] += 1
+            raise
+        finally:
+            backend.outstanding -= 1
+
+    def _candidates(
+        self, model: str, exclude: Optional[Set[str]] = None
+    ) -> List[Backend]:
+        """Healthy endpoints serving the model whose breaker lets calls through."""
+        return [
+            backend
+            for backend in self.backends
+            if backend.base_url not in (exclude or ())
+            and backend.healthy
+            and backend.serves(model)
+            and get_breaker(backend.base_url).is_available()
+        ]
+
+    def metrics(self) -> Dict[str, Any]:
+        """Returns health, load and models per endpoint plus routing counters."""
+        return {
+            "backends": {
+                backend.base_url: {
+                    "healthy": backend.healthy,
+                    "outstanding": backend.outstanding,
+                    "models": sorted(backend.available_models or []),
+                    "last_check": backend.last_check,
+                    "last_error": backend.last_error,
+                }
+                for backend in self.backends
+            },
+            "sticky": {
+                model: backend.base_url for model, backend in self._sticky.items()
+            },
+            **self._counters,
+        }
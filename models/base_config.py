@@ -1,22 +1,78 @@
 # standard library imports
 import torch
+import asyncio
+import time
+import functools
 import logging, json
-from dataclasses import dataclass
-from typing import Dict, Any
+import sqlite3
+import threading
+from collections import Counter, deque
+from dataclasses import dataclass, field
+from typing import (
+    Any,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Deque,
+    Dict,
+    List,
+    Optional,
+    Set,
+    Tuple,
+)
 
 # third party imports
-from tenacity import retry, stop_after_attempt, wait_exponential
-from openai import OpenAI
-from json_repair import repair_json
+import httpx
+from tenacity import (
+    AsyncRetrying,
+    retry_if_exception,
+    stop_after_attempt,
+    wait_exponential,
+)
+from tenacity.stop import stop_base
+from openai import AsyncStream, NOT_GIVEN
 
 # local imports
 from utils.logging_config import configure_logging
 from configs.config import LLM_CONFIG
+from models.response_cache import LLMResponseCache
+from models.backend_guard import guarded_call, is_backend_error
+from models.backend_pool import BackendPool
+from models.model_residency import ModelResidencyManager
+from utils.json_stream import IncrementalJSONParser
+from utils.metrics import percentile, register_metrics
+from utils.pre_processing import estimate_tokens
+from utils.structured_output import (
+    decode_json_response,
+    is_json_object,
+    top_level_keys,
+)
 
 
 configure_logging()
 logger = logging.getLogger(__name__)
 
+# connection pool shared by every LLM client of the process
+_http_client: Optional[httpx.AsyncClient] = None
+# completion cache shared by every LLM client of the process
+_response_cache: Optional[LLMResponseCache] = None
+# inference endpoints shared by every LLM client of the process
+_backend_pool: Optional[BackendPool] = None
+# loaded-model tracking and warm set of the backend pool
+_model_residency: Optional[ModelResidencyManager] = None
+# task to model routing shared by every LLM client of the process
+_model_router: Optional["ModelRouter"] = None
+# how generations of every LLM client of the process ended
+_generation_counts = {"requests": 0, "stopped_at_json_end": 0, "hit_max_tokens": 0}
+# hedged calls of every LLM client of the process
+_hedge_counts = {
+    "eligible": 0,
+    "hedged": 0,
+    "hedge_won": 0,
+    "over_budget": 0,
+    "no_alternative": 0,
+}
+
 
 @dataclass
 class LLMConfig:
@@ -25,6 +81,17 @@ class LLMConfig:
     base_url: str
     api_key: str
     temperature: float = 0.1
+    max_connections: int = 16
+    max_keepalive_connections: int = 8
+    connect_timeout: float = 5.0
+    request_timeout: float = 300.0
+    structured_output: bool = True
+    retry_attempts: int = 3
+    retry_max_wait: float = 8.0
+    min_attempt_seconds: float = 10.0
+    backends: List[Dict[str, Any]] = field(default_factory=list)
+    hedging: bool = False
+    hedge_budget_percent: float = 5.0
 
     @classmethod
     def from_env(cls) -> "LLMConfig":
@@ -33,8 +100,338 @@ class LLMConfig:
             base_url=LLM_CONFIG["BASE_URL"],
             api_key=LLM_CONFIG["API_KEY"],
             temperature=LLM_CONFIG["TEMPERATURE"],
+            max_connections=LLM_CONFIG["MAX_CONNECTIONS"],
+            max_keepalive_connections=LLM_CONFIG["MAX_KEEPALIVE_CONNECTIONS"],
+            connect_timeout=LLM_CONFIG["CONNECT_TIMEOUT_SECONDS"],
+            request_timeout=LLM_CONFIG["REQUEST_TIMEOUT_SECONDS"],
+            structured_output=LLM_CONFIG["STRUCTURED_OUTPUT"],
+            retry_attempts=LLM_CONFIG["RETRY_ATTEMPTS"],
+            retry_max_wait=LLM_CONFIG["RETRY_MAX_WAIT_SECONDS"],
+            min_attempt_seconds=LLM_CONFIG["MIN_ATTEMPT_SECONDS"],
+            backends=LLM_CONFIG["BACKENDS"]
+            or [{"base_url": LLM_CONFIG["BASE_URL"], "api_key": LLM_CONFIG["API_KEY"]}],
+            hedging=LLM_CONFIG["HEDGING_ENABLED"],
+            hedge_budget_percent=LLM_CONFIG["HEDGE_BUDGET_PERCENT"],
+        )
+
+
+class stop_at_deadline(stop_base):
+    """Stops retrying once less than ``reserve`` seconds remain before a deadline"""
+
+    def __init__(self, deadline: float, reserve: float):
+        self.deadline = deadline
+        self.reserve = reserve
+
+    def __call__(self, retry_state: Any) -> bool:
+        return time.monotonic() + self.reserve >= self.deadline
+
+
+@dataclass
+class Completion:
+    """Generated text of a chat completion and why generation ended"""
+
+    text: str
+    finish_reason: Optional[str] = None
+
+
+def get_http_client(config: LLMConfig) -> httpx.AsyncClient:
+    """
+    Returns the process-wide HTTP client for LLM requests.
+
+    The client holds a bounded connection pool, so concurrent parses reuse
+    keep-alive connections instead of opening one per request.
+
+    Args:
+        config (LLMConfig): Settings used when the client is first created
+
+    Returns:
+        httpx.AsyncClient: Shared client
+    """
+    global _http_client
+    if _http_client is None or _http_client.is_closed:
+        _http_client = httpx.AsyncClient(
+            limits=httpx.Limits(
+                max_connections=config.max_connections,
+                max_keepalive_connections=config.max_keepalive_connections,
+            ),
+            timeout=httpx.Timeout(
+                config.request_timeout, connect=config.connect_timeout
+            ),
+        )
+    return _http_client
+
+
+async def close_http_client() -> None:
+    """Closes the shared HTTP client and its pooled connections."""
+    global _http_client
+    if _http_client is not None:
+        await _http_client.aclose()
+        _http_client = None
+
+
+def get_backend_pool(config: Optional[LLMConfig] = None) -> BackendPool:
+    """
+    Returns the process-wide pool of inference endpoints.
+
+    Args:
+        config (Optional[LLMConfig]): Settings used when the pool is first
+            created, read from the environment if omitted
+
+    Returns:
+        BackendPool: Shared pool
+    """
+    global _backend_pool
+    if _backend_pool is None:
+        config = config or LLMConfig.from_env()
+        _backend_pool = BackendPool.from_config(
+            config.backends, get_http_client(config)
+        )
+        register_metrics("llm_backend_pool", _backend_pool.metrics)
+    return _backend_pool
+
+
+def get_model_residency() -> ModelResidencyManager:
+    """Returns the process-wide model residency manager of the backend pool."""
+    global _model_residency
+    if _model_residency is None:
+        _model_residency = ModelResidencyManager.from_config(get_backend_pool())
+        register_metrics("model_residency", _model_residency.metrics)
+    return _model_residency
+
+
+def get_response_cache() -> Optional[LLMResponseCache]:
+    """Returns the process-wide completion cache, None if it is disabled."""
+    global _response_cache
+    if _response_cache is None and LLM_CONFIG["RESPONSE_CACHE_ENABLED"]:
+        try:
+            _response_cache = LLMResponseCache.from_config()
+        except (sqlite3.Error, OSError) as e:
+            # e.g. a read-only filesystem, completions then skip the cache
+            logger.warning(f"LLM response cache unavailable: {e}")
+    return _response_cache
+
+
+class ModelRouter:
+    """
+    Picks the model of each LLM call from the task and the input size.
+
+    Every task maps to a tier of ``MODEL_TIERS``. A model qualifies when the
+    input fits its token budget and its observed p95 latency for the task
+    is within the task's SLO. A model breaching the SLO is skipped for a
+    cooldown, after which it is tried again with a fresh latency window.
+    """
+
+    def __init__(
+        self,
+        tiers: Dict[str, List[str]],
+        task_tiers: Dict[str, Optional[str]],
+        latency_slos: Dict[str, float],
+        token_budgets: Dict[str, int],
+        default_token_budget: int,
+        window: int = 50,
+        min_samples: int = 5,
+        cooldown: float = 300.0,
+        enabled: bool = True,
+    ):
+        self.tiers = tiers
+        self.task_tiers = task_tiers
+        self.latency_slos = latency_slos
+        self.token_budgets = token_budgets
+        self.default_token_budget = default_token_budget
+        self.window = window
+        self.min_samples = min_samples
+        self.cooldown = cooldown
+        self.enabled = enabled
+        self._latencies: Dict[Tuple[str, str], Deque[float]] = {}
+        self._breached_until: Dict[Tuple[str, str], float] = {}
+        self._routes: Counter = Counter()
+        self._breaches: Counter = Counter()
+        self._lock = threading.Lock()
+
+        register_metrics("model_router", self.metrics)
+
+    @classmethod
+    def from_config(cls) -> "ModelRouter":
+        """Create router from LLM settings"""
+        return cls(
+            tiers=LLM_CONFIG["MODEL_TIERS"],
+            task_tiers=LLM_CONFIG["TASK_TIERS"],
+            latency_slos=LLM_CONFIG["TASK_LATENCY_SLO_SECONDS"],
+            token_budgets=LLM_CONFIG["RESUME_TOKEN_BUDGETS"],
+            default_token_budget=LLM_CONFIG["RESUME_TOKEN_BUDGET"],
+            window=LLM_CONFIG["LATENCY_WINDOW"],
+            min_samples=LLM_CONFIG["LATENCY_MIN_SAMPLES"],
+            cooldown=LLM_CONFIG["SLO_BREACH_COOLDOWN_SECONDS"],
+            enabled=LLM_CONFIG["MODEL_ROUTING_ENABLED"],
         )
 
+    def candidates(self, task: str, selected: str, content: str) -> List[str]:
+        """
+        Lists the models that may serve a task, in order of preference.
+
+        The selected model comes first when its tier is at or below the
+        task's tier and the input fits its token budget, the other models
+        then only stand in while it breaches the SLO. A selected model of a
+        larger tier, or one the input does not fit, comes last.
+
+        Args:
+            task (str): Task name, a key of ``TASK_TIERS``
+            selected (str): Model the user selected
+            content (str): Input text sent with the prompt
+
+        Returns:
+            List[str]: The selected model and the models of the task's tier
+                up to the selected model's tier that fit the input
+        """
+        tier = self.task_tiers.get(task)
+        if not self.enabled or tier not in self.tiers:
+            return [selected]
+
+        tokens = estimate_tokens(content)
+        names = list(self.tiers)
+        selected_tier = next(
+            (i for i, name in enumerate(names) if selected in self.tiers[name]), None
+        )
+        # never route above the tier of the model the user chose
+        top = len(names) - 1 if selected_tier is None else selected_tier
+        models = []
+        for name in names[names.index(tier) : top + 1]:
+            for model in self.tiers[name]:
+                budget = self.token_budgets.get(model, self.default_token_budget)
+                if model != selected and tokens <= budget:
+                    models.append(model)
+
+        budget = self.token_budgets.get(selected, self.default_token_budget)
+        if (
+            selected_tier is not None
+            and selected_tier <= names.index(tier)
+            and tokens <= budget
+        ):
+            return [selected] + models
+        return models + [selected]
+
+    def route(
+        self,
+        task: str,
+        selected: str,
+        content: str,
+        available: Optional[Callable[[str], bool]] = None,
+    ) -> str:
+        """
+        Returns the model to use for a task.
+
+        Args:
+            task (str): Task name, a key of ``TASK_TIERS``
+            selected (str): Model the user selected
+            content (str): Input text sent with the prompt
+            available (Optional[Callable[[str], bool]]): Tells whether a
+                backend currently serves a model, candidates it rejects are
+                skipped
+
+        Returns:
+            str: First candidate not cooling down after an SLO breach, the
+                selected model if all of them are
+        """
+        now = time.monotonic()
+        model = selected
+        with self._lock:
+            for candidate in self.candidates(task, selected, content):
+                if available is not None and not available(candidate):
+                    continue
+                if self._breached_until.get((candidate, task), 0.0) <= now:
+                    model = candidate
+                    break
+            self._routes[f"{task}:{model}"] += 1
+
+        if model != selected:
+            logger.info(f"Routing {task} from {selected} to {model}")
+        return model
+
+    def record(self, model: str, task: str, seconds: float, ok: bool = True) -> None:
+        """
+        Records the latency of a completion.
+
+        Failed calls are recorded just above the SLO so that a model that
+        keeps failing is routed around like a slow one.
+
+        Args:
+            model (str): Model that served the call
+            task (str): Task of the call
+            seconds (float): Wall time of the call
+            ok (bool): Whether the call succeeded
+        """
+        slo = self.latency_slos.get(task)
+        if slo is None:
+            return
+        if not ok:
+            seconds = max(seconds, slo) + 1.0
+
+        key = (model, task)
+        with self._lock:
+            samples = self._latencies.setdefault(key, deque(maxlen=self.window))
+            samples.append(seconds)
+            if len(samples) < self.min_samples:
+                return
+            p95 = percentile(sorted(samples), 0.95)
+            if p95 > slo:
+                logger.warning(
+                    f"{model} breached the {slo}s latency SLO of {task} "
+                    f"with p95 {p95:.1f}s, skipping it for {self.cooldown}s"
+                )
+                self._breached_until[key] = time.monotonic() + self.cooldown
+                self._breaches[f"{task}:{model}"] += 1
+                samples.clear()
+
+    def p95(self, model: str, task: str) -> Optional[float]:
+        """Returns the observed p95 latency of a model for a task, None if unknown."""
+        with self._lock:
+            samples = self._latencies.get((model, task))
+            if not samples or len(samples) < self.min_samples:
+                return None
+            return percentile(sorted(samples), 0.95)
+
+    def metrics(self) -> Dict[str, Any]:
+        """Returns route counts, SLO breaches and per-model latencies."""
+        now = time.monotonic()
+        with self._lock:
+            latencies = {
+                f"{task}:{model}": {
+                    "samples": len(samples),
+                    "p50_seconds": round(percentile(sorted(samples), 0.5), 3),
+                    "p95_seconds": round(percentile(sorted(samples), 0.95), 3),
+                }
+                for (model, task), samples in self._latencies.items()
+            }
+            cooling_down = [
+                f"{task}:{model}"
+                for (model, task), until in self._breached_until.items()
+                if until > now
+            ]
+            return {
+                "enabled": self.enabled,
+                "routes": dict(self._routes),
+                "slo_breaches": dict(self._breaches),
+                "cooling_down": cooling_down,
+                "latencies": latencies,
+            }
+
+
+def get_model_router() -> ModelRouter:
+    """Returns the process-wide model router."""
+    global _model_router
+    if _model_router is None:
+        _model_router = ModelRouter.from_config()
+    return _model_router
+
+
+def _count_generation(outcome: str) -> None:
+    """Counts a generation outcome for the ``llm_generation`` metrics."""
+    _generation_counts[outcome] += 1
+
+
+register_metrics("llm_generation", lambda: dict(_generation_counts))
+register_metrics("llm_hedging", lambda: dict(_hedge_counts))
+
 
 class GPUManager:
     """Manages GPU-related operations"""
@@ -55,32 +452,422 @@ class GPUManager:
 
 
 class LLMClient:
-    """Client for LLM operations"""
+    """Async client for LLM operations over the shared backend pool"""
 
     def __init__(self, config: LLMConfig):
         self.config = config
-        self.client = OpenAI(base_url=config.base_url, api_key=config.api_key)
+        self.pool = get_backend_pool(config)
+        self.residency = get_model_residency()
+        self.response_cache = get_response_cache()
+        self.router = get_model_router()
         GPUManager.setup_gpu()
 
-    @retry(
-        stop=stop_after_attempt(3),
-        wait=wait_exponential(multiplier=1, min=4, max=10),
-        reraise=True,
-    )
-    def get_completion(
-        self, model_name: str, prompt_text: str, user_prompt: str, content: str
+    async def get_completion(
+        self,
+        model_name: str,
+        prompt_text: str,
+        user_prompt: str,
+        content: str,
+        timeout: Optional[float] = None,
+        response_format: Optional[Dict[str, Any]] = None,
+        max_tokens: Optional[int] = None,
+        stop_at_json_end: bool = False,
+        task: Optional[str] = None,
     ) -> str:
-        """Get completion from LLM"""
+        """Get completion from the response cache or the LLM, routed by task"""
+        json_answer = stop_at_json_end or response_format is not None
+        response_format = self._response_format(response_format)
+        # without a schema a preamble may hold braces, so read the whole answer
+        stop_at_json_end = stop_at_json_end and bool(top_level_keys(response_format))
+        if task is not None:
+            model_name = self.router.route(
+                task, model_name, content, available=self.pool.serves
+            )
+
+        key = None
+        if self.response_cache is not None:
+            key = self.response_cache.make_key(
+                model_name,
+                prompt_text,
+                user_prompt,
+                content,
+                self.config.temperature,
+                response_format=response_format,
+                max_tokens=max_tokens,
+            )
+            cached = await asyncio.to_thread(self.response_cache.get, key)
+            if cached is not None:
+                logger.info(f"Serving cached completion of {model_name}")
+                return cached
+
+        request = functools.partial(
+            self._request_completion,
+            model_name,
+            prompt_text,
+            user_prompt,
+            content,
+            timeout,
+            response_format,
+            max_tokens,
+            stop_at_json_end,
+            task,
+        )
+        started = time.monotonic()
         try:
-            completion = self.client.chat.completions.create(
-                model=model_name,
-                messages=[
-                    {"role": "system", "content": prompt_text},
-                    {"role": "user", "content": user_prompt + content},
-                ],
-                temperature=self.config.temperature,
+            completion = await self._hedged_completion(request, model_name, task)
+        except Exception:
+            self._record_latency(model_name, task, started, ok=False)
+            raise
+        self._record_latency(model_name, task, started)
+
+        if key is not None and self._cacheable(completion, json_answer):
+            await asyncio.to_thread(self.response_cache.put, key, completion.text)
+        return completion.text
+
+    async def stream_completion(
+        self,
+        model_name: str,
+        prompt_text: str,
+        user_prompt: str,
+        content: str,
+        timeout: Optional[float] = None,
+        response_format: Optional[Dict[str, Any]] = None,
+        max_tokens: Optional[int] = None,
+        stop_at_json_end: bool = False,
+        task: Optional[str] = None,
+    ) -> AsyncIterator[str]:
+        """
+        Streams a completion from the LLM as text deltas.
+
+        A cached answer is yielded in one piece, and a completed stream is
+        cached like ``get_completion`` results. Streams are not retried,
+        since part of the answer may already have been consumed.
+
+        Args:
+            model_name (str): Model to use
+            prompt_text (str): System prompt
+            user_prompt (str): User prompt prefix
+            content (str): Content appended to the user prompt
+            timeout (Optional[float]): Request timeout in seconds
+            response_format (Optional[Dict[str, Any]]): JSON schema the answer
+                is constrained to
+            max_tokens (Optional[int]): Cap on the generated tokens
+            stop_at_json_end (bool): Stop once the top-level JSON object closes,
+                only honoured with a JSON schema ``response_format``
+            task (Optional[str]): Task the model is routed by
+
+        Yields:
+            str: Generated text as it arrives
+        """
+        json_answer = stop_at_json_end or response_format is not None
+        response_format = self._response_format(response_format)
+        expected_keys = top_level_keys(response_format)
+        if task is not None:
+            model_name = self.router.route(
+                task, model_name, content, available=self.pool.serves
+            )
+        key = None
+        if self.response_cache is not None:
+            key = self.response_cache.make_key(
+                model_name,
+                prompt_text,
+                user_prompt,
+                content,
+                self.config.temperature,
+                response_format=response_format,
+                max_tokens=max_tokens,
             )
-            return completion.choices[0].message.content
+            cached = await asyncio.to_thread(self.response_cache.get, key)
+            if cached is not None:
+                logger.info(f"Serving cached completion of {model_name}")
+                yield cached
+                return
+
+        parts = []
+        finish_reason = None
+        parser = (
+            IncrementalJSONParser(expected_keys)
+            if stop_at_json_end and expected_keys
+            else None
+        )
+        started = time.monotonic()
+        timeout = timeout or self.config.request_timeout
+        try:
+            async with self.pool.lease(model_name) as backend, guarded_call(
+                backend.base_url, model_name, task, timeout
+            ), self.residency.track(backend, model_name):
+                stream = await backend.client.chat.completions.create(
+                    model=model_name,
+                    messages=self._messages(prompt_text, user_prompt, content),
+                    stream=True,
+                    **self._request_options(
+                        started + timeout - time.monotonic(),
+                        response_format,
+                        max_tokens,
+                    ),
+                )
+                try:
+                    async for chunk in stream:
+                        finish_reason = self._finish_reason(chunk) or finish_reason
+                        delta = self._chunk_text(chunk)
+                        if not delta:
+                            continue
+                        parts.append(delta)
+                        yield delta
+                        if parser is not None and self._json_closed(parser, delta):
+                            break
+                finally:
+                    await stream.close()
+        except Exception as e:
+            logger.error(f"Error in LLM completion stream: {e}")
+            self._record_latency(model_name, task, started, ok=False)
+            raise
+        self._record_latency(model_name, task, started)
+
+        completion = Completion("".join(parts), finish_reason)
+        if key is not None and self._cacheable(completion, json_answer):
+            await asyncio.to_thread(self.response_cache.put, key, completion.text)
+
+    async def _hedged_completion(
+        self,
+        request: Callable[..., Awaitable[Completion]],
+        model_name: str,
+        task: Optional[str],
+    ) -> Completion:
+        """
+        Runs a completion, hedging it on another endpoint when it runs long.
+
+        Once the call has taken longer than the model's p95 latency for the
+        task, a duplicate goes to an endpoint the call is not using, within
+        the hedge budget. The first answer wins and the other call is
+        cancelled, which closes its connection and stops its generation.
+
+        Args:
+            request (Callable[..., Awaitable[Completion]]): Starts the completion,
+                takes the ``tried`` endpoint set as keyword argument
+            model_name (str): Model of the call
+            task (Optional[str]): Task of the call, only routed calls are hedged
+
+        Returns:
+            Completion: Completion of whichever call answered first
+        """
+        delay = self.router.p95(model_name, task) if task is not None else None
+        if not self.config.hedging or delay is None:
+            return await request()
+
+        _hedge_counts["eligible"] += 1
+        tried: Set[str] = set()
+        primary = asyncio.create_task(request(tried=tried))
+        calls = {primary}
+        try:
+            done, _ = await asyncio.wait(calls, timeout=delay)
+            if done:
+                return primary.result()
+
+            budget = self.config.hedge_budget_percent / 100
+            if _hedge_counts["hedged"] >= budget * _hedge_counts["eligible"]:
+                _hedge_counts["over_budget"] += 1
+                return await primary
+            if not self.pool.serves(model_name, exclude=tried):
+                _hedge_counts["no_alternative"] += 1
+                return await primary
+
+            logger.info(f"Hedging {task} on {model_name} after {delay:.1f}s")
+            _hedge_counts["hedged"] += 1
+            hedge = asyncio.create_task(request(tried=tried))
+            calls.add(hedge)
+            error: Optional[BaseException] = None
+            while calls:
+                done, calls = await asyncio.wait(
+                    calls, return_when=asyncio.FIRST_COMPLETED
+                )
+                for call in done:
+                    if call.exception() is None:
+                        if call is hedge:
+                            _hedge_counts["hedge_won"] += 1
+                        return call.result()
+                    if error is None or call is primary:
+                        error = call.exception()
+            raise error
+        finally:
+            for call in calls:
+                call.cancel()
+
+    def _record_latency(
+        self, model_name: str, task: Optional[str], started: float, ok: bool = True
+    ) -> None:
+        """Reports the latency of a routed call to the model router"""
+        if task is not None:
+            self.router.record(model_name, task, time.monotonic() - started, ok)
+
+    async def _read_until_json_end(
+        self, stream: AsyncStream, expected_keys: List[str]
+    ) -> Completion:
+        """
+        Collects a streamed answer up to the close of its top-level object.
+
+        Closing the stream early ends the request, so the server stops
+        generating instead of running on to ``max_tokens``. Only an object
+        holding one of the expected keys counts as the answer.
+
+        Args:
+            stream (AsyncStream): Streamed chat completion
+            expected_keys (List[str]): Top-level keys of the answer's schema
+
+        Returns:
+            Completion: Generated text, without a finish reason if cut short
+        """
+        parts = []
+        finish_reason = None
+        parser = IncrementalJSONParser(expected_keys)
+        try:
+            async for chunk in stream:
+                finish_reason = self._finish_reason(chunk) or finish_reason
+                delta = self._chunk_text(chunk)
+                if not delta:
+                    continue
+                parts.append(delta)
+                if self._json_closed(parser, delta):
+                    break
+        finally:
+            await stream.close()
+        return Completion("".join(parts), finish_reason)
+
+    @staticmethod
+    def _json_closed(parser: IncrementalJSONParser, delta: str) -> bool:
+        """Feeds a delta and reports whether the top-level object has closed"""
+        parser.feed(delta)
+        if parser.done:
+            _count_generation("stopped_at_json_end")
+        return parser.done
+
+    @staticmethod
+    def _chunk_text(chunk: Any) -> Optional[str]:
+        """Returns the text of a streamed chunk, counting length-capped ends"""
+        if not chunk.choices:
+            return None
+        if chunk.choices[0].finish_reason == "length":
+            _count_generation("hit_max_tokens")
+        return chunk.choices[0].delta.content
+
+    @staticmethod
+    def _finish_reason(chunk: Any) -> Optional[str]:
+        """Returns the finish reason of a streamed chunk, None before the end"""
+        return chunk.choices[0].finish_reason if chunk.choices else None
+
+    @staticmethod
+    def _cacheable(completion: Completion, json_answer: bool) -> bool:
+        """
+        Tells whether a completion may be stored in the response cache.
+
+        An answer cut off at ``max_tokens``, or a JSON answer that does not
+        decode to an object, would be served from the cache instead of being
+        generated again.
+        """
+        if not completion.text or completion.finish_reason == "length":
+            return False
+        return not json_answer or is_json_object(completion.text)
+
+    @staticmethod
+    def _messages(
+        prompt_text: str, user_prompt: str, content: str
+    ) -> List[Dict[str, str]]:
+        """Builds the chat messages of a completion"""
+        return [
+            {"role": "system", "content": prompt_text},
+            {"role": "user", "content": user_prompt + content},
+        ]
+
+    def _request_options(
+        self,
+        timeout: Optional[float],
+        response_format: Optional[Dict[str, Any]],
+        max_tokens: Optional[int],
+    ) -> Dict[str, Any]:
+        """Sampling and limit options shared by plain and streamed requests"""
+        _count_generation("requests")
+        return {
+            "temperature": self.config.temperature,
+            "timeout": (
+                self.config.request_timeout if timeout is None else max(timeout, 1.0)
+            ),
+            "response_format": response_format or NOT_GIVEN,
+            "max_tokens": max_tokens or NOT_GIVEN,
+        }
+
+    def _response_format(
+        self, response_format: Optional[Dict[str, Any]]
+    ) -> Optional[Dict[str, Any]]:
+        """Drops the requested response format if structured output is disabled"""
+        return response_format if self.config.structured_output else None
+
+    def _retrying(self, deadline: float) -> AsyncRetrying:
+        """
+        Retry policy of a completion that must finish by ``deadline``.
+
+        Only backend errors are retried, never a call the breaker or the
+        limiter turned away, and no attempt starts without enough time left
+        for the longest wait and a useful attempt.
+        """
+        reserve = self.config.retry_max_wait + self.config.min_attempt_seconds
+        return AsyncRetrying(
+            stop=stop_after_attempt(self.config.retry_attempts)
+            | stop_at_deadline(deadline, reserve),
+            wait=wait_exponential(multiplier=1, min=1, max=self.config.retry_max_wait),
+            retry=retry_if_exception(is_backend_error),
+            reraise=True,
+        )
+
+    async def _request_completion(
+        self,
+        model_name: str,
+        prompt_text: str,
+        user_prompt: str,
+        content: str,
+        timeout: Optional[float] = None,
+        response_format: Optional[Dict[str, Any]] = None,
+        max_tokens: Optional[int] = None,
+        stop_at_json_end: bool = False,
+        task: Optional[str] = None,
+        tried: Optional[Set[str]] = None,
+    ) -> Completion:
+        """Get completion from LLM, retrying within ``timeout`` seconds overall"""
+        deadline = time.monotonic() + (timeout or self.config.request_timeout)
+        messages = self._messages(prompt_text, user_prompt, content)
+        try:
+            async for attempt in self._retrying(deadline):
+                with attempt:
+                    remaining = deadline - time.monotonic()
+                    async with self.pool.lease(
+                        model_name, tried
+                    ) as backend, guarded_call(
+                        backend.base_url, model_name, task, remaining
+                    ), self.residency.track(
+                        backend, model_name
+                    ):
+                        options = self._request_options(
+                            deadline - time.monotonic(), response_format, max_tokens
+                        )
+                        if stop_at_json_end:
+                            stream = await backend.client.chat.completions.create(
+                                model=model_name,
+                                messages=messages,
+                                stream=True,
+                                **options,
+                            )
+                            return await self._read_until_json_end(
+                                stream, top_level_keys(response_format)
+                            )
+
+                        completion = await backend.client.chat.completions.create(
+                            model=model_name, messages=messages, **options
+                        )
+                        choice = completion.choices[0]
+                        if choice.finish_reason == "length":
+                            _count_generation("hit_max_tokens")
+                        return Completion(
+                            choice.message.content or "", choice.finish_reason
+                        )
         except Exception as e:
             logger.error(f"Error in LLM completion: {e}")
             raise
@@ -93,26 +880,13 @@ class BaseParser:
         self.config = LLMConfig.from_env()
         self.llm_client = LLMClient(self.config)
 
-    def _process_json_response(self, text: str) -> Dict[str, Any]:
+    def _process_json_response(
+        self, text: str, task: str = "sections"
+    ) -> Dict[str, Any]:
         """Process JSON response from LLM"""
-
-        # Remove markdown code blocks if present
-        cleaned_text = text.strip()
-        if cleaned_text.startswith("```"):
-            cleaned_text = cleaned_text.strip("```json").strip("```")
-
-        cleaned_text = repair_json(cleaned_text)
-
         try:
-            # Try parsing as JSON first
-            if "{" in cleaned_text and "}" in cleaned_text:
-                # Extract JSON portion if mixed with other text
-                start = cleaned_text.find("{")
-                end = cleaned_text.rfind("}") + 1
-                json_str = cleaned_text[start:end]
-                data = json.loads(json_str)
-                return data if isinstance(data, dict) else {}
-            return {}
+            data = decode_json_response(text, task)
+            return data if isinstance(data, dict) else {}
         except json.JSONDecodeError as e:
             logger.error(f"JSON decode error: {e}")
             return {"message": "Resume Parsing Failed (F:PJR)"}
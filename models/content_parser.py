@@ -1,12 +1,19 @@
 # Standard library
 import json
 import logging
-from typing import Dict, Any, List
+from typing import AsyncIterator, Dict, Any, List, Tuple
 
 # Local imports
 from utils.logging_config import configure_logging
 from utils import prompts
+from utils.json_stream import IncrementalJSONParser
+from utils.structured_output import (
+    SECTIONS_RESPONSE_FORMAT,
+    SECTIONS_TEMPLATE,
+    output_token_budget,
+)
 from models.base_config import BaseParser
+from configs.config import LLM_CONFIG
 
 # remove
 import os
@@ -23,16 +30,21 @@ logger = logging.getLogger(__name__)
 class ResumeDataParser(BaseParser):
     """Handles resume parsing and data extraction"""
 
-    def get_sections(self, html_text: str, model: str) -> Dict[str, Any]:
+    async def get_sections(self, html_text: str, model: str) -> Dict[str, Any]:
         """Extract sections from resume HTML text"""
         if not html_text:
             raise ValueError("HTML text cannot be empty")
 
-        generated_text = self.llm_client.get_completion(
+        generated_text = await self.llm_client.get_completion(
             model,
             prompts.PROMPT_TEXT_SECTIONS + str(prompts.MAIN_SECTIONS),
             prompts.USER_PROMPT_SECTIONS,
             html_text,
+            timeout=LLM_CONFIG["TASK_TIMEOUTS"]["sections"],
+            response_format=SECTIONS_RESPONSE_FORMAT,
+            max_tokens=output_token_budget("sections", html_text, SECTIONS_TEMPLATE),
+            stop_at_json_end=True,
+            task="sections",
         )
 
         logger.info(
@@ -40,6 +52,31 @@ class ResumeDataParser(BaseParser):
         )
         return self._process_json_response(generated_text)
 
+    async def stream_sections(
+        self, html_text: str, model: str
+    ) -> AsyncIterator[Tuple[str, Any]]:
+        """Extract sections from resume text, yielding each as soon as it closes"""
+        if not html_text:
+            raise ValueError("HTML text cannot be empty")
+
+        parser = IncrementalJSONParser(SECTIONS_TEMPLATE)
+        async for delta in self.llm_client.stream_completion(
+            model,
+            prompts.PROMPT_TEXT_SECTIONS + str(prompts.MAIN_SECTIONS),
+            prompts.USER_PROMPT_SECTIONS,
+            html_text,
+            timeout=LLM_CONFIG["TASK_TIMEOUTS"]["sections"],
+            response_format=SECTIONS_RESPONSE_FORMAT,
+            max_tokens=output_token_budget("sections", html_text, SECTIONS_TEMPLATE),
+            stop_at_json_end=True,
+            task="sections",
+        ):
+            for section in parser.feed(delta):
+                yield section
+
+        for section in parser.close():
+            yield section
+
     # def get_sections(self, html_text: str) -> Dict[str, Any]:
     #     from huggingface_hub import InferenceClient
 
@@ -76,7 +113,7 @@ class ResumeDataParser(BaseParser):
     #         logger.error('Error processing response: %s', str(e))
     #         return {}
 
-    def generate_questions_for_skills(
+    async def generate_questions_for_skills(
         self,
         model: str,
         skills: List[str],
@@ -90,6 +127,9 @@ class ResumeDataParser(BaseParser):
                 raise ValueError("Skills list cannot be empty")
 
             skillset = ", ".join(skills)
+            max_tokens = output_token_budget(
+                "questions", adhoc_skill or skillset, items=num_questions
+            )
 
             logger.info(f"The adhoc skill requested is {adhoc_skill}")
             UPDATED_PROMPT_TEXT_FOR_QUE = prompts.PROMPT_TEXT_FOR_QUE.format(
@@ -105,18 +145,32 @@ class ResumeDataParser(BaseParser):
                     f"Interviewee has {yoe} years of experience."
                 )
 
-                return self.llm_client.get_completion(
-                    model, prompt, prompts.USER_PROMPT_FOR_QUE, skillset
-                ).replace("-", "")
+                questions = await self.llm_client.get_completion(
+                    model,
+                    prompt,
+                    prompts.USER_PROMPT_FOR_QUE,
+                    skillset,
+                    timeout=LLM_CONFIG["TASK_TIMEOUTS"]["questions"],
+                    max_tokens=max_tokens,
+                    task="questions",
+                )
+                return questions.replace("-", "")
             else:
                 prompt = (
                     f"{UPDATED_PROMPT_TEXT_FOR_QUE_ADHOC_SKILL}{num_questions} questions. "
                     f"Interviewee has {yoe} years of experience."
                 )
 
-                return self.llm_client.get_completion(
-                    model, prompt, prompts.USER_PROMPT_FOR_QUE_ADHOC_SKILL, adhoc_skill
-                ).replace("-", "")
+                questions = await self.llm_client.get_completion(
+                    model,
+                    prompt,
+                    prompts.USER_PROMPT_FOR_QUE_ADHOC_SKILL,
+                    adhoc_skill,
+                    timeout=LLM_CONFIG["TASK_TIMEOUTS"]["questions"],
+                    max_tokens=max_tokens,
+                    task="questions",
+                )
+                return questions.replace("-", "")
         except Exception as e:
             logger.error(f"Error generating questions for skills: {e}")
             return None
@@ -0,0 +1,192 @@
+# standard library imports
+import time
+import asyncio
+import logging
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Dict, List, Optional, Set
+
+# local imports
+from utils.logging_config import configure_logging
+from models.backend_guard import LLMBackendUnavailable, guarded_call
+from models.backend_pool import Backend, BackendPool
+from configs.config import LLM_CONFIG
+
+configure_logging()
+logger = logging.getLogger(__name__)
+
+
+class ModelResidencyManager:
+    """
+    Tracks which models are loaded on each endpoint and keeps a warm set loaded.
+
+    LM Studio loads a model on its first request and may unload others to
+    make room, so a request for a non-resident model stalls for the load.
+    Loaded models are read from LM Studio's ``/api/v0/models``. Endpoints
+    without that API are treated as unknown and never report a switch.
+    Every call that finds its model unloaded counts as a model switch,
+    with its duration as the cost.
+    """
+
+    def __init__(
+        self,
+        pool: BackendPool,
+        warm_models: List[str],
+        keepalive_interval: float = 240.0,
+        load_timeout: float = 300.0,
+        enabled: bool = True,
+    ):
+        self.pool = pool
+        self.warm_models = warm_models
+        self.keepalive_interval = keepalive_interval
+        self.load_timeout = load_timeout
+        self.enabled = enabled
+        # loaded models by endpoint base URL, missing while unknown
+        self._resident: Dict[str, Set[str]] = {}
+        self._switches: Dict[str, Dict[str, float]] = {}
+        self._counters = {
+            "preloads": 0,
+            "keepalives": 0,
+            "keepalive_failures": 0,
+            "evictions": 0,
+        }
+
+    @classmethod
+    def from_config(cls, pool: BackendPool) -> "ModelResidencyManager":
+        """Create residency manager from LLM settings"""
+        return cls(
+            pool=pool,
+            warm_models=LLM_CONFIG["WARM_MODELS"],
+            keepalive_interval=LLM_CONFIG["KEEPALIVE_INTERVAL_SECONDS"],
+            load_timeout=LLM_CONFIG["MODEL_LOAD_TIMEOUT_SECONDS"],
+            enabled=LLM_CONFIG["RESIDENCY_ENABLED"],
+        )
+
+    async def run(self) -> None:
+        """Preloads the warm set, then refreshes and pings it until cancelled."""
+        if not self.enabled:
+            return
+        logger.info(f"Keeping models warm: {', '.join(self.warm_models)}")
+        await self.pool.check_all()
+        while True:
+            await self.refresh()
+            await self.warm()
+            await asyncio.sleep(self.keepalive_interval)
+
+    async def refresh(self) -> None:
+        """Reads the loaded models of every endpoint."""
+        for backend in self.pool.backends:
+            await self._refresh_backend(backend)
+
+    async def _refresh_backend(self, backend: Backend) -> Optional[Set[str]]:
+        """Reads the loaded models of one endpoint, None if unknown."""
+        loaded = await self._loaded_models(backend)
+        if loaded is None:
+            return None
+        evicted = self._resident.get(backend.base_url, set()) - loaded
+        if evicted:
+            logger.info(f"Models unloaded on {backend.base_url}: {evicted}")
+            self._counters["evictions"] += len(evicted)
+        self._resident[backend.base_url] = loaded
+        return loaded
+
+    async def warm(self) -> None:
+        """Loads, or keeps loaded, every warm model on its endpoint."""
+        for model in self.warm_models:
+            try:
+                async with self.pool.lease(model) as backend:
+                    await self._ping(backend, model)
+            except LLMBackendUnavailable as e:
+                logger.warning(f"Cannot keep {model} warm: {e}")
+            except Exception as e:
+                logger.error(f"Keepalive of {model} failed with error {e}")
+                self._counters["keepalive_failures"] += 1
+
+    @asynccontextmanager
+    async def track(self, backend: Backend, model: str) -> AsyncIterator[None]:
+        """
+        Wraps a call, recording a model switch if the model was not loaded.
+
+        Loading a model may unload others, so after a cold call the loaded
+        models of the endpoint are read again. Switching back to a displaced
+        model is then recorded as a switch too.
+
+        Args:
+            backend (Backend): Endpoint serving the call
+            model (str): Model the call uses
+        """
+        resident = self._resident.get(backend.base_url)
+        cold = resident is not None and model not in resident
+        started = time.monotonic()
+        yield
+        if not cold:
+            return
+        self._record_switch(backend, model, time.monotonic() - started)
+        if await self._refresh_backend(backend) is None:
+            resident.add(model)
+
+    def is_resident(self, base_url: str, model: str) -> Optional[bool]:
+        """Tells whether a model is loaded on an endpoint, None if unknown."""
+        resident = self._resident.get(base_url)
+        return None if resident is None else model in resident
+
+    async def _ping(self, backend: Backend, model: str) -> None:
+        """Sends a one-token completion, loading the model if needed."""
+        preload = self.is_resident(backend.base_url, model) is False
+        async with guarded_call(
+            backend.base_url, model, "keepalive", self.load_timeout
+        ), self.track(backend, model):
+            await backend.client.chat.completions.create(
+                model=model,
+                messages=[{"role": "user", "content": "ping"}],
+                max_tokens=1,
+                timeout=self.load_timeout,
+            )
+        self._counters["preloads" if preload else "keepalives"] += 1
+
+    async def _loaded_models(self, backend: Backend) -> Optional[Set[str]]:
+        """Returns the models LM Studio reports as loaded, None if unknown."""
+        root = backend.base_url.removesuffix("/v1")
+        try:
+            response = await backend.http_client.get(
+                f"{root}/api/v0/models",
+                headers={"Authorization": f"Bearer {backend.api_key}"},
+                timeout=self.pool.check_timeout,
+            )
+            response.raise_for_status()
+            return {
+                entry["id"]
+                for entry in response.json().get("data", [])
+                if entry.get("state") == "loaded"
+            }
+        except Exception as e:
+            logger.debug(f"Loaded models of {backend.base_url} unknown: {e}")
+            return None
+
+    def _record_switch(self, backend: Backend, model: str, seconds: float) -> None:
+        """Counts a model switch and its cost."""
+        logger.info(f"Loaded {model} on {backend.base_url} in {seconds:.1f}s")
+        stats = self._switches.setdefault(
+            model, {"count": 0, "total_seconds": 0.0, "max_seconds": 0.0}
+        )
+        stats["count"] += 1
+        stats["total_seconds"] += seconds
+        stats["max_seconds"] = max(stats["max_seconds"], seconds)
+
+    def metrics(self) -> Dict[str, Any]:
+        """Returns loaded models per endpoint, switch costs and keepalive counts."""
+        return {
+            "enabled": self.enabled,
+            "warm_models": self.warm_models,
+            "resident": {
+                base_url: sorted(models) for base_url, models in self._resident.items()
+            },
+            "switches": {
+                model: {
+                    "count": int(stats["count"]),
+                    "total_seconds": round(stats["total_seconds"], 3),
+                    "max_seconds": round(stats["max_seconds"], 3),
+                }
+                for model, stats in self._switches.items()
+            },
+            **self._counters,
+        }
@@ -3,13 +3,17 @@ import json
 import logging
 from typing import List, Dict, Union
 
-# Third-party imports
-from json_repair import repair_json
-
 # Local imports
 from utils import prompts
 from models.base_config import BaseParser
+from configs.config import LLM_CONFIG
 from utils.logging_config import configure_logging
+from utils.structured_output import (
+    SPELL_CHECK_RESPONSE_FORMAT,
+    SPELL_CHECK_TEMPLATE,
+    decode_json_response,
+    output_token_budget,
+)
 
 configure_logging()
 logger = logging.getLogger(__name__)
@@ -28,26 +32,30 @@ class ResumeIssueParser(BaseParser):
     ) -> Union[List[Dict[str, str]], List]:
         """Process JSON response from LLM"""
         try:
-            if message_content.startswith("```"):
-                message_content = message_content.strip("```json").strip("```")
-
-            message_content = repair_json(message_content)
-
-            data = json.loads(message_content)
-            return data.get(key, [])
+            data = decode_json_response(message_content, "spell_check")
+            return data.get(key, []) if isinstance(data, dict) else []
         except json.JSONDecodeError as e:
             logger.error(f"Error decoding JSON: {e}")
             return []
 
-    def spell_check(self, resume_text: str, model: str) -> List[Dict[str, str]]:
+    async def spell_check(
+        self, resume_text: str, model: str
+    ) -> List[Dict[str, str]]:
         """Perform spell check on resume text"""
         self._validate_input(resume_text)
 
-        message_content = self.llm_client.get_completion(
+        message_content = await self.llm_client.get_completion(
             model,
             prompts.PROMPT_TEXT_SPELL_CHECK,
             prompts.USER_PROMPT_SPELL_CHECK,
             resume_text,
+            timeout=LLM_CONFIG["TASK_TIMEOUTS"]["spell_check"],
+            response_format=SPELL_CHECK_RESPONSE_FORMAT,
+            max_tokens=output_token_budget(
+                "spell_check", resume_text, SPELL_CHECK_TEMPLATE
+            ),
+            stop_at_json_end=True,
+            task="spell_check",
         )
 
         misspelled_words = self._process_json_response(
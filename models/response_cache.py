@@ -0,0 +1,242 @@
+# standard library imports
+import os
+import json
+import time
+import zlib
+import sqlite3
+import hashlib
+import logging
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
+
+# local imports
+from utils import prompts
+from utils.logging_config import configure_logging
+from utils.metrics import register_metrics
+from configs.config import APP_CONFIG, LLM_CONFIG
+
+configure_logging()
+logger = logging.getLogger(__name__)
+
+
+def prompt_version() -> str:
+    """
+    Derives a version tag from the prompt constants in ``utils/prompts.py``.
+
+    Any edit to a prompt, or a bump of ``PROMPT_REVISION``, changes the tag
+    and with it every cache key, so stale answers are never served.
+
+    Returns:
+        str: Short hex digest of the prompt texts
+    """
+    digest = hashlib.sha256()
+    for name in sorted(vars(prompts)):
+        value = getattr(prompts, name)
+        if name.isupper() and isinstance(value, (str, int)):
+            digest.update(f"{name}={value}\0".encode("utf-8"))
+    return digest.hexdigest()[:12]
+
+
+class LLMResponseCache:
+    """
+    Two-level cache of LLM completions.
+
+    An in-memory LRU of ``memory_entries`` answers sits in front of a SQLite
+    store in ``CACHE_DIR`` that survives restarts. Entries expire after
+    ``ttl_seconds`` and the disk store drops least recently used entries
+    once it exceeds ``max_bytes``.
+    """
+
+    def __init__(
+        self, path: str, memory_entries: int, max_bytes: int, ttl_seconds: float
+    ):
+        self.path = path
+        self.memory_entries = memory_entries
+        self.max_bytes = max_bytes
+        self.ttl_seconds = ttl_seconds
+        self.version = prompt_version()
+        self._memory: "OrderedDict[str, Tuple[str, float]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._counters = {
+            "memory_hits": 0,
+            "disk_hits": 0,
+            "misses": 0,
+            "writes": 0,
+            "expired": 0,
+            "evictions": 0,
+        }
+
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS responses (
+                key TEXT PRIMARY KEY,
+                payload BLOB NOT NULL,
+                size INTEGER NOT NULL,
+                created REAL NOT NULL,
+                last_access REAL NOT NULL
+            )
+            """
+        )
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_responses_access ON responses(last_access)"
+        )
+        self._conn.commit()
+
+        register_metrics("llm_response_cache", self.metrics)
+
+    @classmethod
+    def from_config(cls) -> "LLMResponseCache":
+        """Create cache from application settings"""
+        return cls(
+            path=os.path.join(APP_CONFIG["CACHE_DIR"], "llm_responses.sqlite3"),
+            memory_entries=LLM_CONFIG["RESPONSE_CACHE_MEMORY_ENTRIES"],
+            max_bytes=LLM_CONFIG["RESPONSE_CACHE_MAX_BYTES"],
+            ttl_seconds=LLM_CONFIG["RESPONSE_CACHE_TTL_SECONDS"],
+        )
+
+    def make_key(
+        self,
+        model_name: str,
+        prompt_text: str,
+        user_prompt: str,
+        content: str,
+        temperature: float,
+        **options: Any,
+    ) -> str:
+        """Hashes every completion input together with the prompt version."""
+        inputs = [
+            self.version,
+            model_name,
+            prompt_text,
+            user_prompt,
+            content,
+            temperature,
+        ]
+        # options that shape the answer, e.g. response_format or max_tokens
+        options = {name: value for name, value in options.items() if value is not None}
+        if options:
+            inputs.append(options)
+        payload = json.dumps(inputs, sort_keys=True)
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> Optional[str]:
+        """
+        Returns a cached completion or None on a miss.
+
+        Args:
+            key (str): Key from ``make_key``
+
+        Returns:
+            Optional[str]: Cached completion text
+        """
+        now = time.time()
+        with self._lock:
+            entry = self._memory.get(key)
+            if entry is not None:
+                text, created = entry
+                if now - created <= self.ttl_seconds:
+                    self._memory.move_to_end(key)
+                    self._counters["memory_hits"] += 1
+                    return text
+                del self._memory[key]
+
+            try:
+                return self._read_disk(key, now)
+            except (sqlite3.Error, zlib.error, UnicodeDecodeError) as e:
+                # a locked store or corrupt row costs a generation, not the call
+                logger.error(f"Reading LLM response cache entry failed with error {e}")
+                self._counters["misses"] += 1
+                return None
+
+    def _read_disk(self, key: str, now: float) -> Optional[str]:
+        """Looks a completion up in the disk store. Caller holds the lock."""
+        row = self._conn.execute(
+            "SELECT payload, created FROM responses WHERE key = ?", (key,)
+        ).fetchone()
+        if row is None:
+            self._counters["misses"] += 1
+            return None
+        if now - row[1] > self.ttl_seconds:
+            self._conn.execute("DELETE FROM responses WHERE key = ?", (key,))
+            self._conn.commit()
+            self._counters["expired"] += 1
+            self._counters["misses"] += 1
+            return None
+
+        text = zlib.decompress(row[0]).decode("utf-8")
+        self._conn.execute(
+            "UPDATE responses SET last_access = ? WHERE key = ?", (now, key)
+        )
+        self._conn.commit()
+        self._remember(key, text, row[1])
+        self._counters["disk_hits"] += 1
+        return text
+
+    def put(self, key: str, text: str) -> None:
+        """Stores a completion in memory and on disk."""
+        now = time.time()
+        payload = zlib.compress(text.encode("utf-8"))
+        try:
+            with self._lock:
+                self._remember(key, text, now)
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?)",
+                    (key, payload, len(payload), now, now),
+                )
+                self._counters["writes"] += 1
+                self._evict()
+                self._conn.commit()
+        except sqlite3.Error as e:
+            logger.error(f"Writing LLM response cache entry failed with error {e}")
+
+    def metrics(self) -> Dict[str, Any]:
+        """Returns hit/miss counters, the hit rate and the stored size."""
+        with self._lock:
+            entries, stored = self._conn.execute(
+                "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM responses"
+            ).fetchone()
+            counters = dict(self._counters)
+            counters["memory_entries"] = len(self._memory)
+
+        hits = counters["memory_hits"] + counters["disk_hits"]
+        lookups = hits + counters["misses"]
+        counters["hit_rate"] = round(hits / lookups, 3) if lookups else 0.0
+        counters["disk_entries"] = entries
+        counters["stored_bytes"] = stored
+        counters["prompt_version"] = self.version
+        return counters
+
+    def _remember(self, key: str, text: str, created: float) -> None:
+        """Adds an entry to the memory LRU. Caller holds the lock."""
+        self._memory[key] = (text, created)
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.memory_entries:
+            self._memory.popitem(last=False)
+
+    def _evict(self) -> None:
+        """Deletes expired and least recently used disk entries. Caller holds the lock."""
+        cursor = self._conn.execute(
+            "DELETE FROM responses WHERE created < ?", (time.time() - self.ttl_seconds,)
+        )
+        self._counters["expired"] += cursor.rowcount
+
+        (stored,) = self._conn.execute(
+            "SELECT COALESCE(SUM(size), 0) FROM responses"
+        ).fetchone()
+        if stored <= self.max_bytes:
+            return
+
+        rows = self._conn.execute(
+            "SELECT key, size FROM responses ORDER BY last_access ASC"
+        ).fetchall()
+        for key, size in rows:
+            if stored <= self.max_bytes:
+                break
+            self._conn.execute("DELETE FROM responses WHERE key = ?", (key,))
+            self._memory.pop(key, None)
+            stored -= size
+            self._counters["evictions"] += 1
@@ -0,0 +1,22 @@
+# standard library imports
+from typing import Any, Dict
+
+# third party imports
+from fastapi import APIRouter
+
+# local imports
+from utils.metrics import collect_metrics
+
+# Create a router for the metrics endpoints
+router = APIRouter(tags=["Metrics"])
+
+
+@router.get("/metrics", response_model=Dict[str, Dict[str, Any]])
+async def get_metrics() -> Dict[str, Dict[str, Any]]:
+    """
+    Report runtime metrics of the registered components.
+
+    Returns:
+        Dict[str, Dict[str, Any]]: Metrics snapshot per component
+    """
+    return collect_metrics()
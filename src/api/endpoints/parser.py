@@ -1,14 +1,15 @@
 # Standard library imports
+import json
 import logging
-from typing import Dict
+from typing import Dict, Optional
 
 # Third party imports
 from fastapi import APIRouter, UploadFile, File, HTTPException, Form
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, StreamingResponse
 
 # Local imports
 from src.services.parser_service import ParserService
-from src.schemas.parser import SkillsRequest, ParseResponse
+from src.schemas.parser import SkillsRequest, ParseResponse, WorkspaceResponse
 from utils.logging_config import configure_logging
 from utils.constants import ERROR_MESSAGES
 
@@ -24,28 +25,35 @@ parser_service = ParserService()
 
 @router.post("/parse", response_model=ParseResponse)
 async def resume_parser(
-    file: UploadFile = File(...), model: str = Form(...)
+    file: UploadFile = File(...),
+    model: str = Form(...),
+    profile: Optional[str] = Form(None),
 ) -> JSONResponse:
     """
-    Parse a resume PDF file and extract structured information.
+    Parse a resume file and extract structured information.
 
     Args:
-        file (UploadFile): PDF resume file to be parsed
+        file (UploadFile): PDF, DOCX, HTML or text resume file to be parsed
         model (str): name of model
+        profile (Optional[str]): Docling pipeline profile ("fast" skips OCR
+            and table structure, "accurate" runs all models)
 
     Returns:
         JSONResponse: Contains parsed resume data and issue analysis
             - result_table: HTML formatted resume sections
             - issue_table: Spelling issues found
+            - parse_id: ID to look up the parse artifacts
 
     Raises:
         HTTPException:
-            - 400: If file is not PDF format
+            - 400: If the file format is unsupported or the profile is unknown
             - 500: If parsing or processing fails
     """
     try:
         print(f"file {file}, model {model}")
-        return await parser_service.parse_resume(file=file, model=model)
+        return await parser_service.parse_resume(
+            file=file, model=model, profile=profile
+        )
     except HTTPException as he:
         logger.error(f"HTTP Exception during parsing: {he.detail}")
         raise HTTPException(status_code=he.status_code, detail=he.detail)
@@ -61,6 +69,49 @@ async def resume_parser(
         )
 
 
+@router.post("/parse/stream")
+async def resume_parser_stream(
+    file: UploadFile = File(...),
+    model: str = Form(...),
+    profile: Optional[str] = Form(None),
+) -> StreamingResponse:
+    """
+    Parse a resume file and stream the results as newline-delimited JSON.
+
+    Args:
+        file (UploadFile): PDF, DOCX, HTML or text resume file to be parsed
+        model (str): name of model
+        profile (Optional[str]): Docling pipeline profile
+
+    Returns:
+        StreamingResponse: One JSON event per line
+            - reader: extraction route and compaction report
+            - section: a section as soon as the LLM completed it, with the
+              summary table built from the sections so far
+            - issues: the issue table
+            - done: the complete result including the parse_id
+            - error: the detail of a failure after streaming started
+
+    Raises:
+        HTTPException:
+            - 400: If the file format is unsupported or the profile is unknown
+            - 500: If the file cannot be read
+    """
+    try:
+        events = await parser_service.parse_resume_stream(
+            file=file, model=model, profile=profile
+        )
+    except HTTPException as he:
+        logger.error(f"HTTP Exception during parsing: {he.detail}")
+        raise HTTPException(status_code=he.status_code, detail=he.detail)
+
+    async def ndjson():
+        async for event in events:
+            yield json.dumps(event) + "\n"
+
+    return StreamingResponse(ndjson(), media_type="application/x-ndjson")
+
+
 @router.post("/questions", response_model=Dict[str, list])
 async def get_questions(skills_data: SkillsRequest) -> JSONResponse:
     """
@@ -97,3 +148,27 @@ async def get_questions(skills_data: SkillsRequest) -> JSONResponse:
         raise HTTPException(
             status_code=500, detail=ERROR_MESSAGES["UNEXPECTED_ERROR"].format(str(e))
         )
+
+
+@router.get("/workspace/{parse_id}", response_model=WorkspaceResponse)
+async def get_workspace(parse_id: str) -> WorkspaceResponse:
+    """
+    Fetch the artifacts of an earlier parse.
+
+    Args:
+        parse_id (str): ID returned by the parse endpoint
+
+    Returns:
+        WorkspaceResponse: Cleaned resume text and extracted sections
+
+    Raises:
+        HTTPException:
+            - 404: If the parse is unknown or has expired
+    """
+    workspace = parser_service.get_workspace(parse_id)
+    return WorkspaceResponse(
+        parse_id=workspace.parse_id,
+        model=workspace.model,
+        text=workspace.md_text,
+        sections=workspace.sections,
+    )
@@ -0,0 +1,105 @@
+# standard library imports
+import logging
+from typing import Optional
+
+# third party imports
+from starlette.responses import JSONResponse
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+# local imports
+from configs.config import APP_CONFIG
+from utils.constants import ERROR_MESSAGES
+from utils.logging_config import configure_logging
+
+configure_logging()
+logger = logging.getLogger(__name__)
+
+# room for the multipart boundaries, headers and form fields around the file
+FORM_OVERHEAD_BYTES = 64 * 1024
+
+
+class UploadLimitMiddleware:
+    """
+    Rejects request bodies above the upload limit before they are parsed.
+
+    FastAPI reads and spools the whole multipart form before the endpoint
+    runs, so a size check in the endpoint only fires once the upload has
+    been received. This middleware answers 413 straight away when the
+    ``Content-Length`` is too large, and otherwise counts the body while it
+    is received, answering 413 as soon as the count passes the limit.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        max_bytes: Optional[int] = None,
+        path_prefix: str = "/api/",
+    ) -> None:
+        """
+        Args:
+            app (ASGIApp): Wrapped application
+            max_bytes (Optional[int]): Largest accepted body, by default
+                ``MAX_UPLOAD_BYTES`` plus the multipart overhead
+            path_prefix (str): Only requests below this path are limited
+        """
+        self.app = app
+        self.max_bytes = max_bytes or (
+            APP_CONFIG["MAX_UPLOAD_BYTES"] + FORM_OVERHEAD_BYTES
+        )
+        self.path_prefix = path_prefix
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or not scope["path"].startswith(self.path_prefix):
+            await self.app(scope, receive, send)
+            return
+
+        headers = dict(scope["headers"])
+        content_length = headers.get(b"content-length", b"")
+        if content_length.isdigit() and int(content_length) > self.max_bytes:
+            logger.error(f"Rejected upload of {int(content_length)} bytes")
+            await self._reject(scope, receive, send)
+            return
+
+        received = 0
+        rejected = False
+        response_started = False
+
+        async def limited_receive() -> Message:
+            nonlocal received, rejected
+            if rejected:
+                return {"type": "http.disconnect"}
+            message = await receive()
+            if message["type"] == "http.request":
+                received += len(message.get("body", b""))
+                if received > self.max_bytes:
+                    # the app sees a disconnect and gives up reading the body
+                    logger.error(f"Rejected upload after {received} bytes")
+                    rejected = True
+                    if not response_started:
+                        await self._reject(scope, receive, send)
+                    return {"type": "http.disconnect"}
+            return message
+
+        async def guarded_send(message: Message) -> None:
+            nonlocal response_started
+            if rejected:
+                # the 413 has been sent, drop the app's own error response
+                return
+            if message["type"] == "http.response.start":
+                response_started = True
+            await send(message)
+
+        await self.app(scope, limited_receive, guarded_send)
+
+    async def _reject(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """Sends the 413 response."""
+        response = JSONResponse(
+            status_code=413,
+            content={
+                "detail": ERROR_MESSAGES["FILE_TOO_LARGE"].format(
+                    APP_CONFIG["MAX_UPLOAD_BYTES"]
+                )
+            },
+            headers={"Connection": "close"},
+        )
+        await response(scope, receive, send)
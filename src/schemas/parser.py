@@ -1,4 +1,4 @@
-from typing import Optional
+from typing import Any, Dict, Optional
 
 from pydantic import BaseModel
 from fastapi import UploadFile
@@ -19,6 +19,7 @@ class SkillsRequest(BaseModel):
     adhoc_skill: str
     num_questions: int = 1
     yoe: Optional[str] = "5 years"
+    parse_id: Optional[str] = None
 
 
 class ParseResponse(BaseModel):
@@ -26,3 +27,15 @@ class ParseResponse(BaseModel):
 
     result_table: str
     issue_table: str
+    parse_id: str
+    reader: Optional[Dict[str, Any]] = None
+    compaction: Optional[Dict[str, Any]] = None
+
+
+class WorkspaceResponse(BaseModel):
+    """Schema for the artifacts of an earlier parse."""
+
+    parse_id: str
+    model: str
+    text: str
+    sections: Dict[str, Any]
@@ -1,4 +1,5 @@
 # standard library imports
+import asyncio
 import logging
 from typing import List
 
@@ -27,7 +28,7 @@ class ResumeAnalyzer:
             logger.error(f"Failed to initialize ResumeAnalyzer: {e}")
             raise
 
-    def analyze_resume(self, text: str, model: str) -> str:
+    async def analyze_resume(self, text: str, model: str) -> str:
         """
         Perform comprehensive resume analysis.
 
@@ -40,11 +41,11 @@ class ResumeAnalyzer:
                             and spelling corrections
         """
         try:
-            # Check for missing sections
-            missing_sections = self.section_checker.missing_section_check(text)
-
-            # Check for spelling errors
-            spelling_corrections = self.spell_checker.spell_check(text, model)
+            # spaCy runs in a thread while the LLM checks the spelling
+            missing_sections, spelling_corrections = await asyncio.gather(
+                asyncio.to_thread(self.section_checker.missing_section_check, text),
+                self.spell_checker.spell_check(text, model),
+            )
 
             return self._generate_html(missing_sections, spelling_corrections)
 
@@ -14,10 +14,10 @@ class SpellChecker:
     def __init__(self):
         self.issue_parser = ResumeIssueParser()
 
-    def spell_check(self, text: str, model: str) -> List[Dict[str, str]]:
+    async def spell_check(self, text: str, model: str) -> List[Dict[str, str]]:
         """Identify spelling errors in the text using LLM."""
         try:
-            corrections = self.issue_parser.spell_check(text, model)
+            corrections = await self.issue_parser.spell_check(text, model)
             if isinstance(corrections, dict) and "message" in corrections:
                 logger.info(corrections["message"])
                 return []
@@ -0,0 +1,138 @@
+# standard library imports
+import time
+import queue
+import logging
+import threading
+from collections import deque
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, Union
+
+# third party imports
+from docling.datamodel.base_models import InputFormat, DocumentStream
+from docling.datamodel.pipeline_options import PdfPipelineOptions
+from docling.document_converter import DocumentConverter, PdfFormatOption
+
+# local imports
+from configs.config import APP_CONFIG
+from utils.logging_config import configure_logging
+from utils.metrics import register_metrics, percentile
+from src.services.parser.exceptions import ResumeParsingError
+
+configure_logging()
+logger = logging.getLogger(__name__)
+
+# number of recent conversions kept per profile for latency percentiles
+LATENCY_WINDOW = 200
+
+
+def build_converter(profile_options: Dict[str, Any]) -> DocumentConverter:
+    """
+    Builds a Docling converter for a pipeline profile.
+
+    Args:
+        profile_options (Dict[str, Any]): PdfPipelineOptions fields, e.g.
+            ``{"do_ocr": False, "do_table_structure": False}``
+
+    Returns:
+        DocumentConverter: Converter with the PDF pipeline initialized
+    """
+    pipeline_options = PdfPipelineOptions(**profile_options)
+    converter = DocumentConverter(
+        format_options={
+            InputFormat.PDF: PdfFormatOption(pipeline_options=pipeline_options)
+        }
+    )
+    # load the layout, OCR and table models now instead of on first request
+    converter.initialize_pipeline(InputFormat.PDF)
+    return converter
+
+
+class ConverterPool:
+    """
+    Pool of pre-initialized Docling converters per pipeline profile.
+
+    Profiles come from ``APP_CONFIG["CONVERTER_PROFILES"]``. Each profile
+    holds ``pool_size`` converters that are handed out one request at a
+    time, and the pool tracks conversion latency per profile.
+    """
+
+    def __init__(self, profiles: Dict[str, Dict[str, Any]], pool_size: int):
+        self.profiles = profiles
+        self._pools: Dict[str, "queue.Queue[DocumentConverter]"] = {}
+        self._latencies: Dict[str, deque] = {}
+        self._lock = threading.Lock()
+
+        for name, options in profiles.items():
+            start = time.perf_counter()
+            self._pools[name] = queue.Queue()
+            for _ in range(pool_size):
+                self._pools[name].put(build_converter(options))
+            self._latencies[name] = deque(maxlen=LATENCY_WINDOW)
+            logger.info(
+                f"Converter profile {name} ready ({pool_size} converters, "
+                f"{time.perf_counter() - start:.1f}s)"
+            )
+
+        register_metrics("converter_pool", self.metrics)
+
+    @classmethod
+    def from_config(cls) -> "ConverterPool":
+        """Create pool from application settings"""
+        return cls(
+            profiles=APP_CONFIG["CONVERTER_PROFILES"],
+            pool_size=APP_CONFIG["CONVERTER_POOL_SIZE"],
+        )
+
+    def validate_profile(self, profile: str) -> None:
+        """Raises ResumeParsingError for an unknown profile name."""
+        if profile not in self._pools:
+            raise ResumeParsingError(
+                message=f"Unknown converter profile. Use {list(self._pools)}",
+                code=1005,
+                details={"profile": profile},
+            )
+
+    @contextmanager
+    def acquire(self, profile: str) -> Iterator[DocumentConverter]:
+        """Lends a converter of the profile, waiting if all are busy."""
+        self.validate_profile(profile)
+        converter = self._pools[profile].get()
+        try:
+            yield converter
+        finally:
+            self._pools[profile].put(converter)
+
+    def convert(self, source: Union[str, DocumentStream], profile: str):
+        """
+        Converts a document with a pooled converter of the given profile.
+
+        Args:
+            source (Union[str, DocumentStream]): Path or in-memory document
+            profile (str): Name of the pipeline profile
+
+        Returns:
+            ConversionResult: Docling conversion result
+        """
+        with self.acquire(profile) as converter:
+            start = time.perf_counter()
+            result = converter.convert(source)
+            elapsed = time.perf_counter() - start
+
+        with self._lock:
+            self._latencies[profile].append(elapsed)
+        return result
+
+    def metrics(self) -> Dict[str, Any]:
+        """Returns per-profile conversion latency and idle converter counts."""
+        with self._lock:
+            latencies = {name: sorted(values) for name, values in self._latencies.items()}
+
+        snapshot = {}
+        for name, values in latencies.items():
+            stats = {"idle_converters": self._pools[name].qsize(), "count": len(values)}
+            if values:
+                stats["avg_ms"] = round(1000 * sum(values) / len(values))
+                stats["p50_ms"] = round(1000 * percentile(values, 0.5))
+                stats["p95_ms"] = round(1000 * percentile(values, 0.95))
+            snapshot[name] = stats
+        return snapshot
@@ -0,0 +1,155 @@
+# standard library imports
+import re
+from dataclasses import dataclass
+from typing import List, Tuple
+
+# third party imports
+from docling_core.types.doc import DoclingDocument, DocItemLabel, GroupLabel
+from docling_core.types.doc.document import (
+    DEFAULT_EXPORT_LABELS,
+    DocItem,
+    GroupItem,
+    ListItem,
+    PictureItem,
+    SectionHeaderItem,
+    TableItem,
+    TextItem,
+)
+
+# local imports
+from utils.pre_processing import IncrementalCleaner
+
+IMAGE_PLACEHOLDER = "<!-- image -->"
+MISSING_TEXT = "<missing-text>"
+LIST_INDENT = 4
+
+
+@dataclass
+class ExportedDocument:
+    """Markdown and plain text of a Docling document, raw and cleaned"""
+
+    md_text: str
+    plain_text: str
+    clean_md: str
+    clean_plain: str
+
+
+def _escape_underscores(text: str) -> str:
+    """Escapes underscores like Docling's markdown export (no image URLs here)."""
+    return re.sub(r"(?<!\\)_", r"\_", text)
+
+
+def export_document(document: DoclingDocument) -> ExportedDocument:
+    """
+    Serializes a Docling document to markdown and plain text in one walk.
+
+    Mirrors ``export_to_markdown`` and ``export_to_text`` (strict text) of
+    the Docling document with their default arguments, but visits the
+    document tree once and cleans both outputs with ``clean_text_md`` rules
+    while they are produced. Underscores are escaped in the markdown only,
+    the plain text keeps the document text as it is.
+
+    Args:
+        document (DoclingDocument): Converted document
+
+    Returns:
+        ExportedDocument: Raw and cleaned markdown and plain text
+    """
+    md_parts: List[str] = []
+    text_parts: List[str] = []
+    list_nesting_level = 0
+    previous_level = 0
+    in_list = False
+
+    for item, level in document.iterate_items(document.body, with_groups=True):
+        # leaving groups closes the lists they contained
+        if level < previous_level:
+            list_nesting_level = max(0, list_nesting_level - (previous_level - level))
+        previous_level = level
+
+        if isinstance(item, DocItem) and item.label not in DEFAULT_EXPORT_LABELS:
+            continue
+
+        if in_list and not isinstance(item, (ListItem, GroupItem)):
+            if md_parts:
+                md_parts[-1] += "\n"
+            if text_parts:
+                text_parts[-1] += "\n"
+            in_list = False
+
+        if isinstance(item, GroupItem):
+            if item.label in [GroupLabel.LIST, GroupLabel.ORDERED_LIST]:
+                if list_nesting_level == 0:
+                    md_parts.append("\n")
+                    text_parts.append("\n")
+                list_nesting_level += 1
+                in_list = True
+            continue
+
+        if isinstance(item, TextItem) and item.label == DocItemLabel.TITLE:
+            in_list = False
+            md_parts.append(f"# {item.text}".strip() + "\n")
+            text_parts.append(f" {item.text}".strip() + "\n")
+
+        elif isinstance(item, SectionHeaderItem) or (
+            isinstance(item, TextItem) and item.label == DocItemLabel.SECTION_HEADER
+        ):
+            in_list = False
+            marker = "#" * level if level >= 2 else "##"
+            md_parts.append(f"{marker} {item.text}\n".strip() + "\n")
+            text_parts.append(f" {item.text}\n".strip() + "\n")
+
+        elif isinstance(item, TextItem) and item.label == DocItemLabel.CODE:
+            in_list = False
+            code = f"```\n{item.text}\n```\n"
+            md_parts.append(code)
+            text_parts.append(code)
+
+        elif isinstance(item, ListItem) and item.label == DocItemLabel.LIST_ITEM:
+            in_list = True
+            list_indent = " " * (LIST_INDENT * (list_nesting_level - 1))
+            marker = item.marker if item.enumerated else "-"
+            md_parts.append(f"{list_indent}{marker} {item.text}")
+            text_parts.append(f"{list_indent} {item.text}")
+
+        elif isinstance(item, TextItem):
+            in_list = False
+            if len(item.text):
+                md_parts.append(f"{item.text}\n")
+                text_parts.append(f"{item.text}\n")
+
+        elif isinstance(item, TableItem):
+            # strict text export has no table or picture rendering
+            in_list = False
+            md_parts.append(item.caption_text(document))
+            md_parts.append("\n" + item.export_to_markdown() + "\n")
+            text_parts.append(MISSING_TEXT)
+
+        elif isinstance(item, PictureItem):
+            in_list = False
+            md_parts.append(item.caption_text(document))
+            md_parts.append("\n" + IMAGE_PLACEHOLDER + "\n")
+            text_parts.append(MISSING_TEXT)
+
+        elif isinstance(item, DocItem):
+            in_list = False
+            md_parts.append(MISSING_TEXT)
+            text_parts.append(MISSING_TEXT)
+
+    md_text, clean_md = _join_parts(
+        [_escape_underscores(part) for part in md_parts], "\n"
+    )
+    plain_text, clean_plain = _join_parts(text_parts, "\n\n")
+    return ExportedDocument(md_text, plain_text, clean_md, clean_plain)
+
+
+def _join_parts(parts: List[str], delim: str) -> Tuple[str, str]:
+    """Joins serialized parts like Docling and cleans them in the same loop."""
+    cleaner = IncrementalCleaner()
+    for ix, part in enumerate(parts):
+        if ix:
+            cleaner.feed(delim)
+        cleaner.feed(part)
+
+    text = re.sub(r"\n\n\n+", "\n\n", delim.join(parts).strip())
+    return text, cleaner.result()
@@ -0,0 +1,337 @@
+# standard library imports
+import os
+import time
+import queue
+import logging
+import threading
+import multiprocessing
+from io import BytesIO
+from multiprocessing.connection import Connection
+from typing import Any, Dict, Optional, Union
+
+# local imports
+from configs.config import APP_CONFIG
+from utils.logging_config import configure_logging
+from utils.metrics import register_metrics
+from src.services.parser.exceptions import ResumeParsingError
+from src.services.parser.docling_export import ExportedDocument
+
+configure_logging()
+logger = logging.getLogger(__name__)
+
+# how often the supervisor checks a busy worker's memory and liveness
+POLL_INTERVAL_SECONDS = 0.5
+
+
+def _worker_main(conn: Connection, profiles: Dict[str, Dict[str, Any]]) -> None:
+    """
+    Entry point of a Docling worker process.
+
+    Builds a converter per profile, reports ready, then converts the jobs
+    received on the pipe until it is closed.
+
+    Args:
+        conn (Connection): Worker end of the supervisor pipe
+        profiles (Dict[str, Dict[str, Any]]): PdfPipelineOptions per profile
+    """
+    # imported here so only the worker processes load the Docling models
+    from docling.datamodel.base_models import DocumentStream
+    from src.services.parser.converter_pool import build_converter
+    from src.services.parser.docling_export import export_document
+
+    converters = {name: build_converter(options) for name, options in profiles.items()}
+    conn.send(("ready", os.getpid()))
+
+    while True:
+        try:
+            source, profile, name = conn.recv()
+        except EOFError:
+            break
+        try:
+            if isinstance(source, bytes):
+                source = DocumentStream(name=name, stream=BytesIO(source))
+            exported = export_document(converters[profile].convert(source).document)
+            conn.send(("ok", exported))
+        except Exception as e:
+            conn.send(("error", str(e)))
+
+
+def _rss_bytes(pid: int) -> Optional[int]:
+    """Reads the resident set size of a process, None where /proc is missing."""
+    try:
+        with open(f"/proc/{pid}/statm") as statm:
+            return int(statm.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, IndexError):
+        return None
+
+
+class DoclingWorker:
+    """A Docling worker process and the supervisor end of its pipe"""
+
+    def __init__(self, context, profiles: Dict[str, Dict[str, Any]]):
+        self.conn, child_conn = context.Pipe()
+        self.process = context.Process(
+            target=_worker_main, args=(child_conn, profiles), daemon=True
+        )
+        self.process.start()
+        child_conn.close()
+        self.jobs = 0
+        self.ready = False
+
+    def stop(self) -> None:
+        """Kills the process and closes the pipe."""
+        if self.process.is_alive():
+            self.process.kill()
+        self.process.join(timeout=5)
+        self.conn.close()
+
+
+class DoclingWorkerPool:
+    """
+    Supervised pool of processes running Docling conversions.
+
+    Every job gets a wall-clock timeout, and the worker's resident memory is
+    checked while it runs. A worker that times out, exceeds ``max_rss_bytes``
+    or dies is killed and replaced, and the job fails with a
+    ``ResumeParsingError`` instead of taking the API process down. Workers
+    are recycled after ``max_jobs`` conversions to release leaked memory.
+
+    No process is started on construction, so importing the API does not
+    spawn workers. They start with ``start``, called from the app lifespan,
+    or with the first conversion.
+    """
+
+    def __init__(
+        self,
+        profiles: Dict[str, Dict[str, Any]],
+        workers: int,
+        job_timeout: float,
+        max_rss_bytes: int,
+        max_jobs: int,
+        startup_timeout: float = 300,
+    ):
+        self.profiles = profiles
+        self.workers = workers
+        self.job_timeout = job_timeout
+        self.max_rss_bytes = max_rss_bytes
+        self.max_jobs = max_jobs
+        self.startup_timeout = startup_timeout
+
+        # spawn keeps torch and Docling thread pools out of forked children
+        self._context = multiprocessing.get_context("spawn")
+        self._idle: "queue.Queue[DoclingWorker]" = queue.Queue()
+        self._all = []
+        self._lock = threading.Lock()
+        self._start_lock = threading.Lock()
+        self._started = False
+        self._counters = {
+            "jobs": 0,
+            "failed": 0,
+            "timeouts": 0,
+            "queue_timeouts": 0,
+            "memory_kills": 0,
+            "crashes": 0,
+            "recycled": 0,
+        }
+
+        register_metrics("docling_workers", self.metrics)
+
+    @classmethod
+    def from_config(cls) -> "DoclingWorkerPool":
+        """Create pool from application settings"""
+        return cls(
+            profiles=APP_CONFIG["CONVERTER_PROFILES"],
+            workers=APP_CONFIG["DOCLING_WORKERS"],
+            job_timeout=APP_CONFIG["DOCLING_JOB_TIMEOUT_SECONDS"],
+            max_rss_bytes=APP_CONFIG["DOCLING_WORKER_MAX_RSS_BYTES"],
+            max_jobs=APP_CONFIG["DOCLING_WORKER_MAX_JOBS"],
+        )
+
+    def start(self) -> None:
+        """Starts the worker processes, once."""
+        with self._start_lock:
+            if self._started:
+                return
+            logger.info(f"Starting {self.workers} Docling worker processes")
+            for _ in range(self.workers):
+                self._idle.put(self._spawn())
+            self._started = True
+
+    def validate_profile(self, profile: str) -> None:
+        """Raises ResumeParsingError for an unknown profile name."""
+        if profile not in self.profiles:
+            raise ResumeParsingError(
+                message=f"Unknown converter profile. Use {list(self.profiles)}",
+                code=1005,
+                details={"profile": profile},
+            )
+
+    def convert(
+        self, source: Union[str, bytes], profile: str, name: str = "resume.pdf"
+    ) -> ExportedDocument:
+        """
+        Converts a document in a worker process.
+
+        Args:
+            source (Union[str, bytes]): Path or content of the PDF
+            profile (str): Name of the pipeline profile
+            name (str): File name reported to Docling for in-memory content
+
+        Returns:
+            ExportedDocument: Raw and cleaned markdown and plain text
+
+        Raises:
+            ResumeParsingError: If no worker frees up or the job times out,
+                the worker exceeds its memory limit or dies, or Docling fails
+        """
+        self.validate_profile(profile)
+        self.start()
+        try:
+            # a busy worker finishes or is killed within job_timeout, waiting
+            # longer means the backlog exceeds the pool
+            worker = self._idle.get(timeout=self.job_timeout)
+        except queue.Empty:
+            with self._lock:
+                self._counters["queue_timeouts"] += 1
+            logger.error(f"No Docling worker freed up within {self.job_timeout}s")
+            raise ResumeParsingError(
+                message=f"No Docling worker freed up within {self.job_timeout}s",
+                code=1006,
+                details={"workers": self.workers},
+            )
+        try:
+            self._wait_ready(worker)
+            worker.conn.send((source, profile, name))
+            status, payload = self._wait_result(worker)
+        except BaseException:
+            # the worker may be mid-job, so it is never handed out again
+            with self._lock:
+                self._counters["failed"] += 1
+            worker = self._replace(worker)
+            raise
+        else:
+            worker = self._maybe_recycle(worker)
+        finally:
+            self._idle.put(worker)
+
+        with self._lock:
+            self._counters["jobs"] += 1
+        if status == "error":
+            raise ResumeParsingError(
+                message="Docling conversion failed",
+                code=1009,
+                details={"profile": profile, "error": payload},
+            )
+        return payload
+
+    def _wait_ready(self, worker: DoclingWorker) -> None:
+        """Waits for a fresh worker to finish loading its converters."""
+        if worker.ready:
+            return
+        if not worker.conn.poll(self.startup_timeout):
+            raise self._failure(worker, "crashes", "Docling worker failed to start")
+        try:
+            worker.conn.recv()
+        except EOFError:
+            raise self._failure(worker, "crashes", "Docling worker failed to start")
+        worker.ready = True
+
+    def _wait_result(self, worker: DoclingWorker) -> tuple:
+        """Waits for the job result while enforcing the timeout and memory cap."""
+        deadline = time.monotonic() + self.job_timeout
+        while True:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                raise self._failure(
+                    worker,
+                    "timeouts",
+                    f"Docling conversion timed out after {self.job_timeout}s",
+                    code=1006,
+                )
+            if worker.conn.poll(min(POLL_INTERVAL_SECONDS, remaining)):
+                try:
+                    return worker.conn.recv()
+                except EOFError:
+                    raise self._failure(worker, "crashes", "Docling worker died")
+
+            if not worker.process.is_alive():
+                raise self._failure(worker, "crashes", "Docling worker died")
+            rss = _rss_bytes(worker.process.pid)
+            if rss is not None and rss > self.max_rss_bytes:
+                raise self._failure(
+                    worker,
+                    "memory_kills",
+                    f"Docling worker exceeded {self.max_rss_bytes} bytes of memory",
+                    code=1007,
+                    details={"rss_bytes": rss},
+                )
+
+    def _failure(
+        self,
+        worker: DoclingWorker,
+        counter: str,
+        message: str,
+        code: int = 1008,
+        details: Optional[Dict[str, Any]] = None,
+    ) -> ResumeParsingError:
+        """Counts a killed job and builds the error reported to the caller."""
+        logger.error(f"{message} (pid {worker.process.pid})")
+        with self._lock:
+            self._counters[counter] += 1
+        return ResumeParsingError(
+            message=message,
+            code=code,
+            details={"pid": worker.process.pid, **(details or {})},
+        )
+
+    def _maybe_recycle(self, worker: DoclingWorker) -> DoclingWorker:
+        """Replaces a worker that reached its job limit."""
+        worker.jobs += 1
+        if worker.jobs < self.max_jobs:
+            return worker
+        logger.info(
+            f"Recycling Docling worker {worker.process.pid} after {worker.jobs} jobs"
+        )
+        with self._lock:
+            self._counters["recycled"] += 1
+        return self._replace(worker)
+
+    def _spawn(self) -> DoclingWorker:
+        """Starts a worker process."""
+        worker = DoclingWorker(self._context, self.profiles)
+        with self._lock:
+            self._all.append(worker)
+        return worker
+
+    def _replace(self, worker: DoclingWorker) -> DoclingWorker:
+        """Stops a worker and starts a fresh one in its place."""
+        worker.stop()
+        with self._lock:
+            if worker in self._all:
+                self._all.remove(worker)
+        return self._spawn()
+
+    def metrics(self) -> Dict[str, Any]:
+        """Returns job outcome counters and the memory of live workers."""
+        with self._lock:
+            snapshot = dict(self._counters)
+            workers = list(self._all)
+
+        snapshot["idle_workers"] = self._idle.qsize()
+        snapshot["worker_rss_bytes"] = {
+            worker.process.pid: _rss_bytes(worker.process.pid)
+            for worker in workers
+            if worker.process.is_alive()
+        }
+        return snapshot
+
+    def shutdown(self) -> None:
+        """Stops all worker processes."""
+        with self._start_lock:
+            with self._lock:
+                workers, self._all = self._all, []
+            for worker in workers:
+                worker.stop()
+            while not self._idle.empty():
+                self._idle.get_nowait()
+            self._started = False
@@ -25,12 +25,16 @@ class EntityExtractor:
             value_type = type(value).__name__
             logger.info(f"Key: {key}, Type: {value_type}")
 
-    def extract_entities(self, resume_data: Dict[str, Any]) -> Dict[str, Any]:
+    def extract_entities(
+        self, resume_data: Dict[str, Any], partial: bool = False
+    ) -> Dict[str, Any]:
         """
         Extracts and organizes entities from resume data.
 
         Args:
             resume_data (Dict[str, Any]): Dictionary containing resume sections
+            partial (bool): Sections are still streaming, so missing fields
+                are rendered as "-" instead of raising
 
         Returns:
             Dict[str, Any]: Dictionary containing organized resume entities
@@ -43,7 +47,8 @@ class EntityExtractor:
             self.log_dict_value_types(resume_data)
 
             # Validate resume data
-            self._validate_resume_data(resume_data)
+            if not partial:
+                self._validate_resume_data(resume_data)
 
             # Extract basic fields
             entities = self._extract_basic_fields(resume_data)
@@ -53,7 +58,7 @@ class EntityExtractor:
             entities.update(education_info)
 
             # Validate extracted entities
-            if not any(entities.values()):
+            if not partial and not any(entities.values()):
                 raise ResumeParsingError(
                     message="No valid entities extracted",
                     code=5004,
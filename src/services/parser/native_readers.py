@@ -0,0 +1,306 @@
+# standard library imports
+import re
+import codecs
+import zipfile
+from io import BytesIO
+from xml.etree import ElementTree
+from typing import Callable, Dict, List, Optional, Tuple
+
+# third party imports
+from bs4 import BeautifulSoup
+from bs4.element import NavigableString, PreformattedString, Tag
+
+# local imports
+from configs.config import APP_CONFIG
+from src.services.parser.exceptions import ResumeParsingError
+
+UNSUPPORTED_FORMAT_CODE = 1010
+
+# WordprocessingML namespace of word/document.xml
+W_NS = "{http://schemas.openxmlformats.org/wordprocessingml/2006/main}"
+
+HTML_SKIP_TAGS = {"script", "style", "head", "noscript", "template", "svg"}
+HTML_HEADING_TAGS = {"h1", "h2", "h3", "h4", "h5", "h6"}
+HTML_BLOCK_TAGS = {
+    "address", "article", "aside", "blockquote", "body", "dd", "div", "dl",
+    "dt", "fieldset", "figure", "footer", "form", "header", "html", "main",
+    "nav", "ol", "p", "pre", "section", "table", "tbody", "tfoot", "thead",
+    "ul",
+}  # fmt: skip
+
+# a block is (kind, level, content): kind is "heading", "item", "para" or
+# "table", content is the text or, for tables, the list of row cells
+Block = Tuple[str, int, object]
+
+
+def sniff_format(head: bytes) -> Optional[str]:
+    """
+    Detects the resume format from the leading bytes of the file.
+
+    Args:
+        head (bytes): At least the first kilobyte of the file
+
+    Returns:
+        Optional[str]: "pdf", "docx", "html" or "txt", None if unsupported
+    """
+    if b"%PDF-" in head[:1024]:
+        return "pdf"
+    if head.startswith(b"PK\x03\x04"):
+        # DOCX is a zip package, the document part name is checked on read
+        return "docx"
+    if b"\x00" in head:
+        return None
+
+    text = head.lstrip(b"\xef\xbb\xbf \t\r\n").lower()
+    if text.startswith((b"<!doctype html", b"<html")) or b"<body" in text:
+        return "html"
+    try:
+        # incremental, so a character cut at the end of head is not an error
+        codecs.getincrementaldecoder("utf-8")().decode(head, final=False)
+    except UnicodeDecodeError:
+        return None
+    return "txt"
+
+
+def read_docx(data: bytes) -> Tuple[str, str]:
+    """
+    Extracts markdown and plain text from the XML of a DOCX file.
+
+    Headings come from the paragraph style, list items from the numbering
+    properties and tables are kept row by row.
+
+    Args:
+        data (bytes): DOCX file content
+
+    Returns:
+        Tuple[str, str]: Markdown and plain text
+
+    Raises:
+        ResumeParsingError: If the file is not a DOCX package or its document
+            part is larger than ``DOCX_MAX_XML_BYTES`` uncompressed
+    """
+    max_bytes = APP_CONFIG["DOCX_MAX_XML_BYTES"]
+    try:
+        with zipfile.ZipFile(BytesIO(data)) as package:
+            # the declared size bounds what read() inflates, check it first
+            info = package.getinfo("word/document.xml")
+            if info.file_size > max_bytes:
+                raise ResumeParsingError(
+                    message="DOCX document is too large",
+                    code=UNSUPPORTED_FORMAT_CODE,
+                    details={"size": info.file_size, "max_size": max_bytes},
+                )
+            root = ElementTree.fromstring(package.read(info))
+    except (zipfile.BadZipFile, KeyError, ElementTree.ParseError) as e:
+        raise ResumeParsingError(
+            message="Invalid DOCX file",
+            code=UNSUPPORTED_FORMAT_CODE,
+            details={"error": str(e)},
+        )
+
+    blocks: List[Block] = []
+    body = root.find(f"{W_NS}body")
+    if body is not None:
+        _docx_blocks(body, blocks)
+    return _render(blocks)
+
+
+def _docx_blocks(container: ElementTree.Element, blocks: List[Block]) -> None:
+    """Appends the paragraphs and tables of the body or a content control."""
+    for element in container:
+        if element.tag == f"{W_NS}p":
+            blocks.append(_docx_paragraph(element))
+        elif element.tag == f"{W_NS}tbl":
+            blocks.extend(_docx_table(element))
+        elif element.tag == f"{W_NS}sdt":
+            # content controls, used by many templates, wrap whole blocks
+            content = element.find(f"{W_NS}sdtContent")
+            if content is not None:
+                _docx_blocks(content, blocks)
+
+
+def _docx_table(table: ElementTree.Element) -> List[Block]:
+    """
+    Converts a table, kept as rows when it holds data.
+
+    Many resume templates lay the page out with a table, putting headings,
+    several paragraphs or further tables in one cell. Such a table is
+    flattened into the blocks of its cells, read row by row.
+    """
+    cells = []
+    for row in table.findall(f"{W_NS}tr"):
+        row_cells = []
+        for cell in row.findall(f"{W_NS}tc"):
+            cell_blocks: List[Block] = []
+            _docx_blocks(cell, cell_blocks)
+            row_cells.append([block for block in cell_blocks if block[2]])
+        cells.append(row_cells)
+
+    layout = any(
+        len(cell_blocks) > 1 or (cell_blocks and cell_blocks[0][0] != "para")
+        for row_cells in cells
+        for cell_blocks in row_cells
+    )
+    if layout:
+        return [
+            block
+            for row_cells in cells
+            for cell_blocks in row_cells
+            for block in cell_blocks
+        ]
+    rows = [
+        [cell_blocks[0][2] if cell_blocks else "" for cell_blocks in row_cells]
+        for row_cells in cells
+    ]
+    return [("table", 0, rows)]
+
+
+def _docx_text(element: ElementTree.Element) -> str:
+    """Collects the run text of a paragraph or table cell."""
+    parts = []
+    for node in element.iter():
+        if node.tag == f"{W_NS}t" and node.text:
+            parts.append(node.text)
+        elif node.tag in (f"{W_NS}tab", f"{W_NS}br", f"{W_NS}cr"):
+            parts.append(" ")
+    return " ".join("".join(parts).split())
+
+
+def _docx_paragraph(paragraph: ElementTree.Element) -> Block:
+    """Classifies a paragraph by its style and numbering."""
+    text = _docx_text(paragraph)
+    properties = paragraph.find(f"{W_NS}pPr")
+    if properties is None:
+        return ("para", 0, text)
+
+    style = properties.find(f"{W_NS}pStyle")
+    style_name = style.get(f"{W_NS}val", "") if style is not None else ""
+    if style_name == "Title":
+        return ("heading", 1, text)
+    heading = re.match(r"Heading(\d)", style_name)
+    if heading:
+        return ("heading", int(heading.group(1)) + 1, text)
+    if properties.find(f"{W_NS}numPr") is not None or style_name == "ListParagraph":
+        return ("item", 0, text)
+    return ("para", 0, text)
+
+
+def read_html(data: bytes) -> Tuple[str, str]:
+    """
+    Extracts markdown and plain text from an HTML resume.
+
+    Args:
+        data (bytes): HTML file content
+
+    Returns:
+        Tuple[str, str]: Markdown and plain text
+    """
+    soup = BeautifulSoup(data, "html.parser")
+    blocks: List[Block] = []
+    _html_blocks(soup, blocks)
+    return _render(blocks)
+
+
+def _html_blocks(node: Tag, blocks: List[Block]) -> None:
+    """Walks the HTML tree and appends its headings, items, paragraphs and tables."""
+    inline: List[str] = []
+
+    def flush() -> None:
+        text = " ".join("".join(inline).split())
+        if text:
+            blocks.append(("para", 0, text))
+        inline.clear()
+
+    for child in node.children:
+        if isinstance(child, PreformattedString):
+            # comments, doctype and processing instructions
+            continue
+        if isinstance(child, NavigableString):
+            inline.append(str(child))
+            continue
+        if not isinstance(child, Tag) or child.name in HTML_SKIP_TAGS:
+            continue
+
+        if child.name == "br":
+            flush()
+        elif child.name in HTML_HEADING_TAGS:
+            flush()
+            level = int(child.name[1])
+            blocks.append(("heading", level, " ".join(child.get_text(" ").split())))
+        elif child.name == "li":
+            flush()
+            blocks.append(("item", 0, " ".join(child.get_text(" ").split())))
+        elif child.name == "table":
+            flush()
+            rows = [
+                [
+                    " ".join(cell.get_text(" ").split())
+                    for cell in row.find_all(["td", "th"])
+                ]
+                for row in child.find_all("tr")
+            ]
+            blocks.append(("table", 0, rows))
+        elif child.name in HTML_BLOCK_TAGS:
+            flush()
+            _html_blocks(child, blocks)
+        else:
+            inline.append(child.get_text(" "))
+    flush()
+
+
+def read_txt(data: bytes) -> Tuple[str, str]:
+    """
+    Decodes a plain text resume, used as both markdown and plain text.
+
+    Args:
+        data (bytes): Text file content
+
+    Returns:
+        Tuple[str, str]: Markdown and plain text
+
+    Raises:
+        ResumeParsingError: If the file is not UTF-8 text
+    """
+    try:
+        text = data.decode("utf-8-sig")
+    except UnicodeDecodeError as e:
+        raise ResumeParsingError(
+            message="Text resume is not UTF-8 encoded",
+            code=UNSUPPORTED_FORMAT_CODE,
+            details={"error": str(e)},
+        )
+    text = text.replace("\r\n", "\n").replace("\r", "\n")
+    return text, text
+
+
+def _render(blocks: List[Block]) -> Tuple[str, str]:
+    """Renders blocks like the Docling export: markdown and plain text."""
+    md_parts, text_parts = [], []
+    for kind, level, content in blocks:
+        if kind == "table":
+            rows = [row for row in content if any(row)]
+            if not rows:
+                continue
+            lines = ["| " + " | ".join(row) + " |" for row in rows]
+            lines.insert(1, "|" + "---|" * len(rows[0]))
+            md_parts.append("\n".join(lines))
+            text_parts.append("\n".join("\t".join(row) for row in rows))
+        elif not content:
+            continue
+        elif kind == "heading":
+            md_parts.append("#" * max(level, 1) + f" {content}")
+            text_parts.append(content)
+        elif kind == "item":
+            md_parts.append(f"- {content}")
+            text_parts.append(content)
+        else:
+            md_parts.append(content)
+            text_parts.append(content)
+    return "\n\n".join(md_parts), "\n\n".join(text_parts)
+
+
+NATIVE_READERS: Dict[str, Callable[[bytes], Tuple[str, str]]] = {
+    "docx": read_docx,
+    "html": read_html,
+    "txt": read_txt,
+}
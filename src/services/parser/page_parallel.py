@@ -0,0 +1,167 @@
+# standard library imports
+import logging
+import threading
+import multiprocessing
+from io import BytesIO
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Any, Dict, List, Optional, Tuple
+
+# third party imports
+import fitz
+from docling.datamodel.base_models import DocumentStream
+from docling.document_converter import DocumentConverter
+
+# local imports
+from configs.config import APP_CONFIG
+from utils.logging_config import configure_logging
+from utils.pre_processing import clean_text_md
+from src.services.parser.converter_pool import build_converter
+from src.services.parser.docling_export import ExportedDocument, export_document
+from src.services.parser.docling_workers import DoclingWorkerPool
+
+configure_logging()
+logger = logging.getLogger(__name__)
+
+# converters built inside a worker process, one per profile
+_worker_converters: Dict[str, DocumentConverter] = {}
+
+
+def convert_chunk(
+    pdf_bytes: bytes, profile: str, profile_options: Dict[str, Any]
+) -> Tuple[str, str]:
+    """
+    Converts one page range inside a worker process.
+
+    Args:
+        pdf_bytes (bytes): PDF holding only the pages of the chunk
+        profile (str): Name of the pipeline profile
+        profile_options (Dict[str, Any]): PdfPipelineOptions of the profile
+
+    Returns:
+        Tuple[str, str]: Markdown and plain text of the chunk
+    """
+    converter = _worker_converters.get(profile)
+    if converter is None:
+        converter = _worker_converters[profile] = build_converter(profile_options)
+
+    source = DocumentStream(name="chunk.pdf", stream=BytesIO(pdf_bytes))
+    exported = export_document(converter.convert(source).document)
+    return exported.md_text, exported.plain_text
+
+
+def split_pdf(doc: fitz.Document, chunk_pages: int) -> List[bytes]:
+    """Splits a PDF into consecutive page ranges of ``chunk_pages`` pages."""
+    chunks = []
+    for first in range(0, doc.page_count, chunk_pages):
+        last = min(first + chunk_pages, doc.page_count) - 1
+        with fitz.open() as chunk:
+            chunk.insert_pdf(doc, from_page=first, to_page=last)
+            chunks.append(chunk.tobytes())
+    return chunks
+
+
+class PageParallelConverter:
+    """
+    Converts long PDFs by splitting them into page ranges that are converted
+    in parallel worker processes and stitched back together in page order.
+
+    With a ``worker_pool`` the chunks are sent to the supervised Docling
+    workers, otherwise to a process pool owned by this converter.
+    """
+
+    def __init__(
+        self,
+        threshold: int,
+        chunk_pages: int,
+        workers: int,
+        worker_pool: Optional[DoclingWorkerPool] = None,
+    ):
+        self.threshold = threshold
+        self.chunk_pages = chunk_pages
+        self.worker_pool = worker_pool
+        self.workers = worker_pool.workers if worker_pool else workers
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_config(
+        cls, worker_pool: Optional[DoclingWorkerPool] = None
+    ) -> "PageParallelConverter":
+        """Create converter from application settings"""
+        return cls(
+            threshold=APP_CONFIG["PAGE_PARALLEL_THRESHOLD"],
+            chunk_pages=APP_CONFIG["PAGE_PARALLEL_CHUNK_PAGES"],
+            workers=APP_CONFIG["PAGE_PARALLEL_WORKERS"],
+            worker_pool=worker_pool,
+        )
+
+    def applies_to(self, page_count: int) -> bool:
+        """Whether a document is long enough to be split (0 disables)."""
+        return 0 < self.threshold <= page_count
+
+    def convert(
+        self, doc: fitz.Document, profile: str, profile_options: Dict[str, Any]
+    ) -> ExportedDocument:
+        """
+        Converts a document chunk by chunk in worker processes.
+
+        Args:
+            doc (fitz.Document): Opened PDF
+            profile (str): Name of the pipeline profile
+            profile_options (Dict[str, Any]): PdfPipelineOptions of the profile
+
+        Returns:
+            ExportedDocument: Stitched raw and cleaned markdown and plain text
+        """
+        chunks = split_pdf(doc, self.chunk_pages)
+        logger.info(
+            f"Converting {doc.page_count} pages as {len(chunks)} parallel chunks"
+        )
+
+        if self.worker_pool:
+            results = self._convert_isolated(chunks, profile)
+        else:
+            executor = self._get_executor()
+            results = list(
+                executor.map(
+                    convert_chunk,
+                    chunks,
+                    [profile] * len(chunks),
+                    [profile_options] * len(chunks),
+                )
+            )
+
+        md_text = "\n\n".join(md for md, _ in results if md)
+        plain_text = "\n\n".join(plain for _, plain in results if plain)
+        return ExportedDocument(
+            md_text, plain_text, clean_text_md(md_text), clean_text_md(plain_text)
+        )
+
+    def _convert_isolated(
+        self, chunks: List[bytes], profile: str
+    ) -> List[Tuple[str, str]]:
+        """Sends the chunks to the Docling workers, one thread per worker."""
+        with ThreadPoolExecutor(max_workers=self.workers) as threads:
+            exported = threads.map(
+                lambda chunk: self.worker_pool.convert(chunk, profile, "chunk.pdf"),
+                chunks,
+            )
+            return [(doc.md_text, doc.plain_text) for doc in exported]
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        """Starts the worker processes on first use."""
+        with self._lock:
+            if self._executor is None:
+                # spawn keeps torch and Docling thread pools out of forked children
+                self._executor = ProcessPoolExecutor(
+                    max_workers=self.workers,
+                    mp_context=multiprocessing.get_context("spawn"),
+                )
+            return self._executor
+
+    def shutdown(self) -> None:
+        """Stops the worker processes."""
+        with self._lock:
+            if self._executor is not None:
+                self._executor.shutdown(cancel_futures=True)
+                self._executor = None
@@ -42,7 +42,7 @@ class QuestionGenerator:
 
         return formatted_output
 
-    def process_skills(
+    async def process_skills(
         self,
         model: str,
         skills: Union[str, List[str]],
@@ -137,7 +137,7 @@ class QuestionGenerator:
                 )
 
             # Generate questions
-            questions = main_parser_obj.generate_questions_for_skills(
+            questions = await main_parser_obj.generate_questions_for_skills(
                 model, skills, adhoc_skill, num_questions, yoe
             )
 
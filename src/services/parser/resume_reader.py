@@ -1,61 +1,156 @@
 # standard library imports
 import os
+import time
 import logging
-from typing import Optional
+import threading
+from io import BytesIO
+from dataclasses import dataclass
+from typing import Dict, Any, Optional, Tuple, Union
 
 # third party imports
 import fitz
-from docling.document_converter import DocumentConverter
+import pymupdf4llm
+from docling.datamodel.base_models import DocumentStream
 
 # local imports
+from configs.config import APP_CONFIG
 from utils.logging_config import configure_logging
+from utils.metrics import register_metrics
+from utils.pre_processing import PAGE_BREAK, clean_text_md
 from src.services.parser.exceptions import ResumeParsingError
+from src.services.parser.docling_export import ExportedDocument, export_document
+from src.services.parser.converter_pool import ConverterPool
+from src.services.parser.docling_workers import DoclingWorkerPool
+from src.services.parser.page_parallel import PageParallelConverter
+from src.services.parser.native_readers import (
+    NATIVE_READERS,
+    UNSUPPORTED_FORMAT_CODE,
+    sniff_format,
+)
 
 configure_logging()
 logger = logging.getLogger(__name__)
 
+# bump when extraction output changes, cached extractions are keyed by it
+READER_VERSION = 5
+
+# Docling worker timeouts, memory kills and crashes are reported unchanged
+WORKER_ERROR_CODES = (1006, 1007, 1008)
+REPORTED_ERROR_CODES = WORKER_ERROR_CODES + (UNSUPPORTED_FORMAT_CODE,)
+
+# leading bytes read from disk to sniff the file format
+SNIFF_BYTES = 2048
+
+
+@dataclass
+class ReadResult:
+    """Text extracted from a resume and how it was obtained"""
+
+    md_text: str
+    plain_text: str
+    clean_md: str
+    clean_plain: str
+    route: str
+    elapsed: float
+    saved: float = 0.0
+
+    def report(self) -> Dict[str, Any]:
+        """Returns the per-request reader report."""
+        return {
+            "route": self.route,
+            "elapsed_ms": round(self.elapsed * 1000),
+            "saved_ms": round(self.saved * 1000),
+        }
+
+
+@dataclass
+class PdfLayout:
+    """Text-layer statistics used to pick the extraction route"""
+
+    page_count: int
+    chars_per_page: float
+    image_only_pages: int
+    multi_column_pages: int
+
 
 class ResumeReader:
     """
     Handles reading and extracting text content from resume files.
 
+    PDFs go through PyMuPDF or Docling, DOCX, HTML and text files are read
+    natively. The format is sniffed from the file content.
+
     Attributes:
         supported_formats (List[str]): List of supported output formats
     """
 
     def __init__(self):
         self.supported_formats = ["html", "text"]
-        self.converter = DocumentConverter()
+        self.profiles = APP_CONFIG["CONVERTER_PROFILES"]
+        self.default_profile = APP_CONFIG["DEFAULT_CONVERTER_PROFILE"]
+        if APP_CONFIG["DOCLING_ISOLATION"]:
+            # Docling models are loaded in the worker processes only
+            self.worker_pool = DoclingWorkerPool.from_config()
+            self.converter_pool = None
+        else:
+            self.worker_pool = None
+            self.converter_pool = ConverterPool.from_config()
+        self.page_parallel = PageParallelConverter.from_config(self.worker_pool)
+        self.fast_path = APP_CONFIG["READER_FAST_PATH"]
+        self.min_chars_per_page = APP_CONFIG["FAST_PATH_MIN_CHARS_PER_PAGE"]
+
+        # running Docling cost per page, used to estimate fast path savings
+        self._docling_sec_per_page = APP_CONFIG["DOCLING_SEC_PER_PAGE_ESTIMATE"]
+        self._lock = threading.Lock()
+        self._route_counts = {
+            "docling": 0,
+            "docling_parallel": 0,
+            "fast": 0,
+            "text": 0,
+            **{fmt: 0 for fmt in NATIVE_READERS},
+        }
+        self._saved_total = 0.0
+        register_metrics("resume_reader", self.metrics)
+
+    def metrics(self) -> Dict[str, Any]:
+        """Returns route counts and the estimated time saved by the fast path."""
+        with self._lock:
+            return {
+                "routes": dict(self._route_counts),
+                "saved_seconds_total": round(self._saved_total, 3),
+                "docling_sec_per_page": round(self._docling_sec_per_page, 3),
+            }
 
-    def read_resume(self, path: str, output_type: str) -> Optional[str]:
+    def read_resume(
+        self, path: str, output_type: str, profile: Optional[str] = None
+    ) -> ReadResult:
         """
         Reads and extracts text from resume file.
 
         Args:
             path (str): Path to resume file
             output_type (str): Output format ("html" or "text")
+            profile (Optional[str]): Docling pipeline profile, default if None
 
         Returns:
-            Optional[str]: Extracted text content or None if extraction fails
+            ReadResult: Extracted markdown and plain text with route details
 
         Raises:
             ResumeParsingError: If file reading fails or format is unsupported
         """
         try:
             self._validate_inputs(path, output_type)
+            return self._extract(path, output_type, profile or self.default_profile)
 
-            if output_type == "html":
-                result = self.converter.convert(path)
-                md_text = (
-                    result.document.export_to_markdown()
-                )  # or pymupdf4llm.to_markdown(path)
-                plain_text = result.document.export_to_text()
-            else:
-                with fitz.open(path) as doc:
-                    text = " ".join(page.get_text() for page in doc)
-                    md_text, plain_text = text, text
-            return md_text, plain_text
-
+        except ResumeParsingError as e:
+            if e.code in REPORTED_ERROR_CODES:
+                raise
+            logger.error(f"Error reading resume: {e}")
+            raise ResumeParsingError(
+                message="Failed to read resume file",
+                code=1003,
+                details={"path": path, "error": str(e)},
+            )
         except Exception as e:
             logger.error(f"Error reading resume: {e}")
             raise ResumeParsingError(
@@ -64,13 +159,265 @@ class ResumeReader:
                 details={"path": path, "error": str(e)},
             )
 
+    def read_resume_bytes(
+        self,
+        data: bytes,
+        output_type: str,
+        name: str = "resume.pdf",
+        profile: Optional[str] = None,
+    ) -> ReadResult:
+        """
+        Reads and extracts text from an in-memory resume file.
+
+        Docling and PyMuPDF are fed directly from the buffer, so no temporary
+        file is written.
+
+        Args:
+            data (bytes): Resume file content
+            output_type (str): Output format ("html" or "text")
+            name (str): File name reported to Docling
+            profile (Optional[str]): Docling pipeline profile, default if None
+
+        Returns:
+            ReadResult: Extracted markdown and plain text with route details
+
+        Raises:
+            ResumeParsingError: If reading fails or format is unsupported
+        """
+        try:
+            self._validate_output_type(output_type)
+            if not data:
+                raise ResumeParsingError(
+                    message="Resume content is empty", code=1004, details={"name": name}
+                )
+            return self._extract(
+                data, output_type, profile or self.default_profile, name
+            )
+
+        except ResumeParsingError as e:
+            if e.code in REPORTED_ERROR_CODES:
+                raise
+            logger.error(f"Error reading resume from memory: {e}")
+            raise ResumeParsingError(
+                message="Failed to read resume file",
+                code=1003,
+                details={"name": name, "error": str(e)},
+            )
+        except Exception as e:
+            logger.error(f"Error reading resume from memory: {e}")
+            raise ResumeParsingError(
+                message="Failed to read resume file",
+                code=1003,
+                details={"name": name, "error": str(e)},
+            )
+
+    def _extract(
+        self,
+        source: Union[str, bytes],
+        output_type: str,
+        profile: str,
+        name: str = "resume.pdf",
+    ) -> ReadResult:
+        """Extracts markdown and plain text from a path or an in-memory buffer."""
+        (self.worker_pool or self.converter_pool).validate_profile(profile)
+        start = time.perf_counter()
+
+        if isinstance(source, bytes):
+            file_format = sniff_format(source[:SNIFF_BYTES])
+        else:
+            with open(source, "rb") as file:
+                file_format = sniff_format(file.read(SNIFF_BYTES))
+        if file_format is None:
+            raise ResumeParsingError(
+                message="Unsupported resume format, use PDF, DOCX, HTML or UTF-8 text",
+                code=UNSUPPORTED_FORMAT_CODE,
+                details={"name": name},
+            )
+        if file_format != "pdf":
+            return self._read_native(source, file_format, output_type, start)
+
+        in_memory = isinstance(source, bytes)
+
+        doc = fitz.open(stream=source, filetype="pdf") if in_memory else fitz.open(source)
+        with doc:
+            if output_type == "text":
+                text = " ".join(page.get_text() for page in doc)
+                return self._finish(text, text, "text", start)
+
+            page_count = doc.page_count
+            if self.fast_path:
+                layout = self._inspect_layout(doc)
+                if self._has_clean_text_layer(layout):
+                    # page breaks are marked so compaction can find headers
+                    pages = pymupdf4llm.to_markdown(
+                        doc, page_chunks=True, show_progress=False
+                    )
+                    md_text = f"{PAGE_BREAK}\n\n".join(page["text"] for page in pages)
+                    plain_text = f"\n{PAGE_BREAK}\n".join(
+                        page.get_text() for page in doc
+                    )
+                    return self._finish(md_text, plain_text, "fast", start, page_count)
+                logger.info(f"Routing resume to Docling, layout {layout}")
+
+            if self.page_parallel.applies_to(page_count):
+                exported = self.page_parallel.convert(
+                    doc, profile, self.profiles[profile]
+                )
+                return self._finish(
+                    exported.md_text,
+                    exported.plain_text,
+                    "docling_parallel",
+                    start,
+                    page_count,
+                    cleaned=(exported.clean_md, exported.clean_plain),
+                )
+
+        exported = self._convert_docling(source, profile, name)
+        return self._finish(
+            exported.md_text,
+            exported.plain_text,
+            "docling",
+            start,
+            page_count,
+            cleaned=(exported.clean_md, exported.clean_plain),
+        )
+
+    def _read_native(
+        self,
+        source: Union[str, bytes],
+        file_format: str,
+        output_type: str,
+        start: float,
+    ) -> ReadResult:
+        """Reads DOCX, HTML and text resumes without Docling."""
+        if not isinstance(source, bytes):
+            with open(source, "rb") as file:
+                source = file.read()
+
+        md_text, plain_text = NATIVE_READERS[file_format](source)
+        if output_type == "text":
+            md_text = plain_text
+        return self._finish(md_text, plain_text, file_format, start)
+
+    def _convert_docling(
+        self, source: Union[str, bytes], profile: str, name: str
+    ) -> ExportedDocument:
+        """Converts a whole document in a Docling worker or in-process."""
+        if self.worker_pool:
+            return self.worker_pool.convert(source, profile, name)
+
+        if isinstance(source, bytes):
+            source = DocumentStream(name=name, stream=BytesIO(source))
+        result = self.converter_pool.convert(source, profile)
+        return export_document(result.document)
+
+    def start(self) -> None:
+        """Starts the Docling worker processes ahead of the first conversion."""
+        if self.worker_pool:
+            self.worker_pool.start()
+
+    def shutdown(self) -> None:
+        """Stops the Docling worker processes."""
+        self.page_parallel.shutdown()
+        if self.worker_pool:
+            self.worker_pool.shutdown()
+
+    def _finish(
+        self,
+        md_text: str,
+        plain_text: str,
+        route: str,
+        start: float,
+        page_count: int = 0,
+        cleaned: Optional[Tuple[str, str]] = None,
+    ) -> ReadResult:
+        """Cleans the text if needed, records route metrics and builds the result."""
+        if cleaned is None:
+            cleaned = (clean_text_md(md_text), clean_text_md(plain_text))
+        elapsed = time.perf_counter() - start
+        saved = 0.0
+        with self._lock:
+            self._route_counts[route] += 1
+            if route.startswith("docling") and page_count:
+                # exponential moving average of the Docling cost per page
+                self._docling_sec_per_page = (
+                    0.8 * self._docling_sec_per_page + 0.2 * elapsed / page_count
+                )
+            elif route == "fast":
+                saved = max(self._docling_sec_per_page * page_count - elapsed, 0.0)
+                self._saved_total += saved
+
+        result = ReadResult(md_text, plain_text, *cleaned, route, elapsed, saved)
+        logger.info(f"Resume read via {route} route: {result.report()}")
+        return result
+
+    def _inspect_layout(self, doc: fitz.Document) -> PdfLayout:
+        """Measures text density, image-only pages and column layout."""
+        total_chars, image_only, multi_column = 0, 0, 0
+        for page in doc:
+            lines = self._text_lines(page)
+            chars = sum(length for _, length in lines)
+            total_chars += chars
+
+            if chars < self.min_chars_per_page and page.get_images():
+                image_only += 1
+            if self._is_multi_column(lines, page.rect.width):
+                multi_column += 1
+
+        page_count = max(doc.page_count, 1)
+        return PdfLayout(
+            page_count=doc.page_count,
+            chars_per_page=total_chars / page_count,
+            image_only_pages=image_only,
+            multi_column_pages=multi_column,
+        )
+
+    @staticmethod
+    def _text_lines(page: fitz.Page) -> list:
+        """Returns (bbox, character count) for every non-empty text line."""
+        lines = []
+        for block in page.get_text("dict")["blocks"]:
+            if block["type"] != 0:
+                continue
+            for line in block["lines"]:
+                text = "".join(span["text"] for span in line["spans"]).strip()
+                if text:
+                    lines.append((line["bbox"], len(text)))
+        return lines
+
+    @staticmethod
+    def _is_multi_column(lines: list, page_width: float) -> bool:
+        """
+        Detects side-by-side text columns: a sizeable share of the page text
+        sits in lines confined to the left half and in lines confined to the
+        right half. Short right-aligned dates do not count as a column.
+        """
+        middle = page_width / 2
+        margin = page_width * 0.05
+        total = sum(length for _, length in lines) or 1
+        left = sum(length for bbox, length in lines if bbox[2] < middle + margin)
+        right = sum(length for bbox, length in lines if bbox[0] > middle - margin)
+        return min(left, right) / total >= 0.25
+
+    def _has_clean_text_layer(self, layout: PdfLayout) -> bool:
+        """Decides whether the PyMuPDF fast path can handle the document."""
+        return (
+            layout.page_count > 0
+            and layout.image_only_pages == 0
+            and layout.multi_column_pages == 0
+            and layout.chars_per_page >= self.min_chars_per_page
+        )
+
     def _validate_inputs(self, path: str, output_type: str) -> None:
         """Validates input parameters before processing."""
         if not os.path.exists(path):
             raise ResumeParsingError(
                 message="Resume file not found", code=1001, details={"path": path}
             )
+        self._validate_output_type(output_type)
 
+    def _validate_output_type(self, output_type: str) -> None:
+        """Validates the requested output format."""
         if output_type not in self.supported_formats:
             raise ResumeParsingError(
                 message=f"Unsupported output type. Use {self.supported_formats}",
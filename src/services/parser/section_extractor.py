@@ -1,6 +1,6 @@
 # standard library imports
 import logging
-from typing import Dict, Any
+from typing import AsyncIterator, Dict, Any, Tuple
 
 # local imports
 from models.content_parser import ResumeDataParser
@@ -17,7 +17,7 @@ main_parser_obj = ResumeDataParser()
 class SectionExtractor:
     """Handles extraction of structured sections from resume text."""
 
-    def fetch_sections(self, html_text: str, model: str) -> Dict[str, Any]:
+    async def fetch_sections(self, html_text: str, model: str) -> Dict[str, Any]:
         """
         Extracts structured sections from resume text.
 
@@ -34,7 +34,7 @@ class SectionExtractor:
         try:
             self._validate_input(html_text)
 
-            section_data = main_parser_obj.get_sections(html_text, model)
+            section_data = await main_parser_obj.get_sections(html_text, model)
             if not section_data:
                 raise ResumeParsingError(
                     message="No sections extracted from text",
@@ -51,6 +51,46 @@ class SectionExtractor:
                 details={"error": str(e)},
             )
 
+    async def stream_sections(
+        self, html_text: str, model: str
+    ) -> AsyncIterator[Tuple[str, Any]]:
+        """
+        Extracts structured sections, yielding each as the LLM completes it.
+
+        Args:
+            html_text (str): Input HTML text
+            model (str): name of model to use
+
+        Yields:
+            Tuple[str, Any]: Section name and content
+
+        Raises:
+            ResumeParsingError: If input is empty or no section was extracted
+        """
+        try:
+            self._validate_input(html_text)
+
+            count = 0
+            async for name, content in main_parser_obj.stream_sections(
+                html_text, model
+            ):
+                count += 1
+                yield name, content
+            if not count:
+                raise ResumeParsingError(
+                    message="No sections extracted from text",
+                    code=2002,
+                    details={"text_preview": html_text[:100]},
+                )
+
+        except Exception as e:
+            logger.error(f"Section extraction error: {e}")
+            raise ResumeParsingError(
+                message="Failed to extract resume sections",
+                code=2003,
+                details={"error": str(e)},
+            )
+
     def _validate_input(self, html_text: str) -> None:
         """Validates input text before processing."""
         if not html_text.strip():
@@ -0,0 +1,169 @@
+# standard library imports
+import os
+import json
+import time
+import zlib
+import sqlite3
+import logging
+import threading
+from typing import Any, Dict, Optional
+
+# local imports
+from configs.config import APP_CONFIG
+from utils.logging_config import configure_logging
+from utils.metrics import register_metrics
+from src.services.parser.resume_reader import ReadResult, READER_VERSION
+
+configure_logging()
+logger = logging.getLogger(__name__)
+
+
+class TextCache:
+    """
+    Persistent cache of resume text extraction results.
+
+    Results are stored zlib-compressed in a SQLite database, keyed by the
+    PDF content digest, the Docling profile, the output type and the reader
+    version. Once the stored payloads exceed ``max_bytes`` the least
+    recently used entries are deleted.
+    """
+
+    def __init__(self, path: str, max_bytes: int):
+        self.path = path
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._counters = {"hits": 0, "misses": 0, "writes": 0, "evictions": 0}
+
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS extractions (
+                key TEXT PRIMARY KEY,
+                payload BLOB NOT NULL,
+                size INTEGER NOT NULL,
+                last_access REAL NOT NULL
+            )
+            """
+        )
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_last_access ON extractions(last_access)"
+        )
+        self._conn.commit()
+
+        register_metrics("text_cache", self.metrics)
+
+    @classmethod
+    def from_config(cls) -> "TextCache":
+        """Create cache from application settings"""
+        return cls(
+            path=os.path.join(APP_CONFIG["CACHE_DIR"], "text_cache.sqlite3"),
+            max_bytes=APP_CONFIG["TEXT_CACHE_MAX_BYTES"],
+        )
+
+    @staticmethod
+    def make_key(digest: str, profile: str, output_type: str) -> str:
+        """Builds the cache key of an extraction."""
+        return f"{digest}:{profile}:{output_type}:v{READER_VERSION}"
+
+    def get(self, digest: str, profile: str, output_type: str) -> Optional[ReadResult]:
+        """
+        Returns a cached extraction or None on a miss.
+
+        Args:
+            digest (str): SHA-256 digest of the resume file
+            profile (str): Docling profile the text was extracted with
+            output_type (str): Reader output type
+
+        Returns:
+            Optional[ReadResult]: Cached result with zero elapsed time
+        """
+        key = self.make_key(digest, profile, output_type)
+        with self._lock:
+            try:
+                return self._read(key)
+            except (sqlite3.Error, zlib.error, ValueError, TypeError) as e:
+                # locked store, corrupt payload or stale fields: read the file
+                logger.error(f"Reading text cache entry {key} failed with error {e}")
+                self._counters["misses"] += 1
+                return None
+
+    def _read(self, key: str) -> Optional[ReadResult]:
+        """Looks an extraction up and decodes it. Caller holds the lock."""
+        row = self._conn.execute(
+            "SELECT payload FROM extractions WHERE key = ?", (key,)
+        ).fetchone()
+        if row is None:
+            self._counters["misses"] += 1
+            return None
+
+        payload = json.loads(zlib.decompress(row[0]))
+        result = ReadResult(elapsed=0.0, **payload)
+        self._conn.execute(
+            "UPDATE extractions SET last_access = ? WHERE key = ?",
+            (time.time(), key),
+        )
+        self._conn.commit()
+        self._counters["hits"] += 1
+        return result
+
+    def put(
+        self, digest: str, profile: str, output_type: str, result: ReadResult
+    ) -> None:
+        """Stores an extraction and evicts old entries beyond the size limit."""
+        key = self.make_key(digest, profile, output_type)
+        payload = zlib.compress(
+            json.dumps(
+                {
+                    "md_text": result.md_text,
+                    "plain_text": result.plain_text,
+                    "clean_md": result.clean_md,
+                    "clean_plain": result.clean_plain,
+                    "route": result.route,
+                }
+            ).encode("utf-8")
+        )
+        try:
+            with self._lock:
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO extractions VALUES (?, ?, ?, ?)",
+                    (key, payload, len(payload), time.time()),
+                )
+                self._counters["writes"] += 1
+                self._evict()
+                self._conn.commit()
+        except sqlite3.Error as e:
+            logger.error(f"Writing text cache entry {key} failed with error {e}")
+
+    def metrics(self) -> Dict[str, Any]:
+        """Returns hit/miss counters and the stored size."""
+        with self._lock:
+            entries, stored = self._conn.execute(
+                "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM extractions"
+            ).fetchone()
+            counters = dict(self._counters)
+
+        lookups = counters["hits"] + counters["misses"]
+        counters["hit_rate"] = round(counters["hits"] / lookups, 3) if lookups else 0.0
+        counters["entries"] = entries
+        counters["stored_bytes"] = stored
+        return counters
+
+    def _evict(self) -> None:
+        """Deletes least recently used entries over the limit. Caller holds the lock."""
+        (stored,) = self._conn.execute(
+            "SELECT COALESCE(SUM(size), 0) FROM extractions"
+        ).fetchone()
+        if stored <= self.max_bytes:
+            return
+
+        rows = self._conn.execute(
+            "SELECT key, size FROM extractions ORDER BY last_access ASC"
+        ).fetchall()
+        for key, size in rows:
+            if stored <= self.max_bytes:
+                break
+            self._conn.execute("DELETE FROM extractions WHERE key = ?", (key,))
+            stored -= size
+            self._counters["evictions"] += 1
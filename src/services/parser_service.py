@@ -1,28 +1,59 @@
 # standard library imports
-import os, logging
+import json, asyncio, logging, sqlite3
+from dataclasses import dataclass
+from typing import Any, AsyncIterator, Dict, Optional, Tuple, Union
 
 # third party imports
 from fastapi import UploadFile, HTTPException
 from fastapi.responses import JSONResponse
 
 # local imports
-from src.services.parser.resume_reader import ResumeReader
+from src.services.parser.resume_reader import (
+    ResumeReader,
+    UNSUPPORTED_FORMAT_CODE,
+    WORKER_ERROR_CODES,
+)
+from src.services.parser.exceptions import ResumeParsingError
+from src.services.parser.text_cache import TextCache
 from src.services.parser.section_extractor import SectionExtractor
 from src.services.parser.entity_extractor import EntityExtractor
 from src.services.parser.questions_generator import QuestionGenerator
 from src.services.analyzer.resume_analyzer import ResumeAnalyzer
+from src.services.workspace import WorkspaceStore, ParseWorkspace
 from src.schemas.parser import SkillsRequest
-from configs.config import APP_CONFIG, MODEL_MAP
-from utils.file_utils import save_upload_file
+from configs.config import APP_CONFIG, LLM_CONFIG, MODEL_MAP
+from utils.file_utils import (
+    save_upload_file,
+    read_upload_bytes,
+    save_artifact,
+    load_artifact,
+)
 from utils.html_utils import sanitize_html_content
+from utils.metrics import register_metrics
+from utils.pre_processing import CompactedText, compact_resume_text
 from utils.logging_config import configure_logging
 from utils.constants import ERROR_MESSAGES
-from utils.pre_processing import clean_text_md
 
 configure_logging()
 logger = logging.getLogger(__name__)
 
 
+@dataclass
+class PreparedResume:
+    """Extracted resume text of a parse request, or its stored result"""
+
+    model: str
+    digest: str
+    result_name: Optional[str]
+    text: str = ""
+    plain_text: str = ""
+    llm_text: str = ""
+    llm_plain_text: str = ""
+    reader: Optional[Dict[str, Any]] = None
+    compaction: Optional[Dict[str, Any]] = None
+    cached: Optional[Dict[str, Any]] = None
+
+
 class ParserService:
     """Service class for handling resume parsing and question generation."""
 
@@ -36,6 +67,17 @@ class ParserService:
             self.resume_analyzer = ResumeAnalyzer()
             self.temp_dir = APP_CONFIG["TEMP_DIR"]
             self.output_type = APP_CONFIG["OUTPUT_TYPE"]
+            self.in_memory = APP_CONFIG["IN_MEMORY_PARSING"]
+            self.workspaces = WorkspaceStore.from_config()
+            self.text_cache = self._open_text_cache()
+            self.compaction = LLM_CONFIG["COMPACTION_ENABLED"]
+            self._compaction_totals = {
+                "texts": 0,
+                "tokens_before": 0,
+                "tokens_after": 0,
+                "truncated": 0,
+            }
+            register_metrics("compaction", self.compaction_metrics)
         except Exception as e:
             logger.error(f"Failed to initialize ParserService: {e}")
             raise HTTPException(
@@ -43,111 +85,456 @@ class ParserService:
                 detail=ERROR_MESSAGES["SERVICE_INIT_ERROR"].format(str(e)),
             )
 
-    async def parse_resume(self, file: UploadFile, model: str) -> JSONResponse:
+    def _open_text_cache(self) -> Optional[TextCache]:
         """
-        Process resume file and extract information.
+        Opens the extracted text cache, None if it is disabled or unusable.
+
+        In-memory parsing is meant for read-only filesystems, so the SQLite
+        cache is not opened then, and a cache that cannot be opened only
+        costs the reuse of extractions.
+        """
+        if not APP_CONFIG["TEXT_CACHE_ENABLED"] or self.in_memory:
+            return None
+        try:
+            return TextCache.from_config()
+        except (sqlite3.Error, OSError) as e:
+            logger.warning(f"Text cache unavailable, extracting without it: {e}")
+            return None
+
+    def _read_text(
+        self, source: Union[str, bytes], filename: str, digest: str, profile: str
+    ) -> Tuple[str, str, Dict[str, Any]]:
+        """
+        Extracts and cleans markdown and plain text from a resume.
+
+        Extractions are looked up in and stored to the text cache by content
+        digest and profile, so a resume is converted only once.
+
+        Args:
+            source (Union[str, bytes]): Path to the stored file or its content
+            filename (str): Name of the uploaded file
+            digest (str): SHA-256 digest of the file content
+            profile (str): Docling pipeline profile
+
+        Returns:
+            Tuple[str, str, Dict[str, Any]]: Cleaned markdown, cleaned plain
+                text and the reader report (route, elapsed and saved time)
+        """
+        if self.text_cache:
+            cached = self.text_cache.get(digest, profile, self.output_type)
+            if cached:
+                logger.info(f"Reusing extracted text for {digest} ({profile})")
+                return (
+                    cached.clean_md,
+                    cached.clean_plain,
+                    {"route": "cache", "source_route": cached.route},
+                )
+
+        if isinstance(source, bytes):
+            result = self.resume_reader.read_resume_bytes(
+                source, self.output_type, filename, profile
+            )
+        else:
+            result = self.resume_reader.read_resume(
+                source, self.output_type, profile
+            )
+        # logger.info(f"\n 1 MD TEXT EXTRACTED FROM RESUME {result.md_text}")
+        # logger.info(f"\n 1 PLAIN TEXT EXTRACTED FROM RESUME {result.plain_text}")
+
+        if self.text_cache and result.clean_md:
+            self.text_cache.put(digest, profile, self.output_type, result)
+        return result.clean_md, result.clean_plain, result.report()
+
+    async def _extract_sections(
+        self, text: str, model: str
+    ) -> Tuple[Dict[str, Any], str]:
+        """
+        Extracts the resume sections and renders them as a sanitized table.
+
+        Args:
+            text (str): Cleaned markdown sent to the LLM
+            model (str): Model to use
+
+        Returns:
+            Tuple[Dict[str, Any], str]: Sections and the sanitized HTML table
+
+        Raises:
+            HTTPException: If no sections or entities could be extracted
+        """
+        # Extract sections and entities
+        try:
+            sections = await self.section_extractor.fetch_sections(text, model)
+            if not sections:
+                raise ValueError(
+                    ERROR_MESSAGES["EMPTY_SECTION_ERROR"].format("No sections found")
+                )
+            logger.info(f"\n2. Section data extracted {sections}")
+
+            html_table = self.entity_extractor.extract_entities(sections)
+            logger.info(f"\n3. HTML extract entites data extracted {html_table}")
+            if not html_table:
+                raise ValueError(ERROR_MESSAGES["ENTITIES_EXTRACTION_ERROR"])
+            elif not isinstance(html_table, str):
+                ValueError(ERROR_MESSAGES["INCORRECT_FORMAT"])
+        except ValueError as e:
+            logger.error(f"Section processing error: {e}")
+            raise HTTPException(
+                status_code=500,
+                detail=ERROR_MESSAGES["SECTION_PROCESSING_ERROR"].format(str(e)),
+            )
+        except Exception as e:
+            logger.error(f"Parsing error: {e}")
+            raise HTTPException(
+                status_code=500, detail=ERROR_MESSAGES["PARSE_ERROR"].format(str(e))
+            )
+
+        # Process and sanitize output
+        try:
+            html_table = sanitize_html_content(html_table)
+            logger.info(f"\n4. SANTIZIED HTML {html_table}")
+        except Exception as e:
+            logger.error(f"Sanitization error {e}")
+            raise HTTPException(
+                status_code=500,
+                detail=ERROR_MESSAGES["SANITIZATION_ERROR"].format(str(e)),
+            )
+        return sections, html_table
+
+    async def _analyze_issues(self, plain_text: str, model: str) -> str:
+        """
+        Runs the missing section and spelling checks.
+
+        Args:
+            plain_text (str): Cleaned plain text sent to the LLM
+            model (str): Model to use
+
+        Returns:
+            str: HTML table of the issues found
+
+        Raises:
+            HTTPException: If the analysis fails
+        """
+        try:
+            issue_checker_output = await self.resume_analyzer.analyze_resume(
+                plain_text, model
+            )
+            logger.info(f"\n5. ISSUE CHECKER OUTPUT {issue_checker_output}")
+            return issue_checker_output
+        except Exception as e:
+            logger.error(f"Spell check output error {e}")
+            raise HTTPException(
+                status_code=500,
+                detail=ERROR_MESSAGES["SANITIZATION_ERROR"].format(str(e)),
+            )
+
+    def _compact(self, text: str, model: str) -> CompactedText:
+        """
+        Compacts resume text to the token budget of the model.
+
+        Args:
+            text (str): Cleaned markdown or plain text
+            model (str): Model the text is sent to
+
+        Returns:
+            CompactedText: Compacted text and token counts
+        """
+        budget = LLM_CONFIG["RESUME_TOKEN_BUDGETS"].get(
+            model, LLM_CONFIG["RESUME_TOKEN_BUDGET"]
+        )
+        compacted = compact_resume_text(text, budget)
+        logger.info(f"Compacted resume text for {model}: {compacted.report()}")
+
+        totals = self._compaction_totals
+        totals["texts"] += 1
+        totals["tokens_before"] += compacted.tokens_before
+        totals["tokens_after"] += compacted.tokens_after
+        totals["truncated"] += compacted.truncated
+        return compacted
+
+    def compaction_metrics(self) -> Dict[str, Any]:
+        """Returns the estimated prompt tokens saved by compaction."""
+        totals = dict(self._compaction_totals)
+        before = totals["tokens_before"]
+        totals["saved_ratio"] = (
+            round(1 - totals["tokens_after"] / before, 3) if before else 0.0
+        )
+        return totals
+
+    def _cached_content(
+        self, cached: Dict[str, Any], model: str, digest: str
+    ) -> Dict[str, Any]:
+        """Registers a workspace for a previously stored result and returns it."""
+        workspace = self.workspaces.create(model, digest)
+        workspace.md_text = cached.get("text", "")
+        workspace.plain_text = cached.get("plain_text", "")
+        workspace.sections = cached.get("sections", {})
+        workspace.result_table = cached.get("result_table", "")
+        workspace.issue_table = cached.get("issue_table", "")
+        workspace.reader = {"route": "cache"}
+
+        return {
+            "result_table": workspace.result_table,
+            "issue_table": workspace.issue_table,
+            "parse_id": workspace.parse_id,
+            "reader": workspace.reader,
+        }
+
+    def get_workspace(self, parse_id: str) -> ParseWorkspace:
+        """
+        Returns the artifacts of an earlier parse.
+
+        Args:
+            parse_id (str): ID returned by parse_resume
+
+        Returns:
+            ParseWorkspace: Stored artifacts of the parse
+
+        Raises:
+            HTTPException: 404 if the parse is unknown or has expired
+        """
+        workspace = self.workspaces.get(parse_id)
+        if workspace is None:
+            raise HTTPException(
+                status_code=404,
+                detail=ERROR_MESSAGES["WORKSPACE_NOT_FOUND"].format(parse_id),
+            )
+        return workspace
+
+    async def _prepare_resume(
+        self, file: UploadFile, model: str, profile: Optional[str]
+    ) -> PreparedResume:
+        """
+        Validates the upload, extracts its text and compacts it for the LLM.
 
         Args:
-            model (str): name of model to use
             file (UploadFile): Resume file to process
+            model (str): name of model to use
+            profile (Optional[str]): Docling pipeline profile, default if None
 
         Returns:
-            JSONResponse: Parsed resume data and issues
+            PreparedResume: Extracted text, or a stored result for the same
+                content and model
 
         Raises:
-            HTTPException: For various processing errors
+            HTTPException: If the file is rejected or cannot be read
         """
+        extensions = APP_CONFIG["SUPPORTED_EXTENSIONS"]
+        if not file.filename.lower().endswith(tuple(extensions)):
+            raise HTTPException(
+                status_code=400,
+                detail=ERROR_MESSAGES["UNSUPPORTED_FORMAT"].format(extensions),
+            )
+
+        # fetch the model name from the mapping
+        model = MODEL_MAP.get(model, "hermes-3-llama-3.1-8b")
+
+        profile = profile or APP_CONFIG["DEFAULT_CONVERTER_PROFILE"]
+        if profile not in APP_CONFIG["CONVERTER_PROFILES"]:
+            raise HTTPException(
+                status_code=400,
+                detail=ERROR_MESSAGES["UNKNOWN_PROFILE"].format(
+                    list(APP_CONFIG["CONVERTER_PROFILES"])
+                ),
+            )
 
+        # Save and read file
         try:
-            if not file.filename.endswith(".pdf"):
-                raise HTTPException(status_code=400, detail=ERROR_MESSAGES["PDF_ONLY"])
+            if self.in_memory:
+                # nothing is written to disk, so the digest store is skipped
+                source, digest = await read_upload_bytes(file)
+                result_name = None
+            else:
+                source, digest = await save_upload_file(file)
 
-            # fetch the model name from the mapping
-            model = MODEL_MAP.get(model, "hermes-3-llama-3.1-8b")
+                # same content already parsed with this model, skip all work
+                result_name = f"result_{model}_{profile}.json"
+                cached_result = load_artifact(digest, result_name)
+                if cached_result:
+                    cached = json.loads(cached_result)
+                    if "text" in cached:
+                        logger.info(f"Serving cached result for {digest} ({model})")
+                        return PreparedResume(model, digest, result_name, cached=cached)
 
-            # Save and read file
-            try:
-                pdf_path = await save_upload_file(file)
-                md_text, plain_text = self.resume_reader.read_resume(
-                    pdf_path, self.output_type
-                )
-                text = md_text
-                # logger.info(f"\n 1 MD TEXT EXTRACTED FROM RESUME {text}")
-                # logger.info(f"\n 1 PLAIN TEXT EXTRACTED FROM RESUME {plain_text}")
-                text, plain_text = clean_text_md(text), clean_text_md(plain_text)
-                logger.info(f"\n 2 MD TEXT EXTRACTED FROM RESUME {text}")
-                logger.info(f"\n 2 PLAIN TEXT EXTRACTED FROM RESUME {plain_text}")
-
-                if not text:
-                    raise ValueError(ERROR_MESSAGES["EMPTY_TEXT"])
-
-                # save the text to a file
-                raw_path = os.path.join(APP_CONFIG["TEMP_DIR"], "raw_text.txt")
-                try:
-                    with open(raw_path, "w", encoding="utf-8") as f:
-                        f.write(text)
-                except Exception as e:
-                    raise IOError(ERROR_MESSAGES["RAW_TEXT_SAVE_ERROR"].format(str(e)))
-            except Exception as e:
-                logger.error(f"File processing error: {e}")
-                raise HTTPException(
-                    status_code=500,
-                    detail=ERROR_MESSAGES["FILE_READ_ERROR"].format(str(e)),
-                )
+            # conversion waits on a Docling worker, keep the event loop free
+            text, plain_text, reader_report = await asyncio.to_thread(
+                self._read_text, source, file.filename, digest, profile
+            )
+            logger.info(f"\n 2 MD TEXT EXTRACTED FROM RESUME {text}")
+            logger.info(f"\n 2 PLAIN TEXT EXTRACTED FROM RESUME {plain_text}")
 
-            # Extract sections and entities
-            try:
-                sections = self.section_extractor.fetch_sections(text, model)
-                if not sections:
-                    raise ValueError(
-                        ERROR_MESSAGES["EMPTY_SECTION_ERROR"].format(
-                            "No sections found"
-                        )
-                    )
-                logger.info(f"\n2. Section data extracted {sections}")
-
-                html_table = self.entity_extractor.extract_entities(sections)
-                logger.info(f"\n3. HTML extract entites data extracted {html_table}")
-                if not html_table:
-                    raise ValueError(ERROR_MESSAGES["ENTITIES_EXTRACTION_ERROR"])
-                elif not isinstance(html_table, str):
-                    ValueError(ERROR_MESSAGES["INCORRECT_FORMAT"])
-            except ValueError as e:
-                logger.error(f"Section processing error: {e}")
+            if not text:
+                raise ValueError(ERROR_MESSAGES["EMPTY_TEXT"])
+        except HTTPException:
+            raise
+        except Exception as e:
+            if isinstance(e, ResumeParsingError) and e.code == UNSUPPORTED_FORMAT_CODE:
                 raise HTTPException(
-                    status_code=500,
-                    detail=ERROR_MESSAGES["SECTION_PROCESSING_ERROR"].format(str(e)),
+                    status_code=400,
+                    detail=ERROR_MESSAGES["UNSUPPORTED_FORMAT"].format(
+                        APP_CONFIG["SUPPORTED_EXTENSIONS"]
+                    ),
                 )
-            except Exception as e:
-                logger.error(f"Parsing error: {e}")
+            if isinstance(e, ResumeParsingError) and e.code in WORKER_ERROR_CODES:
+                # the Docling worker was killed, the server itself is fine
+                logger.error(f"Resume conversion aborted: {e}")
                 raise HTTPException(
-                    status_code=500, detail=ERROR_MESSAGES["PARSE_ERROR"].format(str(e))
+                    status_code=422,
+                    detail=ERROR_MESSAGES["CONVERSION_ABORTED"].format(e.message),
                 )
+            logger.error(f"File processing error: {e}")
+            raise HTTPException(
+                status_code=500,
+                detail=ERROR_MESSAGES["FILE_READ_ERROR"].format(str(e)),
+            )
 
-            # Process and sanitize output
-            try:
-                html_table = sanitize_html_content(html_table)
-                logger.info(f"\n4. SANTIZIED HTML {html_table}")
+        prepared = PreparedResume(
+            model,
+            digest,
+            result_name,
+            text=text,
+            plain_text=plain_text,
+            llm_text=text,
+            llm_plain_text=plain_text,
+            reader=reader_report,
+        )
+        # drop repeated and boilerplate lines before the LLM calls
+        if self.compaction:
+            compacted_md = self._compact(text, model)
+            compacted_plain = self._compact(plain_text, model)
+            prepared.llm_text = compacted_md.text
+            prepared.llm_plain_text = compacted_plain.text
+            prepared.compaction = {
+                "markdown": compacted_md.report(),
+                "plain": compacted_plain.report(),
+            }
+        return prepared
+
+    def _store_result(
+        self,
+        prepared: PreparedResume,
+        sections: Dict[str, Any],
+        html_table: str,
+        issue_checker_output: str,
+    ) -> Dict[str, Any]:
+        """Creates the parse workspace, stores the result and builds the response."""
+        workspace = self.workspaces.create(prepared.model, prepared.digest)
+        workspace.md_text, workspace.plain_text = prepared.text, prepared.plain_text
+        workspace.sections = sections
+        workspace.result_table = html_table
+        workspace.issue_table = issue_checker_output
+        workspace.reader = prepared.reader
+
+        result = {
+            "result_table": html_table,
+            "issue_table": issue_checker_output,
+        }
+        # only complete analyses are reused for later uploads
+        if prepared.result_name and issue_checker_output:
+            save_artifact(
+                prepared.digest,
+                prepared.result_name,
+                json.dumps(
+                    {
+                        **result,
+                        "sections": sections,
+                        "text": prepared.text,
+                        "plain_text": prepared.plain_text,
+                    }
+                ),
+            )
+
+        return {
+            **result,
+            "parse_id": workspace.parse_id,
+            "reader": prepared.reader,
+            "compaction": prepared.compaction,
+        }
+
+    async def parse_resume(
+        self, file: UploadFile, model: str, profile: Optional[str] = None
+    ) -> JSONResponse:
+        """
+        Process resume file and extract information.
+
+        Args:
+            model (str): name of model to use
+            file (UploadFile): Resume file to process
+            profile (Optional[str]): Docling pipeline profile, default if None
+
+        Returns:
+            JSONResponse: Parsed resume data, issues and the parse ID
 
-                issue_checker_output = self.resume_analyzer.analyze_resume(
-                    plain_text, model
+        Raises:
+            HTTPException: For various processing errors
+        """
+
+        try:
+            prepared = await self._prepare_resume(file, model, profile)
+            if prepared.cached:
+                return JSONResponse(
+                    content=self._cached_content(
+                        prepared.cached, prepared.model, prepared.digest
+                    )
                 )
-                logger.info(f"\n5. ISSUE CHECKER OUTPUT {issue_checker_output}")
 
-            except Exception as e:
-                logger.error(f"Spell check output error {e}")
-                raise HTTPException(
-                    status_code=500,
-                    detail=ERROR_MESSAGES["SANITIZATION_ERROR"].format(str(e)),
+            # sections/entities and the issue analysis only share the text,
+            # so both branches run at the same time
+            sections_task = asyncio.create_task(
+                self._extract_sections(prepared.llm_text, prepared.model)
+            )
+            issues_task = asyncio.create_task(
+                self._analyze_issues(prepared.llm_plain_text, prepared.model)
+            )
+            try:
+                (sections, html_table), issue_checker_output = await asyncio.gather(
+                    sections_task, issues_task
                 )
+            except BaseException:
+                # a failed branch makes the other one useless
+                sections_task.cancel()
+                issues_task.cancel()
+                raise
 
             return JSONResponse(
-                content={
-                    "result_table": html_table,
-                    "issue_table": issue_checker_output,
-                }
+                content=self._store_result(
+                    prepared, sections, html_table, issue_checker_output
+                )
+            )
+
+        except HTTPException:
+            raise
+        except Exception as e:
+            logger.error(f"Resume parsing error: {e}")
+            raise HTTPException(
+                status_code=500,
+                detail=ERROR_MESSAGES["UNEXPECTED_ERROR"].format(str(e)),
             )
 
+    async def parse_resume_stream(
+        self, file: UploadFile, model: str, profile: Optional[str] = None
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Process resume file and stream the results as they become available.
+
+        The upload is read before this returns, so file errors are still
+        raised as HTTP errors. The returned events then report the reader,
+        every section with the summary table built so far, the issue table
+        and finally the complete result.
+
+        Args:
+            model (str): name of model to use
+            file (UploadFile): Resume file to process
+            profile (Optional[str]): Docling pipeline profile, default if None
+
+        Returns:
+            AsyncIterator[Dict[str, Any]]: Events with an "event" field of
+                "reader", "section", "issues", "done" or "error"
+
+        Raises:
+            HTTPException: If the file is rejected or cannot be read
+        """
+        try:
+            prepared = await self._prepare_resume(file, model, profile)
         except HTTPException:
             raise
         except Exception as e:
@@ -156,6 +543,74 @@ class ParserService:
                 status_code=500,
                 detail=ERROR_MESSAGES["UNEXPECTED_ERROR"].format(str(e)),
             )
+        return self._stream_events(prepared)
+
+    async def _stream_events(
+        self, prepared: PreparedResume
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """Yields the streaming parse events of a prepared resume."""
+        if prepared.cached:
+            content = self._cached_content(
+                prepared.cached, prepared.model, prepared.digest
+            )
+            yield {"event": "done", **content}
+            return
+
+        yield {
+            "event": "reader",
+            "reader": prepared.reader,
+            "compaction": prepared.compaction,
+        }
+
+        issues_task = asyncio.create_task(
+            self._analyze_issues(prepared.llm_plain_text, prepared.model)
+        )
+        try:
+            sections: Dict[str, Any] = {}
+            async for name, content in self.section_extractor.stream_sections(
+                prepared.llm_text, prepared.model
+            ):
+                sections[name] = content
+                event = {"event": "section", "name": name, "data": content}
+                try:
+                    event["result_table"] = sanitize_html_content(
+                        self.entity_extractor.extract_entities(sections, partial=True)
+                    )
+                except Exception as e:
+                    # the table catches up once later sections arrive
+                    logger.warning(f"Partial summary table failed: {e}")
+                yield event
+
+            # same checks as the buffered path, nothing is stored on failure
+            if not sections:
+                raise ValueError(
+                    ERROR_MESSAGES["EMPTY_SECTION_ERROR"].format("No sections found")
+                )
+            html_table = self.entity_extractor.extract_entities(sections)
+            if not html_table:
+                raise ValueError(ERROR_MESSAGES["ENTITIES_EXTRACTION_ERROR"])
+            html_table = sanitize_html_content(html_table)
+            issue_checker_output = await issues_task
+            yield {"event": "issues", "issue_table": issue_checker_output}
+
+            content = self._store_result(
+                prepared, sections, html_table, issue_checker_output
+            )
+            yield {"event": "done", **content}
+
+        except ValueError as e:
+            logger.error(f"Section processing error: {e}")
+            detail = ERROR_MESSAGES["SECTION_PROCESSING_ERROR"].format(str(e))
+            yield {"event": "error", "detail": detail}
+        except HTTPException as e:
+            logger.error(f"Streaming parse error: {e.detail}")
+            yield {"event": "error", "detail": e.detail}
+        except Exception as e:
+            logger.error(f"Streaming parse error: {e}")
+            detail = ERROR_MESSAGES["PARSE_ERROR"].format(str(e))
+            yield {"event": "error", "detail": detail}
+        finally:
+            issues_task.cancel()
 
     async def generate_questions(self, skills_data: SkillsRequest) -> JSONResponse:
         """
@@ -171,9 +626,13 @@ class ParserService:
             HTTPException: If question generation fails
         """
         try:
-            questions = self.question_generator.process_skills(
+            skills = skills_data.skills
+            if skills_data.parse_id:
+                skills = self._workspace_skills(skills_data.parse_id) or skills
+
+            questions = await self.question_generator.process_skills(
                 skills_data.model,
-                skills_data.skills,
+                skills,
                 skills_data.adhoc_skill,
                 skills_data.num_questions,
                 skills_data.yoe,
@@ -192,3 +651,15 @@ class ParserService:
         except Exception as e:
             logger.error(f"Question generation error: {e}")
             raise HTTPException(status_code=500, detail="Failed to generate questions")
+
+    def _workspace_skills(self, parse_id: str) -> str:
+        """Returns the technical skills stored for a parse, if still available."""
+        workspace = self.workspaces.get(parse_id)
+        if workspace is None:
+            logger.warning(f"Workspace {parse_id} not found, using request skills")
+            return ""
+
+        skills = (workspace.sections.get("Skills") or {}).get("Technical_Skills", "")
+        if isinstance(skills, list):
+            skills = ", ".join(str(skill) for skill in skills if skill)
+        return skills if isinstance(skills, str) else ""
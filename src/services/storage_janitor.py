@@ -0,0 +1,198 @@
+# standard library imports
+import os
+import time
+import shutil
+import asyncio
+import logging
+import threading
+from dataclasses import dataclass
+from typing import Dict, Any, List, Optional
+
+# local imports
+from configs.config import APP_CONFIG
+from utils.file_utils import INCOMING_DIR
+from utils.logging_config import configure_logging
+
+configure_logging()
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class StoredEntry:
+    """A top-level entry of the temp directory, evicted as a unit"""
+
+    path: str
+    size: int
+    file_count: int
+    last_used: float
+
+
+class TempStorageJanitor:
+    """
+    Evicts uploads and derived artifacts from the temp directory.
+
+    Entries unused for longer than ``ttl_seconds`` are removed first. If the
+    directory is still larger than ``max_bytes``, the least recently used
+    entries are removed until it fits. Every entry is measured again right
+    before it is removed, and entries used within ``grace_seconds`` are
+    never evicted, so in-flight parses keep their files.
+    """
+
+    def __init__(
+        self,
+        temp_dir: str,
+        ttl_seconds: float,
+        max_bytes: int,
+        interval_seconds: float,
+        grace_seconds: float = 60,
+    ):
+        self.temp_dir = temp_dir
+        self.ttl_seconds = ttl_seconds
+        self.max_bytes = max_bytes
+        self.interval_seconds = interval_seconds
+        self.grace_seconds = grace_seconds
+        self._lock = threading.Lock()
+        self._counters = {
+            "sweeps": 0,
+            "evicted_files": 0,
+            "evicted_bytes": 0,
+            "evicted_expired": 0,
+            "evicted_quota": 0,
+            "stored_bytes": 0,
+        }
+
+    @classmethod
+    def from_config(cls) -> "TempStorageJanitor":
+        """Create janitor from application settings"""
+        return cls(
+            temp_dir=APP_CONFIG["TEMP_DIR"],
+            ttl_seconds=APP_CONFIG["TEMP_TTL_SECONDS"],
+            max_bytes=APP_CONFIG["TEMP_MAX_BYTES"],
+            interval_seconds=APP_CONFIG["JANITOR_INTERVAL_SECONDS"],
+        )
+
+    def metrics(self) -> Dict[str, Any]:
+        """Returns a snapshot of the eviction counters."""
+        with self._lock:
+            return dict(self._counters)
+
+    async def run(self) -> None:
+        """Sweeps the temp directory every ``interval_seconds`` until cancelled."""
+        logger.info(f"Temp storage janitor started for {self.temp_dir}")
+        while True:
+            try:
+                await asyncio.to_thread(self.sweep)
+            except Exception as e:
+                logger.error(f"Temp storage sweep failed with error {e}")
+            await asyncio.sleep(self.interval_seconds)
+
+    def sweep(self) -> None:
+        """Runs one eviction pass over the temp directory."""
+        if not os.path.isdir(self.temp_dir):
+            return
+
+        now = time.time()
+        entries = self._scan()
+
+        remaining = []
+        for entry in entries:
+            if now - entry.last_used > self.ttl_seconds:
+                if self._evict(entry, "evicted_expired", self.ttl_seconds):
+                    continue
+            remaining.append(entry)
+
+        total_bytes = sum(entry.size for entry in remaining)
+        if total_bytes > self.max_bytes:
+            for entry in sorted(remaining, key=lambda e: e.last_used):
+                if total_bytes <= self.max_bytes:
+                    break
+                if now - entry.last_used < self.grace_seconds:
+                    continue
+                evicted = self._evict(entry, "evicted_quota", self.grace_seconds)
+                if evicted:
+                    total_bytes -= evicted.size
+
+        with self._lock:
+            self._counters["sweeps"] += 1
+            self._counters["stored_bytes"] = total_bytes
+
+    def _scan(self) -> List[StoredEntry]:
+        """Collects the evictable entries with their size and last use."""
+        entries = []
+        for name in os.listdir(self.temp_dir):
+            path = os.path.join(self.temp_dir, name)
+            if name == INCOMING_DIR:
+                # staging files are evicted one by one, active uploads are recent
+                for staged in os.listdir(path):
+                    entry = self._stat_entry(os.path.join(path, staged))
+                    if entry:
+                        entries.append(entry)
+                continue
+            entry = self._stat_entry(path)
+            if entry:
+                entries.append(entry)
+        return entries
+
+    def _stat_entry(self, path: str) -> Optional[StoredEntry]:
+        """Measures a file or directory, or returns None if it vanished."""
+        try:
+            if not os.path.isdir(path):
+                stat = os.stat(path)
+                return StoredEntry(path, stat.st_size, 1, stat.st_mtime)
+
+            size, file_count = 0, 0
+            last_used = os.stat(path).st_mtime
+            for root, _, files in os.walk(path):
+                for filename in files:
+                    stat = os.stat(os.path.join(root, filename))
+                    size += stat.st_size
+                    file_count += 1
+                    last_used = max(last_used, stat.st_mtime)
+            return StoredEntry(path, size, file_count, last_used)
+        except FileNotFoundError:
+            return None
+
+    def _evict(
+        self, entry: StoredEntry, reason: str, min_idle: float
+    ) -> Optional[StoredEntry]:
+        """
+        Removes an entry and updates the counters.
+
+        The scan may be minutes old by now, so the entry is measured again
+        and kept if it was used within ``min_idle`` or ``grace_seconds``.
+
+        Args:
+            entry (StoredEntry): Entry as found by the scan
+            reason (str): Counter of the eviction cause
+            min_idle (float): Seconds the entry must have been unused
+
+        Returns:
+            Optional[StoredEntry]: The removed entry as last measured, None if
+                it was kept or had vanished
+        """
+        current = self._stat_entry(entry.path)
+        if current is None:
+            return None
+        idle = time.time() - current.last_used
+        if idle < max(min_idle, self.grace_seconds):
+            logger.info(f"Keeping {entry.path}, used {idle:.0f}s ago")
+            return None
+        entry = current
+
+        try:
+            if os.path.isdir(entry.path):
+                shutil.rmtree(entry.path)
+            else:
+                os.remove(entry.path)
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            logger.error(f"Evicting {entry.path} failed with error {e}")
+            return None
+
+        logger.info(f"Evicted {entry.path} ({entry.size} bytes, {reason})")
+        with self._lock:
+            self._counters["evicted_files"] += entry.file_count
+            self._counters["evicted_bytes"] += entry.size
+            self._counters[reason] += 1
+        return entry
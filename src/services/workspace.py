@@ -0,0 +1,93 @@
+# standard library imports
+import time
+import uuid
+import logging
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Dict, Any, Optional
+
+# local imports
+from configs.config import APP_CONFIG
+from utils.logging_config import configure_logging
+
+configure_logging()
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class ParseWorkspace:
+    """Artifacts produced by a single resume parse"""
+
+    parse_id: str
+    model: str
+    digest: Optional[str] = None
+    md_text: str = ""
+    plain_text: str = ""
+    sections: Dict[str, Any] = field(default_factory=dict)
+    result_table: str = ""
+    issue_table: str = ""
+    reader: Dict[str, Any] = field(default_factory=dict)
+    created_at: float = field(default_factory=time.monotonic)
+    last_used: float = field(default_factory=time.monotonic)
+
+
+class WorkspaceStore:
+    """
+    In-memory store of parse workspaces addressed by parse ID.
+
+    Entries are evicted least recently used first once ``max_entries`` is
+    reached, and expire ``ttl_seconds`` after they were last used.
+    """
+
+    def __init__(self, max_entries: int, ttl_seconds: float):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._entries: "OrderedDict[str, ParseWorkspace]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_config(cls) -> "WorkspaceStore":
+        """Create store from application settings"""
+        return cls(
+            max_entries=APP_CONFIG["WORKSPACE_MAX_ENTRIES"],
+            ttl_seconds=APP_CONFIG["WORKSPACE_TTL_SECONDS"],
+        )
+
+    def create(self, model: str, digest: Optional[str] = None) -> ParseWorkspace:
+        """Creates and registers a new workspace with a fresh parse ID."""
+        workspace = ParseWorkspace(
+            parse_id=uuid.uuid4().hex, model=model, digest=digest
+        )
+        with self._lock:
+            self._evict_expired()
+            self._entries[workspace.parse_id] = workspace
+            while len(self._entries) > self.max_entries:
+                evicted_id, _ = self._entries.popitem(last=False)
+                logger.debug(f"Evicted workspace {evicted_id} (capacity)")
+        return workspace
+
+    def get(self, parse_id: str) -> Optional[ParseWorkspace]:
+        """Returns the workspace for a parse ID or None if unknown or expired."""
+        with self._lock:
+            self._evict_expired()
+            workspace = self._entries.get(parse_id)
+            if workspace is not None:
+                workspace.last_used = time.monotonic()
+                self._entries.move_to_end(parse_id)
+            return workspace
+
+    def __len__(self) -> int:
+        with self._lock:
+            self._evict_expired()
+            return len(self._entries)
+
+    def _evict_expired(self) -> None:
+        """Drops entries unused for the TTL. Caller must hold the lock."""
+        deadline = time.monotonic() - self.ttl_seconds
+        # entries are kept in order of last use, the oldest come first
+        while self._entries:
+            parse_id, workspace = next(iter(self._entries.items()))
+            if workspace.last_used >= deadline:
+                break
+            del self._entries[parse_id]
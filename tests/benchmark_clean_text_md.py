@@ -0,0 +1,71 @@
+"""
+Times ``clean_text_md`` and ``IncrementalCleaner`` against the baseline cleaner.
+
+Run from the repository root:
+
+    python tests/benchmark_clean_text_md.py [--size-kb 96] [--repeat 7]
+"""
+
+# standard library imports
+import os
+import sys
+import argparse
+import timeit
+from pathlib import Path
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# local imports
+import cleaner_baseline
+from utils.pre_processing import IncrementalCleaner, clean_text_md
+
+FIXTURES = Path(__file__).parent / "fixtures" / "cleaner"
+
+
+def build_document(size_kb: int) -> str:
+    """Repeats the fixture corpus up to about ``size_kb`` kilobytes."""
+    corpus = "\n".join(
+        path.read_text(encoding="utf-8") for path in sorted(FIXTURES.iterdir())
+    )
+    return (corpus * (size_kb * 1024 // len(corpus) + 1))[: size_kb * 1024]
+
+
+def clean_incrementally(text: str, chunk_size: int = 4096) -> str:
+    cleaner = IncrementalCleaner()
+    for start in range(0, len(text), chunk_size):
+        cleaner.feed(text[start : start + chunk_size])
+    return cleaner.result()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--size-kb", type=int, default=96)
+    parser.add_argument("--repeat", type=int, default=7)
+    parser.add_argument("--number", type=int, default=10)
+    args = parser.parse_args()
+
+    text = build_document(args.size_kb)
+    expected = cleaner_baseline.clean_text_md(text)
+    candidates = {
+        "baseline": cleaner_baseline.clean_text_md,
+        "clean_text_md": clean_text_md,
+        "IncrementalCleaner": clean_incrementally,
+    }
+
+    print(f"{len(text) / 1024:.0f} KB, best of {args.repeat} x {args.number} runs")
+    baseline_ms = None
+    for name, clean in candidates.items():
+        if clean(text) != expected:
+            sys.exit(f"{name} output differs from the baseline")
+        best = min(
+            timeit.repeat(
+                lambda: clean(text), repeat=args.repeat, number=args.number
+            )
+        )
+        ms = best / args.number * 1000
+        baseline_ms = baseline_ms or ms
+        print(f"{name:>20}: {ms:7.2f} ms  ({baseline_ms / ms:.2f}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,46 @@
+"""
+Line cleaner of ``clean_text_md`` before the precompiled-pattern rewrite.
+
+Kept verbatim as the reference the current cleaner must match, by the golden
+tests and by ``benchmark_clean_text_md.py``.
+"""
+
+# standard library imports
+import re
+from typing import Optional
+
+
+def clean_md_line(line: str) -> Optional[str]:
+    line = line.strip()
+
+    # Skip separator lines
+    if re.match(r"^[\s_\-=]+$", line):
+        return None
+
+    # Handle headers and content
+    if not line:
+        return ""  # Keep single blank lines
+
+    # Clean multiple spaces
+    line = re.sub(r"\s+", " ", line)
+    # Remove underscore lines even if mixed with other characters
+    if re.match(r"^.*[_]+.*$", line):
+        return None
+    # Clean multiple hyphens except in headers
+    if not line.startswith("#"):
+        line = re.sub(r"-+", "-", line)
+    # Remove unwanted special characters
+    return re.sub(r'[^\w\s.,!?;:\'"\-#@()/]', "", line)
+
+
+def clean_text_md(text: str) -> str:
+    cleaned_lines = []
+    for line in text.splitlines():
+        line = clean_md_line(line)
+        if line is not None:
+            cleaned_lines.append(line)
+
+    text = "\n".join(cleaned_lines)
+    text = re.sub(r"\n{3,}", "\n\n", text)
+
+    return text.strip()
@@ -0,0 +1,6 @@
+# standard library imports
+import os
+import sys
+
+# tests import the application packages from the repository root
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
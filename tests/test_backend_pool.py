@@ -0,0 +1,225 @@
+# standard library imports
+import asyncio
+from typing import Dict, List, Optional, Set
+
+# third party imports
+import httpx
+import pytest
+
+# local imports
+from models import backend_guard
+from models.backend_guard import LLMBackendUnavailable, get_breaker
+from models.backend_pool import Backend, BackendPool
+
+
+def stub_client(models: Dict[str, Optional[List[str]]]) -> httpx.AsyncClient:
+    """
+    HTTP client answering ``/models`` of stub endpoints.
+
+    Args:
+        models (Dict[str, Optional[List[str]]]): Models listed per host,
+            None makes the host's health check fail
+    """
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        listed = models[request.url.host]
+        if listed is None:
+            return httpx.Response(503)
+        return httpx.Response(200, json={"data": [{"id": model} for model in listed]})
+
+    return httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+
+def make_pool(
+    hosts: List[str],
+    models: Optional[Dict[str, Optional[List[str]]]] = None,
+    configured: Optional[Dict[str, List[str]]] = None,
+    sticky_slack: int = 2,
+) -> BackendPool:
+    """Builds a pool over stub endpoints named after their hosts."""
+    client = stub_client(models or {host: ["model-a", "model-b"] for host in hosts})
+    backends = [
+        Backend(
+            base_url=f"http://{host}/v1",
+            api_key="test",
+            http_client=client,
+            models=(configured or {}).get(host),
+        )
+        for host in hosts
+    ]
+    return BackendPool(backends, sticky_slack=sticky_slack)
+
+
+@pytest.fixture(autouse=True)
+def fresh_guards():
+    """Breakers are process-wide, every test starts with closed ones."""
+    backend_guard._breakers.clear()
+    backend_guard._limiters.clear()
+    yield
+    backend_guard._breakers.clear()
+    backend_guard._limiters.clear()
+
+
+def urls(pool: BackendPool) -> List[str]:
+    return [backend.base_url for backend in pool.backends]
+
+
+def test_select_prefers_least_outstanding():
+    pool = make_pool(["one", "two", "three"], sticky_slack=0)
+    one, two, three = pool.backends
+    one.outstanding, two.outstanding, three.outstanding = 3, 1, 2
+
+    assert pool.select("model-a") is two
+
+
+def test_select_sticks_within_slack():
+    pool = make_pool(["one", "two"], sticky_slack=2)
+    one, two = pool.backends
+
+    assert pool.select("model-a") is one
+    one.outstanding = 2
+    assert pool.select("model-a") is one
+    assert pool.metrics()["sticky_hits"] == 1
+
+    one.outstanding = 3
+    assert pool.select("model-a") is two
+    assert pool.metrics()["rebalanced"] == 1
+    assert pool.select("model-a") is two
+
+
+def test_stickiness_is_per_model():
+    pool = make_pool(["one", "two"], sticky_slack=2)
+    one, two = pool.backends
+
+    assert pool.select("model-a") is one
+    one.outstanding = 1
+    assert pool.select("model-b") is two
+    assert pool.metrics()["sticky"] == {
+        "model-a": one.base_url,
+        "model-b": two.base_url,
+    }
+
+
+def test_configured_models_filter_endpoints():
+    pool = make_pool(["one", "two"], configured={"one": ["model-b"]})
+    one, two = pool.backends
+
+    assert pool.select("model-a") is two
+    assert pool.select("model-b") is one
+    assert not one.serves("model-a")
+    assert two.serves("model-c")
+
+
+def test_reported_models_filter_endpoints():
+    pool = make_pool(["one", "two"], models={"one": ["model-a"], "two": ["model-b"]})
+    asyncio.run(pool.check_all())
+    one, two = pool.backends
+
+    assert pool.select("model-a") is one
+    assert pool.select("model-b") is two
+    assert not pool.serves("model-c")
+    with pytest.raises(LLMBackendUnavailable):
+        pool.select("model-c")
+
+
+def test_failed_health_check_fails_over():
+    models: Dict[str, Optional[List[str]]] = {"one": ["model-a"], "two": ["model-a"]}
+    pool = make_pool(["one", "two"], models=models)
+    one, two = pool.backends
+    asyncio.run(pool.check_all())
+    assert pool.select("model-a") is one
+
+    models["one"] = None
+    asyncio.run(pool.check_all())
+    assert not one.healthy
+    assert one.last_error
+    assert pool.select("model-a") is two
+
+    models["one"] = ["model-a"]
+    asyncio.run(pool.check_all())
+    assert one.healthy
+    assert one.last_error is None
+
+
+def test_unreachable_endpoint_is_unhealthy():
+    def handler(request: httpx.Request) -> httpx.Response:
+        raise httpx.ConnectError("connection refused", request=request)
+
+    backend = Backend(
+        base_url="http://down/v1",
+        api_key="test",
+        http_client=httpx.AsyncClient(transport=httpx.MockTransport(handler)),
+    )
+    asyncio.run(backend.check(timeout=1.0))
+
+    assert not backend.healthy
+    assert "connection refused" in backend.last_error
+
+
+def trip(base_url: str) -> None:
+    breaker = get_breaker(base_url)
+    for _ in range(breaker.failure_threshold):
+        breaker.record_failure()
+
+
+def test_open_breaker_excludes_endpoint():
+    pool = make_pool(["one", "two"])
+    one, two = pool.backends
+    trip(one.base_url)
+
+    assert pool._candidates("model-a") == [two]
+    assert pool.select("model-a") is two
+
+    trip(two.base_url)
+    assert not pool.serves("model-a")
+    with pytest.raises(LLMBackendUnavailable):
+        pool.select("model-a")
+
+
+def test_lease_counts_outstanding_and_avoids_tried():
+    pool = make_pool(["one", "two"])
+    one, two = pool.backends
+    tried: Set[str] = set()
+
+    async def nested():
+        async with pool.lease("model-a", tried) as first:
+            assert first.outstanding == 1
+            async with pool.lease("model-a", tried) as second:
+                assert second is not first
+                return first, second
+
+    first, second = asyncio.run(nested())
+    assert tried == set(urls(pool))
+    assert first.outstanding == second.outstanding == 0
+
+
+def test_lease_unpins_on_backend_error():
+    pool = make_pool(["one", "two"])
+    one, two = pool.backends
+
+    async def failing():
+        async with pool.lease("model-a") as backend:
+            assert backend is one
+            raise httpx.ConnectError("connection reset")
+
+    with pytest.raises(httpx.ConnectError):
+        asyncio.run(failing())
+
+    assert "model-a" not in pool.metrics()["sticky"]
+    assert pool.metrics()["failovers"] == 1
+    assert one.outstanding == 0
+
+
+def test_lease_keeps_pin_on_request_error():
+    pool = make_pool(["one", "two"])
+    one, _ = pool.backends
+
+    async def failing():
+        async with pool.lease("model-a"):
+            raise ValueError("bad request")
+
+    with pytest.raises(ValueError):
+        asyncio.run(failing())
+
+    assert pool.metrics()["sticky"] == {"model-a": one.base_url}
+    assert pool.metrics()["failovers"] == 0
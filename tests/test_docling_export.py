@@ -0,0 +1,91 @@
+# standard library imports
+from pathlib import Path
+
+# third party imports
+import pytest
+from docling_core.types.doc import DoclingDocument, DocItemLabel, GroupLabel
+from docling_core.types.doc.document import TableCell, TableData
+
+# local imports
+from src.services.parser.docling_export import export_document
+from utils.pre_processing import clean_text_md
+
+FIXTURES = Path(__file__).parent / "fixtures" / "docling"
+
+
+def build_resume() -> DoclingDocument:
+    """Resume-like document with every item kind the exporter renders."""
+    document = DoclingDocument(name="resume")
+    document.add_text(label=DocItemLabel.PAGE_HEADER, text="Jane Doe - page 1")
+    document.add_title(text="Jane Doe")
+    document.add_text(
+        label=DocItemLabel.TEXT, text="jane_doe@example.com | github.com/jane_doe"
+    )
+    document.add_heading(text="Experience", level=1)
+    document.add_heading(text="Acme Corp -- Lead Engineer", level=2)
+
+    bullets = document.add_group(label=GroupLabel.LIST, name="list")
+    document.add_list_item(text="Built the customer_360 table", parent=bullets)
+    document.add_list_item(text="Led a team of 5", parent=bullets)
+    nested = document.add_group(label=GroupLabel.LIST, name="list", parent=bullets)
+    document.add_list_item(text="Hired 3 engineers", parent=nested)
+    document.add_list_item(text="Cut costs by 37%", parent=bullets)
+
+    document.add_text(label=DocItemLabel.TEXT, text="Stack: Python, SQL, dbt")
+    steps = document.add_group(label=GroupLabel.ORDERED_LIST, name="list")
+    for number, text in enumerate(["Design", "Build", "Run"], start=1):
+        document.add_list_item(
+            text=text, enumerated=True, marker=f"{number}.", parent=steps
+        )
+
+    document.add_heading(text="Skills", level=1)
+    cells = [
+        TableCell(
+            text=text,
+            start_row_offset_idx=row,
+            end_row_offset_idx=row + 1,
+            start_col_offset_idx=col,
+            end_col_offset_idx=col + 1,
+            column_header=row == 0,
+        )
+        for row, line in enumerate([["Skill", "Years"], ["Python", "10"], ["SQL", "8"]])
+        for col, text in enumerate(line)
+    ]
+    document.add_table(data=TableData(table_cells=cells, num_rows=3, num_cols=2))
+    document.add_text(label=DocItemLabel.CODE, text="SELECT * FROM snake_case")
+    document.add_picture()
+    document.add_text(label=DocItemLabel.PAGE_FOOTER, text="1 of 2")
+    document.add_text(label=DocItemLabel.TEXT, text="References on request")
+    return document
+
+
+@pytest.fixture(params=["built", "json"])
+def document(request) -> DoclingDocument:
+    if request.param == "built":
+        return build_resume()
+    return DoclingDocument.load_from_json(FIXTURES / "resume.json")
+
+
+def test_markdown_matches_docling(document):
+    exported = export_document(document)
+
+    assert exported.md_text == document.export_to_markdown()
+    assert exported.clean_md == clean_text_md(exported.md_text)
+
+
+def test_plain_text_matches_docling_without_escaping(document):
+    exported = export_document(document)
+
+    # docling-core's strict text export inherits the markdown escaping
+    expected = document.export_to_text().replace("\\_", "_")
+    assert exported.plain_text == expected
+    assert "\\_" not in exported.plain_text
+    assert "jane_doe@example.com" in exported.plain_text
+    assert exported.clean_plain == clean_text_md(exported.plain_text)
+
+
+def test_markdown_escapes_underscores(document):
+    exported = export_document(document)
+
+    assert "jane\\_doe@example.com" in exported.md_text
+    assert "customer\\_360" in exported.md_text
@@ -0,0 +1,50 @@
+# third party imports
+import pytest
+
+# local imports
+from utils.json_stream import IncrementalJSONParser
+
+ANSWER = '{"Name": "Jane", "Skills": {"tools": ["git", {"note": "a } b"}]}}'
+PREAMBLE = 'Sure, here is the {resume} as JSON, e.g. {"note": 1}:\n```json\n'
+
+
+def parse(text: str, step: int, expected_keys=None):
+    """Feeds text in chunks of ``step`` characters until the object closes."""
+    parser = IncrementalJSONParser(expected_keys)
+    members = []
+    for start in range(0, len(text), step):
+        members.extend(parser.feed(text[start : start + step]))
+        if parser.done:
+            break
+    members.extend(parser.close())
+    return members, parser.done
+
+
+@pytest.mark.parametrize("step", [1, 7, len(ANSWER)])
+def test_members_close_in_order(step):
+    members, done = parse(ANSWER + "\ntrailing text", step)
+    assert done
+    assert members == [
+        ("Name", "Jane"),
+        ("Skills", {"tools": ["git", {"note": "a } b"}]}),
+    ]
+
+
+@pytest.mark.parametrize("step", [1, 7, 200])
+def test_preamble_braces_are_not_the_answer(step):
+    text = PREAMBLE + ANSWER + "\n```\nAnd another {\"x\": 1}"
+    members, done = parse(text, step, expected_keys=["Name", "Skills"])
+    assert done
+    assert [key for key, _ in members] == ["Name", "Skills"]
+
+
+def test_preamble_ends_parse_without_expected_keys():
+    members, done = parse(PREAMBLE + ANSWER, 5)
+    assert done
+    assert ("Name", "Jane") not in members
+
+
+def test_close_repairs_truncated_member():
+    parser = IncrementalJSONParser(["Name"])
+    assert parser.feed('{"Name": "Ja') == []
+    assert parser.close() == [("Name", "Ja")]
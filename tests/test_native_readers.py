@@ -0,0 +1,67 @@
+# standard library imports
+import zipfile
+from io import BytesIO
+
+# local imports
+from src.services.parser.native_readers import read_docx
+
+W = 'xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main"'
+
+
+def paragraph(text: str, style: str = "") -> str:
+    """Paragraph XML, optionally with a paragraph style."""
+    properties = f'<w:pPr><w:pStyle w:val="{style}"/></w:pPr>' if style else ""
+    return f"<w:p>{properties}<w:r><w:t>{text}</w:t></w:r></w:p>"
+
+
+def table(*rows) -> str:
+    """Table XML from rows of cell contents."""
+    return "<w:tbl><w:tblPr/>" + "".join(
+        "<w:tr>" + "".join(f"<w:tc><w:tcPr/>{cell}</w:tc>" for cell in row) + "</w:tr>"
+        for row in rows
+    ) + "</w:tbl>"
+
+
+def docx(body: str) -> bytes:
+    """Minimal DOCX package with the given document body."""
+    buffer = BytesIO()
+    with zipfile.ZipFile(buffer, "w") as package:
+        package.writestr(
+            "word/document.xml", f"<w:document {W}><w:body>{body}</w:body></w:document>"
+        )
+    return buffer.getvalue()
+
+
+def test_layout_table_is_read_cell_by_cell():
+    skills = table([paragraph("Python")], [paragraph("SQL")])
+    layout = table(
+        [
+            paragraph("Skills", "Heading1") + skills,
+            paragraph("Experience", "Heading1")
+            + paragraph("Engineer at Acme")
+            + paragraph("06/2019 - 2021"),
+        ]
+    )
+    markdown, text = read_docx(docx(paragraph("Jane Doe", "Title") + layout))
+
+    assert markdown == (
+        "# Jane Doe\n\n"
+        "## Skills\n\n"
+        "| Python |\n|---|\n| SQL |\n\n"
+        "## Experience\n\n"
+        "Engineer at Acme\n\n"
+        "06/2019 - 2021"
+    )
+    assert text.count("Python") == 1
+    assert "Skills\n\nPython\nSQL\n\nExperience" in text
+
+
+def test_data_table_keeps_its_rows():
+    data = table(
+        [paragraph("Degree"), paragraph("Year")],
+        [paragraph("BSc"), paragraph("2018")],
+    )
+    markdown, text = read_docx(docx(data))
+
+    assert markdown == "| Degree | Year |\n|---|---|\n| BSc | 2018 |"
+    assert text == "Degree\tYear\nBSc\t2018"
@@ -0,0 +1,152 @@
+# standard library imports
+import random
+from pathlib import Path
+from typing import List
+
+# third party imports
+import pytest
+
+# local imports
+import cleaner_baseline
+from utils.pre_processing import (
+    PAGE_BREAK,
+    IncrementalCleaner,
+    clean_md_line,
+    clean_text_md,
+    compact_resume_text,
+)
+
+FIXTURES = Path(__file__).parent / "fixtures" / "cleaner"
+CORPUS = sorted(FIXTURES.iterdir())
+
+# characters the random documents are drawn from: separators, underscores,
+# bullets, kept and dropped punctuation, Unicode whitespace, every line break
+# str.splitlines knows and non-ASCII letters and digits
+ALPHABET = (
+    "ab Z09 _-=#@()/.,!?;:'\"*|<>[]{}~`$%^&+\\"
+    "•·● \t  　​­"
+    "\n\n\n\r\r\n\x0b\x0c\x1c\x1d\x1e\x85  "
+    "éßЖ中١²ﬁＡ🚀©—–"
+)
+
+
+def read_fixture(path: Path) -> str:
+    # newline="" keeps CRLF and lone CR line breaks as they are in the file
+    with open(path, encoding="utf-8", newline="") as file:
+        return file.read()
+
+
+def random_documents(count: int, seed: int = 13) -> List[str]:
+    rng = random.Random(seed)
+    return [
+        "".join(rng.choice(ALPHABET) for _ in range(rng.randint(0, 200)))
+        for _ in range(count)
+    ]
+
+
+def chunked(text: str, rng: random.Random) -> List[str]:
+    """Splits text at random offsets, mostly in the middle of lines."""
+    cuts = sorted(rng.sample(range(len(text) + 1), min(len(text), rng.randint(1, 12))))
+    return [text[start:end] for start, end in zip([0] + cuts, cuts + [len(text)])]
+
+
+@pytest.mark.parametrize("path", CORPUS, ids=lambda path: path.name)
+def test_clean_text_md_matches_baseline_on_fixtures(path):
+    text = read_fixture(path)
+
+    assert clean_text_md(text) == cleaner_baseline.clean_text_md(text)
+
+
+@pytest.mark.parametrize("path", CORPUS, ids=lambda path: path.name)
+def test_clean_md_line_matches_baseline_per_line(path):
+    for line in read_fixture(path).splitlines():
+        assert clean_md_line(line) == cleaner_baseline.clean_md_line(line), line
+
+
+def test_clean_text_md_matches_baseline_on_random_documents():
+    for text in random_documents(2000):
+        assert clean_text_md(text) == cleaner_baseline.clean_text_md(text), text
+
+
+@pytest.mark.parametrize("path", CORPUS, ids=lambda path: path.name)
+def test_incremental_cleaner_matches_baseline_on_fixtures(path):
+    text = read_fixture(path)
+    expected = cleaner_baseline.clean_text_md(text)
+    rng = random.Random(path.name)
+
+    for _ in range(50):
+        cleaner = IncrementalCleaner()
+        for piece in chunked(text, rng):
+            cleaner.feed(piece)
+        assert cleaner.result() == expected
+
+
+def test_incremental_cleaner_splits_crlf_and_mid_line():
+    text = "first line\r\nsecond -- line\r\n\r\n\r\n\r\nthird_line\rlast"
+    expected = cleaner_baseline.clean_text_md(text)
+
+    for cut in range(len(text) + 1):
+        cleaner = IncrementalCleaner()
+        cleaner.feed(text[:cut])
+        cleaner.feed(text[cut:])
+        assert cleaner.result() == expected, cut
+
+    cleaner = IncrementalCleaner()
+    for char in text:
+        cleaner.feed(char)
+    assert cleaner.result() == expected
+
+
+def test_incremental_cleaner_matches_baseline_on_random_documents():
+    rng = random.Random(29)
+    for text in random_documents(500, seed=29):
+        cleaner = IncrementalCleaner()
+        for piece in chunked(text, rng):
+            cleaner.feed(piece)
+        assert cleaner.result() == cleaner_baseline.clean_text_md(text), text
+
+
+def compact(text: str) -> str:
+    """Cleans and compacts text without a binding token budget."""
+    return compact_resume_text(clean_text_md(text), 10_000).text
+
+
+def test_compaction_keeps_dates():
+    text = (
+        "## Experience\n\nEngineer at Acme\n06/2019\n2019 / 2021\n"
+        "Analyst at Initech\n3 / 4\n"
+    )
+    compacted = compact(text)
+    assert "06/2019" in compacted
+    assert "2019 / 2021" in compacted
+    assert "3 / 4" in compacted
+
+
+@pytest.mark.parametrize("line", ["Page 2", "Page 2 of 3", "page 2/3", "2 of 3"])
+def test_compaction_drops_page_numbers(line):
+    compacted = compact_resume_text(f"Jane Doe\n{line}\nEngineer", 10_000)
+    assert compacted.text == "Jane Doe\nEngineer"
+    assert compacted.boilerplate_lines == 1
+
+
+def test_compaction_keeps_repeated_lines_within_pages():
+    jobs = "".join(
+        f"### {title}\nPune, India\nBuilt things\n\n"
+        for title in ("Engineer", "Lead", "Manager")
+    )
+    compacted = compact("## Experience\n\n" + jobs)
+    assert compacted.count("Pune, India") == 3
+    assert compacted.count("Built things") == 3
+
+
+def test_compaction_drops_repeated_page_headers():
+    pages = [
+        f"Jane Doe - CV\n### {title}\nPune, India\nDetails of the {title} role\n"
+        f"Confidential"
+        for title in ("Engineer", "Lead", "Manager")
+    ]
+    compacted = compact(f"\n{PAGE_BREAK}\n".join(pages))
+    assert compacted.count("Jane Doe - CV") == 1
+    assert compacted.count("Confidential") == 1
+    assert compacted.count("Pune, India") == 3
+    assert "page break" not in compacted
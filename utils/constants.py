@@ -201,16 +201,20 @@ SECTIONS = {
 ERROR_MESSAGES = {
     # UI/Interface Errors
     "FILE_NOT_FOUND": "CSS file not found at the specified path",
-    "FILE_UPLOAD_REQUIRED": "Please upload a PDF Resume file to Parse",
+    "FILE_UPLOAD_REQUIRED": "Please upload a Resume file to Parse",
     "MODEL_SELECTION_ERROR": "Please select a valid model",
     "MULTIPLE_FILES": "Application supports single resume parsing only",
     # File Processing Errors
     "PDF_ONLY": "Only PDF files are supported",
+    "UNSUPPORTED_FORMAT": "Unsupported file type, upload one of {}",
     "FILE_READ_ERROR": "Unable to read the resume file: {}",
     "EMPTY_FILE": "The uploaded file is empty",
+    "FILE_TOO_LARGE": "The uploaded file exceeds the maximum size of {} bytes",
+    "UNKNOWN_PROFILE": "Unknown converter profile, choose one of {}",
     # Resume Parsing Errors
     "PARSE_ERROR": "Error occurred while parsing the resume: {}",
     "EMPTY_TEXT": "No text could be extracted from the resume",
+    "CONVERSION_ABORTED": "Resume conversion was stopped: {}",
     # Section Extraction Errors
     "EMPTY_SECTION_ERROR": "Failed to extract sections from resume: {}",
     "SKILLS_NOT_FOUND": "Skills section not found in the resume",
@@ -235,6 +239,7 @@ ERROR_MESSAGES = {
     "UNEXPECTED_ERROR": "An unexpected error occurred: {}",
     "SERVICE_INIT_ERROR": "Failed to initialize Parser service: {}",
     "RAW_TEXT_SAVE_ERROR": "Error while saving resume text to file: {}",
+    "WORKSPACE_NOT_FOUND": "No parse found for id {}, it may have expired",
     "EMPTY_SECTION_ERROR": "Error is extraction section from resume: {}",
     "MODEL_LOAD": "Failed to load SpaCy model: {}",
     "EMPTY_TEXT": "Empty or invalid text provided",
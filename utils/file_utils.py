@@ -1,37 +1,196 @@
 # standard library imports
 import os
+import uuid
+import hashlib
 import logging
+from typing import AsyncIterator, Optional, Tuple, Union
 
 # third party imports
-from fastapi import UploadFile
+import aiofiles
+import aiofiles.os
+from fastapi import UploadFile, HTTPException
 
 # local imports
 from configs.config import APP_CONFIG
+from utils.constants import ERROR_MESSAGES
 from utils.logging_config import configure_logging
 
 configure_logging()
 logger = logging.getLogger(__name__)
 
+# name of the uploaded file inside its digest directory
+UPLOAD_FILENAME = "resume"
 
-async def save_upload_file(file: UploadFile) -> str:
+# staging directory for uploads that are still being received
+INCOMING_DIR = ".incoming"
+
+
+def compute_digest(data: bytes) -> str:
+    """Returns the SHA-256 hex digest used to address uploaded content."""
+    return hashlib.sha256(data).hexdigest()
+
+
+def get_digest_dir(digest: str) -> str:
+    """
+    Returns the store directory for a content digest.
+
+    Args:
+        digest (str): SHA-256 hex digest of the uploaded file
+
+    Returns:
+        str: Directory holding the upload and its derived artifacts
+    """
+    return os.path.join(APP_CONFIG["TEMP_DIR"], digest)
+
+
+def atomic_write(path: str, content: Union[bytes, str]) -> None:
+    """
+    Writes content to path through a temporary file and an atomic rename,
+    so readers never observe a partially written file.
+
+    Args:
+        path (str): Destination path
+        content (Union[bytes, str]): Data to write, text is stored as utf-8
+    """
+    if isinstance(content, str):
+        content = content.encode("utf-8")
+
+    tmp_path = f"{path}.{uuid.uuid4().hex}.tmp"
+    try:
+        with open(tmp_path, "wb") as f:
+            f.write(content)
+        os.replace(tmp_path, path)
+    finally:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+
+
+def touch_digest_dir(digest: str) -> None:
+    """Marks a digest directory as recently used for storage eviction."""
+    try:
+        os.utime(get_digest_dir(digest))
+    except OSError:
+        pass
+
+
+def save_artifact(digest: str, name: str, content: str) -> None:
+    """Stores a derived artifact next to the upload it was produced from."""
+    try:
+        atomic_write(os.path.join(get_digest_dir(digest), name), content)
+    except Exception as e:
+        logger.error(f"Saving artifact {name} for {digest} failed with error {e}")
+
+
+def load_artifact(digest: str, name: str) -> Optional[str]:
+    """Returns a previously stored artifact or None if it does not exist."""
+    path = os.path.join(get_digest_dir(digest), name)
+    if not os.path.exists(path):
+        return None
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            content = f.read()
+        touch_digest_dir(digest)
+        return content
+    except Exception as e:
+        logger.error(f"Loading artifact {name} for {digest} failed with error {e}")
+        return None
+
+
+async def iter_upload_chunks(file: UploadFile) -> AsyncIterator[bytes]:
+    """
+    Yields the upload in chunks of ``UPLOAD_CHUNK_SIZE`` bytes.
+
+    ``UploadLimitMiddleware`` already stops oversized request bodies while
+    they are received, this check holds the file itself to the exact limit.
+
+    Raises:
+        HTTPException: 413 as soon as the upload exceeds ``MAX_UPLOAD_BYTES``
+    """
+    max_bytes = APP_CONFIG["MAX_UPLOAD_BYTES"]
+    chunk_size = APP_CONFIG["UPLOAD_CHUNK_SIZE"]
+
+    total_bytes = 0
+    while chunk := await file.read(chunk_size):
+        total_bytes += len(chunk)
+        if total_bytes > max_bytes:
+            raise HTTPException(
+                status_code=413,
+                detail=ERROR_MESSAGES["FILE_TOO_LARGE"].format(max_bytes),
+            )
+        yield chunk
+
+
+async def read_upload_bytes(file: UploadFile) -> Tuple[bytes, str]:
+    """
+    Reads an upload into memory without touching the filesystem.
+
+    Args:
+        file (UploadFile): Uploaded file
+
+    Returns:
+        Tuple[bytes, str]: File content and its SHA-256 digest
+
+    Raises:
+        HTTPException: 413 if the upload exceeds ``MAX_UPLOAD_BYTES``
+    """
+    buffer = bytearray()
+    async for chunk in iter_upload_chunks(file):
+        buffer.extend(chunk)
+
+    content = bytes(buffer)
+    return content, compute_digest(content)
+
+
+async def save_upload_file(file: UploadFile) -> Tuple[str, str]:
     """
-    Saves uploaded file to temporary directory.
+    Streams uploaded file to the content-addressed temporary store.
+
+    The upload is read in chunks of ``UPLOAD_CHUNK_SIZE`` bytes and written
+    asynchronously to a staging file while its SHA-256 digest is computed.
+    Once complete it is renamed to ``<TEMP_DIR>/<sha256>/resume``. Uploads
+    with the same content share one directory.
 
     Args:
         file (UploadFile): File to be saved
 
     Returns:
-        str: Path where file is saved
+        Tuple[str, str]: Path where file is saved and its SHA-256 digest
 
     Raises:
+        HTTPException: 413 if the upload exceeds ``MAX_UPLOAD_BYTES``
         IOError: If file saving fails
     """
-    os.makedirs(APP_CONFIG["TEMP_DIR"], exist_ok=True)
-    file_path = os.path.join(APP_CONFIG["TEMP_DIR"], file.filename)
+    incoming_dir = os.path.join(APP_CONFIG["TEMP_DIR"], INCOMING_DIR)
+    os.makedirs(incoming_dir, exist_ok=True)
+    staging_path = os.path.join(incoming_dir, f"{uuid.uuid4().hex}.part")
+
+    hasher = hashlib.sha256()
+    total_bytes = 0
     try:
-        with open(file_path, "wb") as f:
-            f.write(await file.read())
+        async with aiofiles.open(staging_path, "wb") as f:
+            async for chunk in iter_upload_chunks(file):
+                total_bytes += len(chunk)
+                hasher.update(chunk)
+                await f.write(chunk)
+
+        digest = hasher.hexdigest()
+        digest_dir = get_digest_dir(digest)
+        file_path = os.path.join(digest_dir, UPLOAD_FILENAME)
+        if await aiofiles.os.path.exists(file_path):
+            logger.info(f"Upload {file.filename} already stored as {digest}")
+            touch_digest_dir(digest)
+            return file_path, digest
+
+        os.makedirs(digest_dir, exist_ok=True)
+        await aiofiles.os.replace(staging_path, file_path)
+        return file_path, digest
+
+    except HTTPException:
+        logger.error(f"Upload {file.filename} rejected after {total_bytes} bytes")
+        raise
     except Exception as e:
         logger.error(f"Saving to temp directory failed with error {e}")
-
-    return file_path
+        raise IOError(f"Failed to save uploaded file: {e}")
+    finally:
+        if await aiofiles.os.path.exists(staging_path):
+            await aiofiles.os.remove(staging_path)
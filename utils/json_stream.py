@@ -0,0 +1,119 @@
+# standard library imports
+import json
+import logging
+from typing import Any, Iterable, List, Optional, Tuple
+
+# third party imports
+from json_repair import repair_json
+
+# local imports
+from utils.logging_config import configure_logging
+
+configure_logging()
+logger = logging.getLogger(__name__)
+
+
+class IncrementalJSONParser:
+    """
+    Parses the top-level members of a JSON object while it is streamed.
+
+    Text before the opening brace (code fences, preambles) is skipped. Each
+    ``feed`` returns the ``(key, value)`` pairs whose value closed within
+    the fed text. ``done`` turns True once the top-level object closes.
+
+    With ``expected_keys`` only members with one of those keys are returned,
+    and an object without any of them, such as braces in a preamble, does
+    not count as the document: parsing resumes at the next opening brace.
+    """
+
+    def __init__(self, expected_keys: Optional[Iterable[str]] = None):
+        self.done = False
+        self.expected_keys = set(expected_keys) if expected_keys else None
+        self._matched = False
+        self._member: List[str] = []
+        self._depth = 0
+        self._started = False
+        self._in_string = False
+        self._escape = False
+
+    def feed(self, chunk: str) -> List[Tuple[str, Any]]:
+        """
+        Consumes the next piece of the LLM output.
+
+        Args:
+            chunk (str): Streamed text
+
+        Returns:
+            List[Tuple[str, Any]]: Members completed by this chunk
+        """
+        members = []
+        for char in chunk:
+            if self.done:
+                break
+            if not self._started:
+                if char == "{":
+                    self._started = True
+                    self._depth = 1
+                continue
+
+            if self._in_string:
+                self._member.append(char)
+                if self._escape:
+                    self._escape = False
+                elif char == "\\":
+                    self._escape = True
+                elif char == '"':
+                    self._in_string = False
+                continue
+
+            if char == '"':
+                self._in_string = True
+            elif char in "{[":
+                self._depth += 1
+            elif char in "}]":
+                self._depth -= 1
+                if self._depth == 0:
+                    members.extend(self._close_member())
+                    if self.expected_keys is None or self._matched:
+                        self.done = True
+                        break
+                    # not the expected object, look for the next one
+                    self._started = False
+                    continue
+            elif char == "," and self._depth == 1:
+                members.extend(self._close_member())
+                continue
+            self._member.append(char)
+        return members
+
+    def close(self) -> List[Tuple[str, Any]]:
+        """Parses a member left open by a truncated stream."""
+        if self.done or not self._started:
+            return []
+        self.done = True
+        return self._close_member(repair=True)
+
+    def _close_member(self, repair: bool = False) -> List[Tuple[str, Any]]:
+        """Parses the buffered ``"key": value`` text as a one-member object."""
+        text = "{" + "".join(self._member).strip() + "}"
+        self._member = []
+        if text == "{}":
+            return []
+
+        try:
+            data = json.loads(repair_json(text) if repair else text)
+        except json.JSONDecodeError:
+            try:
+                data = json.loads(repair_json(text))
+            except json.JSONDecodeError as e:
+                logger.error(f"Skipping unparsable streamed member: {e}")
+                return []
+        if not isinstance(data, dict):
+            return []
+        members = [
+            (key, value)
+            for key, value in data.items()
+            if self.expected_keys is None or key in self.expected_keys
+        ]
+        self._matched = self._matched or bool(members)
+        return members
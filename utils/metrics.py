@@ -0,0 +1,58 @@
+# standard library imports
+import logging
+import threading
+from typing import Any, Callable, Dict, Sequence
+
+# local imports
+from utils.logging_config import configure_logging
+
+configure_logging()
+logger = logging.getLogger(__name__)
+
+# registered metric sources, name -> callable returning a snapshot dict
+_SOURCES: Dict[str, Callable[[], Dict[str, Any]]] = {}
+_LOCK = threading.Lock()
+
+
+def register_metrics(name: str, source: Callable[[], Dict[str, Any]]) -> None:
+    """
+    Registers a component's metrics snapshot under a name.
+
+    Args:
+        name (str): Name the metrics are reported under
+        source (Callable[[], Dict[str, Any]]): Returns the current metrics
+    """
+    with _LOCK:
+        _SOURCES[name] = source
+
+
+def collect_metrics() -> Dict[str, Dict[str, Any]]:
+    """Returns a snapshot of all registered metrics."""
+    with _LOCK:
+        sources = dict(_SOURCES)
+
+    snapshot = {}
+    for name, source in sources.items():
+        try:
+            snapshot[name] = source()
+        except Exception as e:
+            logger.error(f"Collecting metrics for {name} failed with error {e}")
+            snapshot[name] = {"error": str(e)}
+    return snapshot
+
+
+def percentile(sorted_values: Sequence[float], fraction: float) -> float:
+    """
+    Returns the nearest-rank percentile of already sorted values.
+
+    Args:
+        sorted_values (Sequence[float]): Values in ascending order
+        fraction (float): Percentile as a fraction, e.g. 0.95
+
+    Returns:
+        float: The percentile, or 0.0 when there are no values
+    """
+    if not sorted_values:
+        return 0.0
+    index = min(int(len(sorted_values) * fraction), len(sorted_values) - 1)
+    return sorted_values[index]
@@ -1,4 +1,7 @@
 import re
+from collections import Counter
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, List, Optional, Set
 
 
 def clean_text(text):
@@ -116,37 +119,251 @@ def clean_text(text):
 #     return text.strip()
 
 
+# characters kept by the line cleaner besides word characters and whitespace
+_KEPT_PUNCTUATION = ".,!?;:'\"-#@()/"
+_UNWANTED_CHARS = re.compile(r'[^\w\s.,!?;:\'"\-#@()/]+')
+_REPEATED_HYPHENS = re.compile(r"-{2,}")
+_BLANK_LINE_RUNS = re.compile(r"\n{3,}")
+# ASCII fast path of _UNWANTED_CHARS, deletes with str.translate
+_ASCII_UNWANTED = str.maketrans(
+    "",
+    "",
+    "".join(
+        chr(code)
+        for code in range(128)
+        if not (chr(code).isalnum() or chr(code) in " _" + _KEPT_PUNCTUATION)
+    ),
+)
+
+
+def clean_md_line(line: str) -> Optional[str]:
+    """
+    Cleans a single markdown or plain text line.
+
+    Args:
+        line: Input line without its line break
+
+    Returns:
+        Cleaned line, "" for a blank line or None if the line is dropped
+    """
+    # Clean multiple spaces, str.split uses the same whitespace as \s
+    line = " ".join(line.split())
+    if not line:
+        return ""  # Keep single blank lines
+
+    # Remove underscore lines even if mixed with other characters
+    if "_" in line:
+        return None
+    # Skip separator lines
+    if not line.strip(" -="):
+        return None
+
+    # Clean multiple hyphens except in headers
+    if "--" in line and not line.startswith("#"):
+        line = _REPEATED_HYPHENS.sub("-", line)
+    # Remove unwanted special characters
+    if line.isascii():
+        return line.translate(_ASCII_UNWANTED)
+    return _UNWANTED_CHARS.sub("", line)
+
+
+def join_cleaned_lines(cleaned_lines: Iterable[str]) -> str:
+    """Joins cleaned lines, collapsing runs of blank lines."""
+    text = "\n".join(cleaned_lines)
+    text = _BLANK_LINE_RUNS.sub("\n\n", text)
+
+    return text.strip()
+
+
 def clean_text_md(text: str) -> str:
-    lines = text.splitlines()
     cleaned_lines = []
+    for line in text.splitlines():
+        line = clean_md_line(line)
+        if line is not None:
+            cleaned_lines.append(line)
 
-    for line in lines:
-        line = line.strip()
+    return join_cleaned_lines(cleaned_lines)
 
-        # Skip separator lines
-        if re.match(r"^[\s_\-=]+$", line):
-            continue
 
-        # Standardize bullet points to •
-        # if re.match(r'^[-●·\*]\s+|^-\s+[●·]\s+', line):
-        #     line = '• ' + re.sub(r'^[-●·\*]\s+|^-\s+[●·]\s+', '', line).strip()
-
-        # Handle headers and content
-        if line:
-            # Clean multiple spaces
-            line = re.sub(r"\s+", " ", line)
-            # Remove underscore lines even if mixed with other characters
-            if not re.match(r"^.*[_]+.*$", line):
-                # Clean multiple hyphens except in headers
-                if not line.startswith("#"):
-                    line = re.sub(r"-+", "-", line)
-                # Remove unwanted special characters
-                line = re.sub(r'[^\w\s.,!?;:\'"\-#@()/]', "", line)
+class IncrementalCleaner:
+    """
+    Cleans text that arrives in pieces.
+
+    Feeding pieces and calling ``result`` gives the same output as calling
+    ``clean_text_md`` on their concatenation, without building the
+    concatenated string first.
+    """
+
+    def __init__(self):
+        self._pending = ""
+        self._cleaned_lines = []
+
+    def feed(self, piece: str) -> None:
+        """Adds the next piece of text, cleaning every completed line."""
+        if not piece:
+            return
+
+        lines = (self._pending + piece).splitlines(keepends=True)
+        self._pending = ""
+        # keep an unterminated last line, and a lone \r that may precede \n
+        if lines and (lines[-1] == lines[-1].splitlines()[0] or lines[-1][-1] == "\r"):
+            self._pending = lines.pop()
+
+        for line in lines:
+            line = clean_md_line(line.splitlines()[0])
+            if line is not None:
+                self._cleaned_lines.append(line)
+
+    def result(self) -> str:
+        """Returns the cleaned text of everything fed so far."""
+        cleaned_lines = list(self._cleaned_lines)
+        for line in self._pending.splitlines():
+            line = clean_md_line(line)
+            if line is not None:
                 cleaned_lines.append(line)
-        else:
-            cleaned_lines.append("")  # Keep single blank lines
 
-    text = "\n".join(cleaned_lines)
-    text = re.sub(r"\n{3,}", "\n\n", text)
+        return join_cleaned_lines(cleaned_lines)
+
+
+# rough characters per token of the local models' tokenizers on resume text
+CHARS_PER_TOKEN = 4
+# duplicate lines at least this long are dropped, shorter ones (job titles,
+# locations, single skills) only when they repeat at the top or bottom of
+# pages like headers/footers
+MIN_DUPLICATE_CHARS = 20
+MIN_HEADER_REPEATS = 2
+# non-blank lines at the top and bottom of a page that may be headers/footers
+PAGE_EDGE_LINES = 2
+# marks a page break in extracted text, an HTML comment so markdown renders
+# it invisibly; the cleaner keeps it as "!- page break -"
+PAGE_BREAK = "<!-- page break -->"
+_CLEAN_PAGE_BREAK = "!- page break -"
+# lines that carry no resume content, matched on the cleaned text: page
+# numbers in "Page N", "Page N of M", "N of M" or "- N -" form, export
+# placeholders and "references on request". Bare numbers, dates such as
+# "06/2019" or "2019 / 2021" and title lines such as "Resume" may be
+# content, short lines are only dropped as repeated page headers.
+_BOILERPLATE_LINE = re.compile(
+    r"(page\s*\d+(\s*(of|/)\s*\d+)?|\d+\s*of\s*\d+|-\s*\d+\s*-"
+    r"|missing-text|!-\s*image\s*-"
+    r"|references (are )?available (up)?on request\.?)",
+    re.IGNORECASE,
+)
+
+
+def _page_header_keys(lines: List[str]) -> Set[str]:
+    """
+    Finds short lines repeated at the edges of pages.
 
-    return text.strip()
+    A line counts as a page header or footer when it is among the first or
+    last ``PAGE_EDGE_LINES`` non-blank lines of at least
+    ``MIN_HEADER_REPEATS`` pages, pages being split at ``PAGE_BREAK``.
+
+    Args:
+        lines: Cleaned lines of the text
+
+    Returns:
+        Set[str]: Lowercased header and footer lines
+    """
+    pages: List[List[str]] = [[]]
+    for line in lines:
+        key = line.strip().lower()
+        if key == _CLEAN_PAGE_BREAK:
+            pages.append([])
+        elif key and len(key) < MIN_DUPLICATE_CHARS:
+            pages[-1].append(key)
+        elif key:
+            # keep the position of long lines, they are never headers
+            pages[-1].append("")
+
+    pages_seen = Counter()
+    for page in pages:
+        pages_seen.update(
+            set(page[:PAGE_EDGE_LINES] + page[-PAGE_EDGE_LINES:]) - {""}
+        )
+    return {key for key, count in pages_seen.items() if count >= MIN_HEADER_REPEATS}
+
+
+@dataclass
+class CompactedText:
+    """Compacted resume text and what the compaction removed"""
+
+    text: str
+    tokens_before: int
+    tokens_after: int
+    duplicate_lines: int = 0
+    boilerplate_lines: int = 0
+    truncated: bool = False
+
+    def report(self) -> Dict[str, Any]:
+        """Returns the per-request compaction report."""
+        return {
+            "tokens_before": self.tokens_before,
+            "tokens_after": self.tokens_after,
+            "duplicate_lines": self.duplicate_lines,
+            "boilerplate_lines": self.boilerplate_lines,
+            "truncated": self.truncated,
+        }
+
+
+def estimate_tokens(text: str) -> int:
+    """Estimates the prompt tokens of a text without a model tokenizer."""
+    return -(-len(text) // CHARS_PER_TOKEN)
+
+
+def compact_resume_text(text: str, token_budget: int) -> CompactedText:
+    """
+    Shrinks cleaned resume text before it is sent to the LLM.
+
+    Long repeated lines such as duplicated bullets are kept once, and so are
+    short lines repeated at the top or bottom of several pages, the page
+    headers and footers. Content-free lines (page numbers, page breaks,
+    export placeholders, "references on request") are dropped and the result
+    is cut at a line boundary to fit the token budget. Headings are never
+    deduplicated.
+
+    Args:
+        text: Cleaned markdown or plain text
+        token_budget: Maximum estimated tokens of the returned text
+
+    Returns:
+        CompactedText: Compacted text with token counts before and after
+    """
+    lines = text.splitlines()
+    header_keys = _page_header_keys(lines)
+    seen = set()
+    kept = []
+    duplicates, boilerplate = 0, 0
+
+    for line in lines:
+        key = line.strip().lower()
+        if not key:
+            kept.append("")
+            continue
+        if key == _CLEAN_PAGE_BREAK or _BOILERPLATE_LINE.fullmatch(key.lstrip("# ")):
+            boilerplate += 1
+            continue
+        if key in seen and not key.startswith("#"):
+            if len(key) >= MIN_DUPLICATE_CHARS or key in header_keys:
+                duplicates += 1
+                continue
+        seen.add(key)
+        kept.append(line)
+
+    compacted = join_cleaned_lines(kept)
+    truncated = False
+    if estimate_tokens(compacted) > token_budget:
+        # keep whole lines from the top, the most relevant part of a resume
+        cut = compacted.rfind("\n", 0, token_budget * CHARS_PER_TOKEN + 1)
+        compacted = compacted[: cut if cut > 0 else token_budget * CHARS_PER_TOKEN]
+        compacted = compacted.rstrip()
+        truncated = True
+
+    return CompactedText(
+        text=compacted,
+        tokens_before=estimate_tokens(text),
+        tokens_after=estimate_tokens(compacted),
+        duplicate_lines=duplicates,
+        boilerplate_lines=boilerplate,
+        truncated=truncated,
+    )
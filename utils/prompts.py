@@ -218,3 +218,7 @@ PROMPT_TEXT_SPELL_CHECK = """You are a professional resume reviewer specializing
                         """
 
 USER_PROMPT_SPELL_CHECK = """Check the following resume text for spelling errors:"""
+
+# bump to invalidate cached LLM responses when prompt handling changes
+# without a change to the prompt texts above
+PROMPT_REVISION = 1
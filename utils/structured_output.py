@@ -0,0 +1,205 @@
+# standard library imports
+import json
+import logging
+import threading
+from typing import Any, Dict, List, Optional, Tuple
+
+# third party imports
+from json_repair import repair_json
+
+# local imports
+from utils import prompts
+from utils.logging_config import configure_logging
+from utils.metrics import register_metrics
+from utils.pre_processing import estimate_tokens
+from configs.config import LLM_CONFIG
+
+configure_logging()
+logger = logging.getLogger(__name__)
+
+# shape of the spell-check answer described in PROMPT_TEXT_SPELL_CHECK
+SPELL_CHECK_TEMPLATE = {
+    "misspelled_words": [{"incorrect_word": "example", "correct_word": "corrected"}]
+}
+
+# per-task counts of strict parses, repaired parses and failures
+_DECODE_COUNTS: Dict[str, Dict[str, int]] = {}
+_LOCK = threading.Lock()
+
+
+def schema_from_template(template: Any) -> Dict[str, Any]:
+    """
+    Builds a JSON Schema from an example of the expected output.
+
+    Objects require exactly the example's keys, a list takes the shape of its
+    first item and every other value is a string, since the prompts ask for
+    lists and dates as text.
+
+    Args:
+        template (Any): Example output, as parsed JSON
+
+    Returns:
+        Dict[str, Any]: JSON Schema accepting outputs of the same shape
+    """
+    if isinstance(template, dict):
+        return {
+            "type": "object",
+            "properties": {
+                key: schema_from_template(value) for key, value in template.items()
+            },
+            "required": list(template),
+            "additionalProperties": False,
+        }
+    if isinstance(template, list):
+        items = schema_from_template(template[0]) if template else {"type": "string"}
+        return {"type": "array", "items": items}
+    return {"type": "string"}
+
+
+def response_format(name: str, template: Any) -> Dict[str, Any]:
+    """Returns the ``response_format`` of a chat completion constrained to a template."""
+    return {
+        "type": "json_schema",
+        "json_schema": {
+            "name": name,
+            "strict": True,
+            "schema": schema_from_template(template),
+        },
+    }
+
+
+def top_level_keys(response_format: Optional[Dict[str, Any]]) -> Optional[List[str]]:
+    """Returns the keys a JSON schema ``response_format`` requires, None otherwise."""
+    if not response_format or response_format.get("type") != "json_schema":
+        return None
+    return response_format["json_schema"]["schema"].get("required")
+
+
+# MAIN_SECTIONS is a prompt with comments in place of some values, so it is
+# parsed leniently once at import
+SECTIONS_TEMPLATE = json.loads(repair_json(prompts.MAIN_SECTIONS))
+SECTIONS_RESPONSE_FORMAT = response_format("resume_sections", SECTIONS_TEMPLATE)
+SPELL_CHECK_RESPONSE_FORMAT = response_format("spell_check", SPELL_CHECK_TEMPLATE)
+
+
+def _skeleton(template: Any) -> Any:
+    """Returns the template with every string value emptied."""
+    if isinstance(template, dict):
+        return {key: _skeleton(value) for key, value in template.items()}
+    if isinstance(template, list):
+        return [_skeleton(item) for item in template]
+    return ""
+
+
+def output_token_budget(
+    task: str, content: str, template: Any = None, items: int = 0
+) -> Optional[int]:
+    """
+    Computes the ``max_tokens`` of a task from its input and answer shape.
+
+    Args:
+        task (str): Key of ``LLM_CONFIG["OUTPUT_TOKEN_BUDGETS"]``
+        content (str): Input text sent with the prompt
+        template (Any): Example answer whose JSON skeleton is always allowed
+        items (int): Number of requested items, e.g. questions
+
+    Returns:
+        Optional[int]: Token cap, None if the task has no budget
+    """
+    budget = LLM_CONFIG["OUTPUT_TOKEN_BUDGETS"].get(task)
+    if budget is None:
+        return None
+
+    tokens = int(budget.get("per_input_token", 0) * estimate_tokens(content))
+    tokens += budget.get("per_item", 0) * items
+    if template is not None:
+        tokens += estimate_tokens(json.dumps(_skeleton(template)))
+    return min(max(tokens, budget.get("min", 0)), budget["max"])
+
+
+def decode_json_response(text: str, task: str) -> Any:
+    """
+    Parses the JSON answer of an LLM.
+
+    Schema-constrained answers parse with a strict ``json.loads``. Only when
+    that fails are code fences and surrounding text removed and the JSON
+    repaired. Either outcome is counted per task for the metrics.
+
+    Args:
+        text (str): LLM answer
+        task (str): Task name the outcome is counted under
+
+    Returns:
+        Any: Parsed JSON value
+
+    Raises:
+        json.JSONDecodeError: If the answer cannot be parsed even after repair
+    """
+    try:
+        data, repaired = _decode(text)
+    except json.JSONDecodeError:
+        _count(task, "failed")
+        raise
+    if repaired:
+        logger.warning(f"Repaired malformed JSON answer of task {task}")
+    _count(task, "repaired" if repaired else "strict")
+    return data
+
+
+def is_json_object(text: str) -> bool:
+    """
+    Tells whether an answer decodes to a JSON object, without counting it.
+
+    Repair turns almost any text into some JSON value, so only an object,
+    the top-level shape every JSON task asks for, counts as decoded.
+    """
+    try:
+        return isinstance(_decode(text)[0], dict)
+    except json.JSONDecodeError:
+        return False
+
+
+def _decode(text: str) -> Tuple[Any, bool]:
+    """Parses an answer, returning the value and whether it needed repair."""
+    try:
+        return json.loads(text), False
+    except (json.JSONDecodeError, TypeError):
+        pass
+
+    # Remove markdown code blocks if present
+    cleaned_text = (text or "").strip()
+    if cleaned_text.startswith("```"):
+        cleaned_text = cleaned_text.strip("```json").strip("```")
+
+    cleaned_text = repair_json(cleaned_text)
+    # Extract JSON portion if mixed with other text
+    if "{" in cleaned_text and "}" in cleaned_text:
+        start = cleaned_text.find("{")
+        end = cleaned_text.rfind("}") + 1
+        cleaned_text = cleaned_text[start:end]
+
+    return json.loads(cleaned_text), True
+
+
+def _count(task: str, outcome: str) -> None:
+    """Counts a decoding outcome of a task."""
+    with _LOCK:
+        counts = _DECODE_COUNTS.setdefault(
+            task, {"strict": 0, "repaired": 0, "failed": 0}
+        )
+        counts[outcome] += 1
+
+
+def decoding_metrics() -> Dict[str, Any]:
+    """Returns per-task decoding counts and the share that needed repair."""
+    with _LOCK:
+        snapshot = {task: dict(counts) for task, counts in _DECODE_COUNTS.items()}
+
+    for counts in snapshot.values():
+        total = sum(counts.values())
+        fallbacks = counts["repaired"] + counts["failed"]
+        counts["fallback_rate"] = round(fallbacks / total, 3) if total else 0.0
+    return snapshot
+
+
+register_metrics("json_decoding", decoding_metrics)